@@ -0,0 +1,89 @@
+"""
+Compare the vectorized kernels behind RollingSpearman and
+RollingLinearRegression with the per-column scipy loops they replaced.
+
+Usage: python etc/benchmark_statistical_kernels.py [--days N] [--assets M]
+"""
+import argparse
+from timeit import default_timer
+
+import numpy as np
+from scipy.stats import linregress, spearmanr
+
+from zipline.pipeline.factors.statistical import (
+    vectorized_linregress,
+    vectorized_spearman_r,
+)
+
+
+def looped_spearman_r(dependents, independents):
+    independents = np.broadcast_arrays(independents, dependents)[0]
+    out = np.empty(dependents.shape[1])
+    for i in range(len(out)):
+        out[i] = spearmanr(dependents[:, i], independents[:, i])[0]
+    return out
+
+
+def looped_linregress(dependents, independents):
+    independents = np.broadcast_arrays(independents, dependents)[0]
+    out = np.empty((5, dependents.shape[1]))
+    for i in range(out.shape[1]):
+        slope, intercept, r, p, stderr = linregress(
+            y=dependents[:, i],
+            x=independents[:, i],
+        )
+        out[:, i] = intercept, slope, r, p, stderr
+    return out
+
+
+def best_of(f, repeat, *args):
+    times = []
+    for _ in range(repeat):
+        start = default_timer()
+        result = f(*args)
+        times.append(default_timer() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--days', type=int, default=252)
+    parser.add_argument('--assets', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rand = np.random.RandomState(args.seed)
+    independent = rand.randn(args.days, 1)
+    dependents = (
+        rand.uniform(-2, 2, args.assets) * independent +
+        rand.randn(args.days, args.assets)
+    )
+
+    cases = [
+        ('spearman', looped_spearman_r, vectorized_spearman_r),
+        ('linregress',
+         looped_linregress,
+         lambda *a: np.vstack(vectorized_linregress(*a))),
+    ]
+    print('%d days x %d assets, best of %d' % (
+        args.days, args.assets, args.repeat,
+    ))
+    for name, looped, vectorized in cases:
+        looped_time, expected = best_of(
+            looped, args.repeat, dependents, independent,
+        )
+        vectorized_time, result = best_of(
+            vectorized, args.repeat, dependents, independent,
+        )
+        np.testing.assert_allclose(result, expected, rtol=1e-8, atol=1e-12)
+        print('%-12s looped: %8.4fs  vectorized: %8.4fs  speedup: %6.1fx' % (
+            name,
+            looped_time,
+            vectorized_time,
+            looped_time / vectorized_time,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 import os
+from unittest import skipIf
 
 from nose_parameterized import parameterized
+from numpy.testing import assert_almost_equal
 import pandas as pd
 import sqlalchemy as sa
 from toolz import valmap
@@ -14,7 +16,24 @@ from zipline.assets.synthetic import make_simple_equity_info
 from zipline.data.bundles import UnknownBundle, from_bundle_ingest_dirname, \
     ingestions_for_bundle
 from zipline.data.bundles.core import _make_bundle_core, BadClean, \
-    to_bundle_ingest_dirname, asset_db_path
+    to_bundle_ingest_dirname, asset_db_path, minute_equity_path, \
+    shared_daily_bars_name
+from zipline.data.bcolz_daily_bars import BcolzDailyBarReader
+from zipline.data.minute_bars import BcolzMinuteBarWriter
+from zipline.data.mmap_daily_bars import MmapDailyBarReader
+from zipline.data.parquet_bars import (
+    HAVE_PYARROW,
+    ParquetDailyBarReader,
+    ParquetMinuteBarReader,
+)
+from zipline.data.resample import (
+    MinuteResampleSessionBarReader,
+    daily_rollup_path,
+)
+from zipline.data.shared_daily_bars import (
+    SharedMemoryDailyBarReader,
+    is_published,
+)
 from zipline.lib.adjustment import Float64Multiply
 from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
@@ -58,8 +77,14 @@ class BundleCoreTestCase(WithInstanceTmpDir,
          self.unregister,
          self.ingest,
          self.load,
-         self.clean) = _make_bundle_core()
-        self.environ = {'ZIPLINE_ROOT': self.instance_tmpdir.path}
+         self.clean,
+         self.mmap_daily_bars) = _make_bundle_core()
+        self.environ = {
+            'ZIPLINE_ROOT': self.instance_tmpdir.path,
+            # Publish to shared memory in the test's directory, not the
+            # host's.
+            'ZIPLINE_SHM_DIR': self.instance_tmpdir.makedir('shm'),
+        }
 
     def test_register_decorator(self):
         @apply
@@ -265,6 +290,324 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             msg='volume',
         )
 
+    def test_ingest_incremental(self):
+        calendar = get_calendar('XNYS')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        splits = pd.DataFrame.from_records([
+            {
+                'effective_date': str_to_seconds('2014-01-08'),
+                'ratio': 0.5,
+                'sid': 0,
+            },
+            {
+                'effective_date': str_to_seconds('2014-01-09'),
+                'ratio': 0.1,
+                'sid': 1,
+            },
+        ])
+
+        # The last session with data available at each ingest.
+        available = [sessions[2]]
+        start_sessions = []
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            start_sessions.append(start_session)
+            new_sessions = sessions[
+                sessions.slice_indexer(start_session, available[0])
+            ]
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(make_bar_data(
+                equities,
+                calendar.minutes_for_sessions_in_range(
+                    new_sessions[0],
+                    new_sessions[-1],
+                ),
+            ))
+            daily_bar_writer.write(make_bar_data(equities, new_sessions))
+            effective_dates = pd.to_datetime(
+                splits.effective_date, unit='s', utc=True,
+            )
+            adjustment_writer.write(splits=splits[
+                (effective_dates >= new_sessions[0]) &
+                (effective_dates <= new_sessions[-1])
+            ])
+
+        now = pd.Timestamp.utcnow()
+        self.ingest('bundle', self.environ, incremental=True,
+                    timestamp=now - pd.Timedelta(seconds=2))
+        available[0] = sessions[-1]
+        self.ingest('bundle', self.environ, incremental=True,
+                    timestamp=now - pd.Timedelta(seconds=1))
+        assert_equal(start_sessions, [sessions[0], sessions[3]])
+
+        # Nothing is left to ingest.
+        self.ingest('bundle', self.environ, incremental=True, timestamp=now)
+        assert_equal(len(start_sessions), 2)
+
+        ingestions = ingestions_for_bundle('bundle', self.environ)
+        assert_equal(len(ingestions), 2)
+
+        # The previous ingestion is unchanged.
+        previous_minute_writer = BcolzMinuteBarWriter.open(
+            minute_equity_path(
+                'bundle',
+                to_bundle_ingest_dirname(ingestions[1]),
+                environ=self.environ,
+            ),
+        )
+        assert_equal(
+            previous_minute_writer.last_date_in_output_for_sid(0),
+            sessions[2],
+        )
+
+        bundle = self.load('bundle', environ=self.environ)
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            columns,
+            minutes[0],
+            minutes[-1],
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(minutes, sids, equities, colname),
+                msg=colname,
+            )
+
+        actual = bundle.equity_daily_bar_reader.load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(sessions, sids, equities, colname),
+                msg=colname,
+            )
+
+        adjustments = bundle.adjustment_reader.load_pricing_adjustments(
+            ['close'],
+            sessions,
+            pd.Index(sids),
+        )[0]
+        assert_equal(
+            adjustments,
+            {
+                2: [Float64Multiply(
+                    first_row=0,
+                    last_row=2,
+                    first_col=0,
+                    last_col=0,
+                    value=0.5,
+                )],
+                3: [Float64Multiply(
+                    first_row=0,
+                    last_row=3,
+                    first_col=1,
+                    last_col=1,
+                    value=0.1,
+                )],
+            },
+        )
+
+    def test_ingest_incremental_requires_bcolz(self):
+        self.register('bundle', lambda *args: None)
+        with assert_raises(ValueError):
+            self.ingest(
+                'bundle',
+                environ=self.environ,
+                bar_storage='parquet',
+                incremental=True,
+            )
+
+    @skipIf(not HAVE_PYARROW, 'pyarrow is not installed')
+    def test_ingest_parquet(self):
+        calendar = get_calendar('XNYS')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(make_bar_data(equities, minutes))
+            daily_bar_writer.write(make_bar_data(equities, sessions))
+
+        self.ingest('bundle', environ=self.environ, bar_storage='parquet')
+        bundle = self.load('bundle', environ=self.environ)
+
+        assert_is_instance(
+            bundle.equity_daily_bar_reader,
+            ParquetDailyBarReader,
+        )
+        assert_is_instance(
+            bundle.equity_minute_bar_reader,
+            ParquetMinuteBarReader,
+        )
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = bundle.equity_daily_bar_reader.load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(sessions, sids, equities, colname),
+                msg=colname,
+            )
+
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            columns,
+            minutes[0],
+            minutes[-1],
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(minutes, sids, equities, colname),
+                msg=colname,
+            )
+
+    def test_ingest_daily_rollup(self):
+        calendar = get_calendar('XNYS')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            # Only minute bars; the daily bars come from the rollup.
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(make_bar_data(equities, minutes))
+
+        self.ingest('bundle', environ=self.environ, daily_rollup=True)
+        bundle = self.load('bundle', environ=self.environ)
+
+        daily_reader = bundle.equity_daily_bar_reader
+        assert_is_instance(daily_reader, BcolzDailyBarReader)
+        assert_true(os.path.isdir(
+            daily_rollup_path(bundle.equity_minute_bar_reader.rootdir),
+        ))
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = daily_reader.load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        expected = MinuteResampleSessionBarReader(
+            calendar,
+            bundle.equity_minute_bar_reader,
+        ).load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        for actual_column, expected_column, colname in zip(actual,
+                                                           expected,
+                                                           columns):
+            assert_almost_equal(
+                actual_column,
+                expected_column,
+                decimal=3,
+                err_msg=colname,
+            )
+        assert_equal(len(actual[0]), len(sessions))
+
+    def test_ingest_daily_rollup_requires_writers(self):
+        @self.register('bundle', create_writers=False)
+        def bundle_ingest(*args, **kwargs):
+            pass
+
+        with assert_raises(ValueError):
+            self.ingest('bundle', environ=self.environ, daily_rollup=True)
+
+    def test_ingest_invalid_bar_storage(self):
+        self.register('bundle', lambda *args: None)
+        with assert_raises(ValueError):
+            self.ingest('bundle', environ=self.environ, bar_storage='csv')
+
     def test_ingest_assets_versions(self):
         versions = (1, 2)
 
@@ -333,13 +676,118 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             version_table = metadata.tables['version_info']
             check_version_info(eng, version_table, version)
 
-    @parameterized.expand([('clean',), ('load',)])
+    @parameterized.expand([('clean',), ('load',), ('mmap_daily_bars',)])
     def test_bundle_doesnt_exist(self, fnname):
         with assert_raises(UnknownBundle) as e:
             getattr(self, fnname)('ayy', environ=self.environ)
 
         assert_equal(e.exception.name, 'ayy')
 
+    def test_mmap_daily_bars(self):
+        calendar = get_calendar('XNYS')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(make_bar_data(equities, minutes))
+            daily_bar_writer.write(make_bar_data(equities, sessions))
+            adjustment_writer.write()
+
+        self.ingest('bundle', environ=self.environ)
+        assert_is_instance(
+            self.load('bundle', environ=self.environ).equity_daily_bar_reader,
+            BcolzDailyBarReader,
+        )
+
+        self.mmap_daily_bars('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+        reader = bundle.equity_daily_bar_reader
+        assert_is_instance(reader, MmapDailyBarReader)
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = reader.load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(sessions, sids, equities, colname),
+                msg=colname,
+            )
+
+        # A copy in shared memory takes precedence over the one on disk, and
+        # is unlinked when its ingestion is cleaned.
+        ingestion, = os.listdir(
+            pth.data_path(['bundle'], environ=self.environ),
+        )
+        shared_name = shared_daily_bars_name(
+            'bundle', ingestion, environ=self.environ,
+        )
+        shm_dir = self.environ['ZIPLINE_SHM_DIR']
+
+        # The same bundle and ingestion in another root is published under
+        # another name.
+        other_environ = dict(
+            self.environ,
+            ZIPLINE_ROOT=self.instance_tmpdir.getpath('other_root'),
+        )
+        assert_true(
+            shared_daily_bars_name('bundle', ingestion, environ=other_environ)
+            != shared_name
+        )
+
+        self.mmap_daily_bars(
+            'bundle',
+            environ=self.environ,
+            shared_memory=True,
+        )
+        bundle = self.load('bundle', environ=self.environ)
+        reader = bundle.equity_daily_bar_reader
+        assert_is_instance(reader, SharedMemoryDailyBarReader)
+        assert_equal(reader.name, shared_name)
+        assert_true(is_published(shared_name, shm_dir))
+        assert_false(is_published(shared_name))
+        assert_equal(
+            reader.load_raw_arrays(
+                columns,
+                self.START_DATE,
+                self.END_DATE,
+                sids,
+            ),
+            actual,
+        )
+
+        self.clean('bundle', keep_last=0, environ=self.environ)
+        assert_false(is_published(shared_name, shm_dir))
+
     def test_load_no_data(self):
         # register but do not ingest data
         self.register('bundle', lambda *args: None)
@@ -325,3 +325,48 @@ class TestSQLiteAdjustmentsWriter(WithTradingCalendars,
         }).sort_index()
 
         assert_equal(result, expected)
+
+    def test_ratio_table(self):
+        sids = np.arange(5)
+        dates = self.trading_calendar.all_sessions.tz_convert(None)
+
+        def T(n):
+            return dates[n]
+
+        def seconds(n):
+            return T(n).value // 10 ** 9
+
+        splits = pd.DataFrame(
+            [[T(4), 2.0, 2],
+             [T(0), 0.1, 1],
+             [T(1), 2.0, 1],
+             [T(0), 0.1, 2],
+             [T(8), 2.4, 2],
+             [T(2), 0.5, 1]],
+            columns=['effective_date', 'ratio', 'sid'],
+        )
+        self.writer_without_pricing(dates, sids).write(splits=splits)
+
+        with SQLiteAdjustmentReader(self.db_path) as r:
+            table = r.get_ratio_table('splits')
+            self.assertIs(r.get_ratio_table('splits'), table)
+            with self.assertRaises(ValueError):
+                r.get_ratio_table('dividend_payouts')
+
+        query_sids = np.array([2, 1, 3, 2])
+        owners, rows = table.rows_in_range(query_sids, seconds(0), seconds(4))
+        assert_equal(owners, np.array([0, 1, 1, 3]))
+        assert_equal(
+            table.effective_dates[rows],
+            np.array([seconds(4), seconds(1), seconds(2), seconds(4)]),
+        )
+        assert_equal(table.ratios[rows], np.array([2.0, 2.0, 0.5, 2.0]))
+
+        assert_equal(
+            table.products(query_sids, seconds(0), seconds(8)),
+            np.array([2.0 * 2.4, 2.0 * 0.5, 1.0, 2.0 * 2.4]),
+        )
+        assert_equal(
+            table.products(query_sids, seconds(0), seconds(4), invert=True),
+            np.array([0.5, 0.5 * 2.0, 1.0, 0.5]),
+        )
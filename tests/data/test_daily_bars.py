@@ -12,10 +12,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from itertools import cycle, islice
+from itertools import cycle, islice, product
+from multiprocessing.pool import ThreadPool
+import os
 from sys import maxsize
 import re
+from unittest import skipIf
 
+from mock import patch
 from nose_parameterized import parameterized
 import numpy as np
 from numpy import (
@@ -39,18 +43,43 @@ from trading_calendars import get_calendar
 from zipline.data.bar_reader import (
     NoDataAfterDate,
     NoDataBeforeDate,
+    NoDataForSid,
     NoDataOnDate,
 )
-from zipline.data.bcolz_daily_bars import BcolzDailyBarWriter
+from zipline.data.bcolz_daily_bars import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+    US_EQUITY_PRICING_BCOLZ_COLUMNS,
+)
 from zipline.data.hdf5_daily_bars import (
     CLOSE,
     DEFAULT_SCALING_FACTORS,
     HIGH,
     LOW,
+    MultiCountryDailyBarReader,
     OPEN,
     VOLUME,
     coerce_to_uint32,
 )
+from zipline.data.mmap_daily_bars import (
+    MmapDailyBarReader,
+    MmapDailyBarWriter,
+    is_mmap_daily_bar_dir,
+)
+from zipline.data.parquet_bars import (
+    HAVE_PYARROW,
+    ParquetDailyBarReader,
+    ParquetDailyBarWriter,
+    is_parquet_bar_dir,
+)
+from zipline.data.rolling_session_bars import RollingSessionBarReader
+from zipline.data.shared_daily_bars import (
+    SharedMemoryDailyBarReader,
+    is_published,
+    publish_daily_bars,
+    shared_daily_bars_path,
+    unlink_daily_bars,
+)
 from zipline.pipeline.loaders.synthetic import (
     OHLCV,
     asset_start,
@@ -483,6 +512,43 @@ class _DailyBarsTestCase(WithEquityDailyBarData,
                     ).format(asset, date.date())
                 )
 
+    def test_get_values(self):
+        reader = self.daily_bar_reader
+        # Bookend the valid sids with unknown ones.
+        query_assets = (
+            [self.assets[-1] + 1] + self.assets + [self.assets[-1] + 3]
+        )
+        hole_dates = [date for dates in self.holes.values() for date in dates]
+        dates = [
+            self.sessions[0],
+            self.sessions[len(self.sessions) // 2],
+            self.sessions[-1],
+        ] + hole_dates
+
+        for date, field in product(dates, [CLOSE, VOLUME]):
+            expected = []
+            for asset in query_assets:
+                try:
+                    expected.append(reader.get_value(asset, date, field))
+                except (NoDataOnDate, NoDataForSid, KeyError):
+                    expected.append(nan)
+
+            assert_equal(
+                reader.get_values(query_assets, date, field),
+                np.array(expected, dtype=float),
+                msg='date={}; field={}'.format(date.date(), field),
+            )
+
+        # A day outside of the reader's sessions has no data for any sid.
+        assert_equal(
+            reader.get_values(
+                self.assets,
+                Timestamp('2015-06-07', tz='UTC'),
+                CLOSE,
+            ),
+            np.full(len(self.assets), nan),
+        )
+
     def test_get_last_traded_dt(self):
         for sid in self.assets:
             assert_equal(
@@ -647,6 +713,61 @@ class BcolzDailyBarTestCase(WithBcolzEquityDailyBarReader, _DailyBarsTestCase):
             sessions
         )
 
+    def test_append(self):
+        sessions = self.equity_daily_bar_days
+        split = sessions[len(sessions) // 2]
+        data = dict(self.make_equity_daily_bar_data('US', self.assets))
+
+        def write(path, frames, append_to=None):
+            return BcolzDailyBarReader(BcolzDailyBarWriter(
+                self.tmpdir.getpath(path),
+                self.trading_calendar,
+                sessions[0],
+                sessions[-1],
+                append_to=append_to,
+            ).write(frames))
+
+        first = write('first.bcolz', (
+            (sid, df[df.index <= split])
+            for sid, df in iteritems(data)
+            if (df.index <= split).any()
+        ))
+        self.assertLessEqual(first.last_written_session, split)
+
+        reader = write('appended.bcolz', (
+            (sid, df[df.index > split])
+            for sid, df in iteritems(data)
+            if (df.index > split).any()
+        ), append_to=first)
+
+        expected_reader = self.bcolz_equity_daily_bar_reader
+        self.assertEqual(
+            reader.last_written_session,
+            expected_reader.last_written_session,
+        )
+        self.assertEqual(
+            reader.first_trading_day,
+            expected_reader.first_trading_day,
+        )
+        for column in OHLCV:
+            assert_equal(
+                reader.load_raw_arrays(
+                    [column], sessions[0], sessions[-1], self.assets,
+                )[0],
+                expected_reader.load_raw_arrays(
+                    [column], sessions[0], sessions[-1], self.assets,
+                )[0],
+                msg=column,
+            )
+
+        # Appended rows may not overlap the existing rows.
+        sid, df = next(
+            (sid, df) for sid, df in iteritems(data)
+            if (df.index <= split).any()
+        )
+        with self.assertRaises(ValueError):
+            write('overlapping.bcolz', [(sid, df)], append_to=first)
+
 
 class BcolzDailyBarAlwaysReadAllTestCase(BcolzDailyBarTestCase):
     """
@@ -666,6 +787,286 @@ class BcolzDailyBarNeverReadAllTestCase(BcolzDailyBarTestCase):
     BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = maxsize
 
 
+class RollingBcolzDailyBarTestCase(BcolzDailyBarTestCase):
+    """
+    Run the tests defined in BcolzDailyBarTestCase through a
+    RollingSessionBarReader.
+    """
+    @classmethod
+    def init_class_fixtures(cls):
+        super(RollingBcolzDailyBarTestCase, cls).init_class_fixtures()
+
+        cls.daily_bar_reader = RollingSessionBarReader(
+            cls.bcolz_equity_daily_bar_reader,
+        )
+
+    @parameterized.expand([(1,), (5,), (12,)])
+    def test_rolling_windows(self, window_length):
+        raw_reader = self.bcolz_equity_daily_bar_reader
+        reader = RollingSessionBarReader(raw_reader)
+        sessions = self.sessions
+        assets = array(self.assets)
+
+        for i in range(len(sessions) - window_length + 1):
+            start = sessions[i]
+            end = sessions[i + window_length - 1]
+
+            # Drop an asset every few days so that we exercise the path for
+            # assets which weren't part of the previous request.
+            query_assets = assets[i % 3:]
+
+            results = reader.load_raw_arrays(OHLCV, start, end, query_assets)
+            expected = raw_reader.load_raw_arrays(
+                OHLCV, start, end, query_assets,
+            )
+            for result, expected_result in zip(results, expected):
+                assert_equal(result, expected_result)
+
+                # Results must be safe to mutate.
+                result[:] = 0
+
+    def test_interleaved_windows(self):
+        # A pipeline loads each group of columns with its own number of extra
+        # rows. Each group should keep rolling its own block forward rather
+        # than evicting the other group's.
+        raw_reader = self.bcolz_equity_daily_bar_reader
+        reader = RollingSessionBarReader(raw_reader)
+        sessions = self.sessions
+        assets = array(self.assets)
+        groups = [(OHLCV, 3), (('close', 'volume'), 8)]
+
+        with patch.object(raw_reader,
+                          'load_raw_arrays',
+                          wraps=raw_reader.load_raw_arrays) as load:
+            for i in range(len(sessions) - 8):
+                for columns, window_length in groups:
+                    start = sessions[i + 8 - window_length]
+                    end = sessions[i + 7]
+
+                    load.reset_mock()
+                    results = reader.load_raw_arrays(
+                        columns, start, end, assets,
+                    )
+                    if i > 0:
+                        # Only the newest session is read.
+                        load.assert_called_once_with(
+                            list(columns), end, end, assets,
+                        )
+
+                    expected = raw_reader.load_raw_arrays(
+                        columns, start, end, assets,
+                    )
+                    for result, expected_result in zip(results, expected):
+                        assert_equal(result, expected_result)
+
+    def test_concurrent_reads(self):
+        raw_reader = self.bcolz_equity_daily_bar_reader
+        reader = RollingSessionBarReader(raw_reader)
+        sessions = self.sessions
+        assets = array(self.assets)
+
+        def load(i):
+            return reader.load_raw_arrays(
+                OHLCV, sessions[i], sessions[i + 4], assets,
+            )
+
+        pool = ThreadPool(4)
+        try:
+            all_results = pool.map(load, range(len(sessions) - 4))
+        finally:
+            pool.terminate()
+
+        for i, results in enumerate(all_results):
+            expected = raw_reader.load_raw_arrays(
+                OHLCV, sessions[i], sessions[i + 4], assets,
+            )
+            for result, expected_result in zip(results, expected):
+                assert_equal(result, expected_result)
+
+
+class MmapDailyBarTestCase(BcolzDailyBarTestCase):
+    """
+    Run the tests defined in BcolzDailyBarTestCase against a memory-mapped
+    copy of the bcolz table.
+    """
+    @classmethod
+    def init_class_fixtures(cls):
+        super(MmapDailyBarTestCase, cls).init_class_fixtures()
+
+        writer = MmapDailyBarWriter(cls.tmpdir.getpath('daily_equities.mmap'))
+        cls.daily_bar_reader = writer.write_from_bcolz(
+            cls.bcolz_daily_bar_ctable,
+        )
+
+    def test_reader_type(self):
+        self.assertIsInstance(self.daily_bar_reader, MmapDailyBarReader)
+        self.assertTrue(is_mmap_daily_bar_dir(
+            self.tmpdir.getpath('daily_equities.mmap'),
+        ))
+
+    def test_columns_match_bcolz(self):
+        table = self.daily_bar_reader._table
+        for column in US_EQUITY_PRICING_BCOLZ_COLUMNS:
+            assert_equal(table[column], self.bcolz_daily_bar_ctable[column][:])
+
+    def test_raw_arrays_are_copies(self):
+        raw_column = self.daily_bar_reader._table['close']
+        before = raw_column.copy()
+        for result in self.daily_bar_reader.load_raw_arrays(
+                OHLCV,
+                self.sessions[0],
+                self.sessions[-1],
+                array(self.assets)):
+            result[:] = 0
+        assert_equal(raw_column, before)
+
+
+@skipIf(not HAVE_PYARROW, 'pyarrow is not installed')
+class ParquetDailyBarTestCase(BcolzDailyBarTestCase):
+    """
+    Run the tests defined in BcolzDailyBarTestCase against the same bars
+    written to Parquet files.
+    """
+    # Spread the assets over several files.
+    PARQUET_SIDS_PER_FILE = 4
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(ParquetDailyBarTestCase, cls).init_class_fixtures()
+
+        cls.parquet_path = cls.tmpdir.getpath('daily_equities.parquet')
+        writer = ParquetDailyBarWriter(
+            cls.parquet_path,
+            cls.trading_calendar,
+            cls.equity_daily_bar_days[0],
+            cls.equity_daily_bar_days[-1],
+            sids_per_file=cls.PARQUET_SIDS_PER_FILE,
+        )
+        cls.daily_bar_reader = writer.write(
+            cls.make_equity_daily_bar_data(
+                country_code='US',
+                sids=cls.asset_finder.equities_sids_for_country_code('US'),
+            ),
+        )
+
+    def test_reader_type(self):
+        self.assertIsInstance(self.daily_bar_reader, ParquetDailyBarReader)
+        self.assertTrue(is_parquet_bar_dir(self.parquet_path))
+        self.assertEqual(
+            sorted(os.listdir(self.parquet_path)),
+            ['metadata.json', 'part-00000.parquet', 'part-00001.parquet'],
+        )
+
+    def test_matches_bcolz(self):
+        bcolz_reader = self.bcolz_equity_daily_bar_reader
+        assets = array(self.assets)
+        assert_equal(
+            self.daily_bar_reader.load_raw_arrays(
+                OHLCV,
+                self.sessions[0],
+                self.sessions[-1],
+                assets,
+            ),
+            bcolz_reader.load_raw_arrays(
+                OHLCV,
+                self.sessions[0],
+                self.sessions[-1],
+                assets,
+            ),
+        )
+        for sid in assets:
+            assert_equal(
+                self.daily_bar_reader.get_last_traded_dt(
+                    self.asset_finder.retrieve_asset(sid),
+                    self.sessions[-1],
+                ),
+                bcolz_reader.get_last_traded_dt(
+                    self.asset_finder.retrieve_asset(sid),
+                    self.sessions[-1],
+                ),
+            )
+
+    def test_rewrite_replaces_parts(self):
+        path = self.tmpdir.getpath('rewritten.parquet')
+        writer = ParquetDailyBarWriter(
+            path,
+            self.trading_calendar,
+            self.equity_daily_bar_days[0],
+            self.equity_daily_bar_days[-1],
+            sids_per_file=1,
+        )
+        sids = self.assets
+        writer.write(self.make_equity_daily_bar_data('US', sids))
+        reader = writer.write(self.make_equity_daily_bar_data('US', sids[:1]))
+
+        self.assertEqual(len(os.listdir(path)), 2)
+        with self.assertRaises(NoDataForSid):
+            reader.get_value(sids[1], self.sessions[-1], 'close')
+
+
+class SharedMemoryDailyBarTestCase(BcolzDailyBarTestCase):
+    """
+    Run the tests defined in BcolzDailyBarTestCase against a copy of the
+    bcolz table published to (a stand-in for) shared memory.
+    """
+    @classmethod
+    def init_class_fixtures(cls):
+        super(SharedMemoryDailyBarTestCase, cls).init_class_fixtures()
+
+        cls.shm_dir = cls.tmpdir.makedir('shm')
+        cls.daily_bar_reader = publish_daily_bars(
+            'test',
+            cls.bcolz_daily_bar_ctable,
+            shm_dir=cls.shm_dir,
+        )
+
+    def test_attach(self):
+        reader = SharedMemoryDailyBarReader('test', shm_dir=self.shm_dir)
+        self.assertEqual(reader.name, 'test')
+        assert_equal(
+            reader.load_raw_arrays(
+                OHLCV,
+                self.sessions[0],
+                self.sessions[-1],
+                array(self.assets),
+            ),
+            self.daily_bar_reader.load_raw_arrays(
+                OHLCV,
+                self.sessions[0],
+                self.sessions[-1],
+                array(self.assets),
+            ),
+        )
+
+    def test_attach_unpublished(self):
+        self.assertFalse(is_published('not-published', shm_dir=self.shm_dir))
+        with self.assertRaises(ValueError):
+            SharedMemoryDailyBarReader('not-published', shm_dir=self.shm_dir)
+
+    def test_republish_and_unlink(self):
+        shm_dir = self.shm_dir
+        for _ in range(2):
+            publish_daily_bars(
+                'republished',
+                self.bcolz_daily_bar_ctable,
+                shm_dir=shm_dir,
+            )
+            self.assertTrue(is_published('republished', shm_dir=shm_dir))
+
+        # Only the published copy is left behind, no temporary directories.
+        self.assertEqual(
+            sorted(os.listdir(shm_dir)),
+            [
+                os.path.basename(shared_daily_bars_path('republished')),
+                os.path.basename(shared_daily_bars_path('test')),
+            ],
+        )
+
+        self.assertTrue(unlink_daily_bars('republished', shm_dir=shm_dir))
+        self.assertFalse(is_published('republished', shm_dir=shm_dir))
+        self.assertFalse(unlink_daily_bars('republished', shm_dir=shm_dir))
+
+
 class BcolzDailyBarWriterMissingDataTestCase(WithAssetFinder,
                                              WithTmpDir,
                                              WithTradingCalendars,
@@ -774,6 +1175,69 @@ class _HDF5DailyBarTestCase(WithHDF5EquityMultiCountryDailyBarReader,
                     'close',
                 )
 
+    def test_chunk_cache_and_pool(self):
+        h5_file = self.single_country_reader._country_group.file
+        pool = ThreadPool(4)
+        try:
+            reader = MultiCountryDailyBarReader.from_file(
+                h5_file,
+                pool=pool,
+                chunk_cache_bytes=2 ** 20,
+            )
+            for assets in (self.assets,
+                           # Gaps between the sids are read as several runs.
+                           self.assets[::2],
+                           self.assets[::-1] + [-1]):
+                assert_equal(
+                    reader.load_raw_arrays(
+                        OHLCV,
+                        TEST_QUERY_START,
+                        TEST_QUERY_STOP,
+                        assets,
+                    ),
+                    self.daily_bar_reader.load_raw_arrays(
+                        OHLCV,
+                        TEST_QUERY_START,
+                        TEST_QUERY_STOP,
+                        assets,
+                    ),
+                    msg=str(assets),
+                )
+        finally:
+            pool.close()
+            pool.join()
+
+    def test_multi_country_read(self):
+        us_sids = list(self.asset_finder.equities_sids_for_country_code('US'))
+        ca_sids = list(self.asset_finder.equities_sids_for_country_code('CA'))
+        # Interleave the countries, with an unknown sid at the end.
+        assets = [sid for pair in zip(us_sids, ca_sids) for sid in pair]
+        assets.append(-1)
+
+        results = self.daily_bar_reader.load_raw_arrays(
+            OHLCV,
+            TEST_QUERY_START,
+            TEST_QUERY_STOP,
+            assets,
+        )
+
+        for sids in us_sids, ca_sids:
+            expected = self.daily_bar_reader.load_raw_arrays(
+                OHLCV,
+                TEST_QUERY_START,
+                TEST_QUERY_STOP,
+                sids,
+            )
+            positions = [assets.index(sid) for sid in sids]
+            for result, expected_result in zip(results, expected):
+                assert_equal(result[:, positions], expected_result)
+
+        for column, result in zip(OHLCV, results):
+            if column == 'volume':
+                assert_equal(result[:, -1], np.zeros(len(result), 'uint32'))
+            else:
+                self.assertTrue(np.isnan(result[:, -1]).all())
+
 
 class HDF5DailyBarUSTestCase(_HDF5DailyBarTestCase):
     DAILY_BARS_TEST_QUERY_COUNTRY_CODE = 'US'
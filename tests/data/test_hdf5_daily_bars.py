@@ -73,3 +73,42 @@ class H5WriterTestCase(zp_fixtures.WithTmpDir,
                 '2014-01-07',
             ], utc=True)
         )
+
+    def test_multi_country_different_sessions(self):
+        path = self.tmpdir.getpath('multi.h5')
+        writer = HDF5DailyBarWriter(path, date_chunk_size=30)
+
+        # Both countries have three sessions between 2014-01-02 and
+        # 2014-01-06, but not the same ones.
+        US = pd.DataFrame(
+            data=np.ones((3, 2)),
+            index=pd.to_datetime(['2014-01-02', '2014-01-03', '2014-01-06']),
+            columns=[1, 2],
+        )
+        CA = pd.DataFrame(
+            data=np.ones((3, 2)),
+            index=pd.to_datetime(['2014-01-02', '2014-01-04', '2014-01-06']),
+            columns=[100, 101],
+        )
+
+        for country_code, frame in (('US', US), ('CA', CA)):
+            writer.write(
+                country_code,
+                {field: frame for field in ('open',
+                                            'high',
+                                            'low',
+                                            'close',
+                                            'volume')},
+            )
+
+        reader = MultiCountryDailyBarReader.from_path(path)
+        start = pd.Timestamp('2014-01-02', tz='UTC')
+        end = pd.Timestamp('2014-01-06', tz='UTC')
+
+        # Reads from a single country are fine.
+        for sids in [1, 2], [100, 101]:
+            result, = reader.load_raw_arrays(['close'], start, end, sids)
+            assert_equal(result, np.ones((3, 2)))
+
+        with self.assertRaisesRegex(ValueError, 'different sessions'):
+            reader.load_raw_arrays(['close'], start, end, [1, 100])
@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from datetime import timedelta
+from multiprocessing.pool import ThreadPool
 import os
+from unittest import skipIf
 
 from numpy import (
     arange,
@@ -46,6 +48,12 @@ from zipline.data.minute_bars import (
     H5MinuteBarUpdateWriter,
     H5MinuteBarUpdateReader,
 )
+from zipline.data.parquet_bars import (
+    HAVE_PYARROW,
+    ParquetMinuteBarReader,
+    ParquetMinuteBarWriter,
+    ParquetMinuteOverlappingData,
+)
 
 from zipline.testing.fixtures import (
     WithAssetFinder,
@@ -601,6 +609,55 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
 
         self.assertEquals(200.0, volume_price)
 
+    def test_get_values(self):
+        minute_0 = self.market_opens[TEST_CALENDAR_START]
+        minute_1 = minute_0 + timedelta(minutes=1)
+        data_1 = DataFrame(
+            data={
+                'open': [15.0, nan],
+                'high': [17.0, nan],
+                'low': [11.0, nan],
+                'close': [15.0, nan],
+                'volume': [100.0, 0.0],
+            },
+            index=[minute_0, minute_1])
+        self.writer.write_sid(1, data_1)
+
+        data_2 = DataFrame(
+            data={
+                'open': [25.0, 26.0],
+                'high': [27.0, 28.0],
+                'low': [21.0, 22.0],
+                'close': [25.0, 26.0],
+                'volume': [200.0, 300.0],
+            },
+            index=[minute_0, minute_1])
+        self.writer.write_sid(2, data_2)
+
+        # Sid 3 has no minute data.
+        sids = [1, 2, 3]
+        for minute, (expected_close, expected_volume) in [
+                (minute_0, ([15.0, 25.0, nan], [100.0, 200.0, nan])),
+                (minute_1, ([nan, 26.0, nan], [0.0, 300.0, nan]))]:
+            assert_array_equal(
+                self.reader.get_values(sids, minute, 'close'),
+                array(expected_close),
+            )
+            assert_array_equal(
+                self.reader.get_values(sids, minute, 'volume'),
+                array(expected_volume),
+            )
+
+        # A minute outside of the market has no data for any sid.
+        assert_array_equal(
+            self.reader.get_values(
+                sids,
+                minute_0 - timedelta(minutes=1),
+                'close',
+            ),
+            full(3, nan),
+        )
+
     def test_pad_data(self):
         """
         Test writing empty data.
@@ -914,6 +971,125 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
                 assert_almost_equal(data[sid].loc[minutes, col],
                                     arrays[i][j][minute_locs])
 
+    def test_load_raw_arrays_in_pool(self):
+        """
+        Test that reading blocks of assets in a thread pool gives the same
+        windows as reading them serially, including over an early close.
+        """
+        xmas_eve = Timestamp('2015-12-24', tz='UTC')
+        start = self.market_opens[xmas_eve] + Timedelta('150 min')
+        end = self.market_opens[Timestamp('2015-12-28', tz='UTC')] + \
+            Timedelta('30 min')
+        minutes = self.trading_calendar.minutes_in_range(start, end)
+
+        sids = list(range(1, 8))
+        for sid in sids:
+            n = len(minutes) - sid
+            self.writer.write_sid(sid, DataFrame(
+                data={
+                    'open': arange(n, dtype=float64) + sid,
+                    'high': arange(n, dtype=float64) + sid + 1,
+                    'low': arange(n, dtype=float64) + sid - 0.5,
+                    'close': arange(n, dtype=float64) + sid,
+                    'volume': arange(n, dtype=float64) * (sid % 3),
+                },
+                index=minutes[:n],
+            ))
+
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        expected = BcolzMinuteBarReader(self.dest).load_raw_arrays(
+            columns, start, end, sids,
+        )
+
+        pool = ThreadPool(3)
+        try:
+            reader = BcolzMinuteBarReader(self.dest, pool=pool, block_size=2)
+            result = reader.load_raw_arrays(columns, start, end, sids)
+        finally:
+            pool.close()
+            pool.join()
+
+        self.assertEqual(expected[0].shape, (len(minutes), len(sids)))
+        for column, expected_array, result_array in zip(columns,
+                                                        expected,
+                                                        result):
+            self.assertEqual(expected_array.dtype, result_array.dtype)
+            assert_array_equal(expected_array, result_array, err_msg=column)
+
+    def test_cache_stats(self):
+        minutes = self.trading_calendar.minutes_for_session(
+            self.test_calendar_start,
+        )[:10]
+        for sid in 1, 2:
+            self.writer.write_sid(sid, DataFrame(
+                data={
+                    'open': arange(10, dtype=float64) + sid,
+                    'high': arange(10, dtype=float64) + sid,
+                    'low': arange(10, dtype=float64) + sid,
+                    'close': arange(10, dtype=float64) + sid,
+                    'volume': arange(10, dtype=float64) + 1,
+                },
+                index=minutes,
+            ))
+
+        reader = BcolzMinuteBarReader(self.dest)
+        for minute in minutes:
+            reader.get_value(1, minute, 'close')
+
+        stats = reader.cache_stats()
+        self.assertEqual(stats['carrays'].misses, 1)
+        self.assertEqual(stats['carrays'].hits, len(minutes) - 1)
+        self.assertEqual(stats['carrays'].entries, 1)
+        self.assertEqual(stats['chunks'].misses, 1)
+        self.assertEqual(stats['chunks'].hits, len(minutes) - 1)
+
+        # Reading a window covered by the cached chunk doesn't decompress it
+        # again.
+        close, = reader.load_raw_arrays(
+            ['close'], minutes[0], minutes[-1], [1],
+        )
+        assert_almost_equal(close[:, 0], arange(10, dtype=float64) + 1)
+        self.assertEqual(reader.cache_stats()['chunks'].misses, 1)
+
+    def test_cache_byte_budget(self):
+        minutes = self.trading_calendar.minutes_for_session(
+            self.test_calendar_start,
+        )[:10]
+        for sid in 1, 2:
+            self.writer.write_sid(sid, DataFrame(
+                data={
+                    'open': arange(10, dtype=float64) + sid,
+                    'high': arange(10, dtype=float64) + sid,
+                    'low': arange(10, dtype=float64) + sid,
+                    'close': arange(10, dtype=float64) + sid,
+                    'volume': arange(10, dtype=float64) + 1,
+                },
+                index=minutes,
+            ))
+
+        carray = BcolzMinuteBarReader(self.dest)._open_minute_file('close', 1)
+        carray_nbytes = 2 * carray.chunklen * carray.dtype.itemsize
+
+        # Room for one open carray and no decompressed chunks.
+        reader = BcolzMinuteBarReader(
+            self.dest,
+            carray_cache_bytes=carray_nbytes,
+            chunk_cache_bytes=0,
+        )
+        for sid in 1, 2, 1:
+            self.assertAlmostEqual(
+                reader.get_value(sid, minutes[3], 'close'),
+                3.0 + sid,
+            )
+
+        stats = reader.cache_stats()
+        self.assertEqual(stats['carrays'].misses, 3)
+        self.assertEqual(stats['carrays'].evictions, 2)
+        self.assertEqual(stats['carrays'].entries, 1)
+        self.assertEqual(stats['carrays'].size, carray_nbytes)
+        self.assertEqual(stats['carrays'].capacity, carray_nbytes)
+        self.assertEqual(stats['chunks'].entries, 0)
+
     def test_adjust_non_trading_minutes(self):
         start_day = Timestamp('2015-06-01', tz='UTC')
         end_day = Timestamp('2015-06-02', tz='UTC')
@@ -1248,3 +1424,110 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
         for i, col in enumerate(columns):
             for j, sid in enumerate(sids):
                 assert_almost_equal(data[sid][col], arrays[i][j])
+
+
+@skipIf(not HAVE_PYARROW, 'pyarrow is not installed')
+class ParquetMinuteBarTestCase(WithTradingCalendars,
+                               WithAssetFinder,
+                               WithInstanceTmpDir,
+                               ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2
+
+    def init_instance_fixtures(self):
+        super(ParquetMinuteBarTestCase, self).init_instance_fixtures()
+
+        self.dest = self.instance_tmpdir.getpath('minute_bars.parquet')
+        self.writer = ParquetMinuteBarWriter(
+            self.dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            sids_per_file=1,
+            row_group_size=390,
+        )
+        self.minutes = self.trading_calendar.minutes_for_session(
+            TEST_CALENDAR_START,
+        )
+
+    def make_frame(self, minutes, base):
+        n = len(minutes)
+        return DataFrame(
+            data={
+                'open': arange(n, dtype=float64) + base,
+                'high': arange(n, dtype=float64) + base + 1,
+                'low': arange(n, dtype=float64) + base - 1,
+                'close': arange(n, dtype=float64) + base,
+                'volume': arange(n, dtype=float64) + 1,
+            },
+            index=minutes,
+        )
+
+    def test_write_and_read(self):
+        minutes = self.minutes
+        data = self.make_frame(minutes[:10], 10.0)
+        # Leave a gap with no trades.
+        data.iloc[3] = [0.0, 0.0, 0.0, 0.0, 0.0]
+        self.writer.write([(1, data), (2, self.make_frame(minutes[:5], 20.0))])
+        reader = ParquetMinuteBarReader(self.dest)
+
+        self.assertEqual(reader.get_value(1, minutes[2], 'close'), 12.0)
+        self.assertEqual(reader.get_value(1, minutes[2], 'volume'), 3)
+        assert_almost_equal(reader.get_value(1, minutes[3], 'close'), nan)
+        self.assertEqual(reader.get_value(1, minutes[3], 'volume'), 0)
+        self.assertEqual(reader.get_value(2, minutes[20], 'volume'), 0)
+
+        with self.assertRaises(NoDataForSid):
+            reader.get_value(1337, minutes[0], 'close')
+        with self.assertRaises(NoDataOnDate):
+            reader.get_value(1, minutes[0] - Timedelta('1 min'), 'close')
+
+        close, volume = reader.load_raw_arrays(
+            ['close', 'volume'],
+            minutes[0],
+            minutes[5],
+            [1, 2],
+        )
+        assert_almost_equal(
+            close,
+            array([
+                [10.0, 20.0],
+                [11.0, 21.0],
+                [12.0, 22.0],
+                [nan, 23.0],
+                [14.0, 24.0],
+                [15.0, nan],
+            ]),
+        )
+        assert_array_equal(
+            volume,
+            array([[1, 1], [2, 2], [3, 3], [0, 4], [5, 5], [6, 0]]),
+        )
+
+        self.assertEqual(
+            reader.get_last_traded_dt(self.asset_finder.retrieve_asset(2),
+                                      minutes[100]),
+            minutes[4],
+        )
+        self.assertIs(
+            reader.get_last_traded_dt(self.asset_finder.retrieve_asset(1),
+                                      minutes[0] - Timedelta('1 min')),
+            NaT,
+        )
+
+    def test_append(self):
+        minutes = self.minutes
+        self.writer.write([(1, self.make_frame(minutes[:5], 10.0))])
+        self.writer.write([(1, self.make_frame(minutes[5:10], 15.0))])
+        reader = ParquetMinuteBarReader(self.dest)
+
+        close, = reader.load_raw_arrays(
+            ['close'],
+            minutes[0],
+            minutes[9],
+            [1],
+        )
+        assert_almost_equal(close[:, 0], arange(10, dtype=float64) + 10.0)
+
+        with self.assertRaises(ParquetMinuteOverlappingData):
+            self.writer.write([(1, self.make_frame(minutes[9:12], 20.0))])
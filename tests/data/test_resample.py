@@ -13,6 +13,9 @@
 # limitations under the License.
 from collections import OrderedDict
 from numbers import Real
+import shutil
+
+from mock import patch
 
 from nose_parameterized import parameterized
 from numpy.testing import assert_almost_equal
@@ -23,10 +26,13 @@ from six import iteritems
 
 from zipline.data.resample import (
     minute_frame_to_session_frame,
+    daily_rollup_path,
+    daily_rollup_reader,
     DailyHistoryAggregator,
     MinuteResampleSessionBarReader,
     ReindexMinuteBarReader,
     ReindexSessionBarReader,
+    write_daily_rollup,
 )
 
 from zipline.testing import parameter_space
@@ -523,6 +529,41 @@ class MinuteToDailyAggregationTestCase(WithBcolzEquityMinuteBarReader,
                     err_msg='sid={0} field={1} dt={2}'.format(
                         asset, field, minute))
 
+    @parameterized.expand(OHLCV)
+    def test_staggered_assets(self, field):
+        # Assets last visited at different minutes are folded forward
+        # together.
+        method_name = field + 's'
+        aggregate = getattr(self.equity_daily_aggregator, method_name)
+        minute_reader = self.bcolz_equity_minute_bar_reader
+        assets = self.asset_finder.retrieve_all([1, 2])
+        minutes = EQUITY_CASES[1].index
+
+        aggregate(assets[:1], minutes[0])
+        aggregate(assets[1:], minutes[1])
+
+        with patch.object(minute_reader,
+                          'load_raw_arrays',
+                          wraps=minute_reader.load_raw_arrays) as load:
+            values = aggregate(assets, minutes[4])
+        # One read per distinct last visited minute.
+        self.assertEqual(load.call_count, 2)
+        for asset, value in zip(assets, values):
+            assert_almost_equal(
+                value,
+                EXPECTED_AGGREGATION[asset][field][4],
+                err_msg='sid={0} field={1}'.format(asset, field))
+
+        # The next minute is read without loading a window.
+        with patch.object(minute_reader, 'load_raw_arrays') as load:
+            values = aggregate(assets, minutes[5])
+        self.assertEqual(load.call_count, 0)
+        for asset, value in zip(assets, values):
+            assert_almost_equal(
+                value,
+                EXPECTED_AGGREGATION[asset][field][5],
+                err_msg='sid={0} field={1}'.format(asset, field))
+
 
 class TestMinuteToSession(WithEquityMinuteBarData,
                           ZiplineTestCase):
@@ -665,6 +706,47 @@ class TestResampleSessionBars(WithBcolzFutureMinuteBarReader,
             self.session_bar_reader.get_last_traded_dt(future, self.END_DATE)
         )
 
+    def test_daily_rollup(self):
+        minute_bar_reader = self.bcolz_future_minute_bar_reader
+        self.assertIsNone(daily_rollup_reader(minute_bar_reader))
+
+        # Sids without minute bars are skipped.
+        rollup = write_daily_rollup(
+            minute_bar_reader,
+            self.ASSET_FINDER_FUTURE_SIDS + (1005,),
+            sids_per_read=3,
+            sessions_per_read=1,
+        )
+        self.addCleanup(
+            shutil.rmtree,
+            daily_rollup_path(minute_bar_reader.rootdir),
+        )
+
+        self.assertEqual(
+            list(rollup.sessions),
+            list(self.session_bar_reader.sessions),
+        )
+        sids = list(self.ASSET_FINDER_FUTURE_SIDS)
+        expected = self.session_bar_reader.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        result = rollup.load_raw_arrays(
+            OHLCV, self.START_DATE, self.END_DATE, sids,
+        )
+        for field, expected_field, result_field in zip(OHLCV,
+                                                       expected,
+                                                       result):
+            assert_almost_equal(
+                expected_field,
+                result_field,
+                decimal=3,
+                err_msg="field={0}".format(field),
+            )
+
+        found = daily_rollup_reader(minute_bar_reader)
+        self.assertIsNotNone(found)
+        self.assertEqual(found.last_available_dt, self.END_DATE)
+
 
 class TestReindexMinuteBars(WithBcolzEquityMinuteBarReader,
                             ZiplineTestCase):
@@ -544,6 +544,49 @@ class AdjustedArrayTestCase(TestCase):
         assert_equal(clean_copy.data, original_data)
         assert_equal(adjusted_array.data, original_data * 2)
 
+    def test_take_columns(self):
+        data = arange(5 * 6, dtype='f8').reshape(5, 6)
+        adjustments = {
+            1: [Float64Multiply(0, 1, 0, 5, 2.0)],
+            2: [Float64Overwrite(0, 2, 1, 1, -1.0)],
+            3: [
+                Float64Multiply(0, 3, 2, 4, 3.0),
+                Float64Overwrite(0, 3, 4, 5, -2.0),
+            ],
+        }
+        adjusted_array = AdjustedArray(data, adjustments, float('nan'))
+        columns = array([0, 3, 5])
+
+        taken = adjusted_array.take_columns(columns)
+        assert_equal(taken.data, data[:, columns])
+        assert_equal(
+            taken.adjustments,
+            {
+                1: [Float64Multiply(0, 1, 0, 2, 2.0)],
+                # The overwrite of column 1 was dropped.
+                3: [
+                    Float64Multiply(0, 3, 1, 1, 3.0),
+                    Float64Overwrite(0, 3, 2, 2, -2.0),
+                ],
+            },
+        )
+
+        # Windows over the taken columns should match the same columns of
+        # windows over the original array.
+        for expected, actual in zip(adjusted_array.traverse(3),
+                                    taken.traverse(3)):
+            assert_equal(actual, expected[:, columns])
+
+    def test_take_columns_of_array_adjustments(self):
+        data = arange(5 * 3, dtype='f8').reshape(5, 3)
+        adjustments = {
+            2: [Float641DArrayOverwrite(0, 1, 0, 0, array([1.0, 2.0]))],
+        }
+        adjusted_array = AdjustedArray(data, adjustments, float('nan'))
+
+        with self.assertRaises(TypeError):
+            adjusted_array.take_columns(array([0, 2]))
+
     @parameterized.expand(
         chain(
             _gen_unadjusted_cases(
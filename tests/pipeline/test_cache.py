@@ -0,0 +1,135 @@
+"""
+Tests for zipline.pipeline.cache.
+"""
+import os
+
+from pandas.util.testing import assert_frame_equal
+
+from zipline.pipeline import CustomFactor, Pipeline, SimplePipelineEngine
+from zipline.pipeline.cache import DiskTermCache, term_fingerprint
+from zipline.pipeline.data.testing import TestingDataSet
+from zipline.pipeline.domain import US_EQUITIES
+from zipline.pipeline.factors import SimpleMovingAverage
+from zipline.pipeline.hooks.testing import TestingHooks
+from zipline.testing.fixtures import (
+    WithInstanceTmpDir,
+    WithSeededRandomPipelineEngine,
+    ZiplineTestCase,
+)
+
+
+class CountingFactor(CustomFactor):
+    """A CustomFactor that records how many times it was computed.
+    """
+    inputs = [TestingDataSet.float_col]
+    window_length = 5
+    calls = 0
+
+    def compute(self, today, assets, out, data):
+        type(self).calls += 1
+        out[:] = data.sum(axis=0)
+
+
+class DiskTermCacheTestCase(WithSeededRandomPipelineEngine,
+                            WithInstanceTmpDir,
+                            ZiplineTestCase):
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+    SEEDED_RANDOM_PIPELINE_DEFAULT_DOMAIN = US_EQUITIES
+
+    def init_instance_fixtures(self):
+        super(DiskTermCacheTestCase, self).init_instance_fixtures()
+        CountingFactor.calls = 0
+
+    def make_engine(self, cache, hooks=()):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            default_hooks=list(hooks),
+            term_cache=cache,
+        )
+
+    def make_cache(self, data_version='v1', max_size_bytes=None):
+        return DiskTermCache(
+            self.instance_tmpdir.getpath('cache'),
+            data_version,
+            max_size_bytes=max_size_bytes,
+        )
+
+    def test_fingerprint_is_structural(self):
+        a = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        )
+        b = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=6,
+        )
+        self.assertEqual(term_fingerprint(a), term_fingerprint(a))
+        self.assertNotEqual(term_fingerprint(a), term_fingerprint(b))
+
+    def test_cached_terms_are_not_recomputed(self):
+        start, end = self.trading_days[10], self.trading_days[-1]
+        pipe = Pipeline({'counted': CountingFactor()})
+
+        expected = self.run_pipeline(pipe, start, end)
+        self.assertEqual(CountingFactor.calls, len(self.trading_days) - 10)
+
+        cache = self.make_cache()
+        first = self.make_engine(cache).run_pipeline(pipe, start, end)
+        assert_frame_equal(first, expected)
+        self.assertEqual(cache.hits, 0)
+        self.assertGreater(len(cache.entries()), 0)
+
+        CountingFactor.calls = 0
+        hooks = TestingHooks()
+        second = self.make_engine(cache, [hooks]).run_pipeline(
+            pipe, start, end,
+        )
+        assert_frame_equal(second, expected)
+        self.assertEqual(CountingFactor.calls, 0)
+        self.assertGreater(cache.hits, 0)
+
+        # The cached term's inputs shouldn't be loaded either.
+        loads = [c for c in hooks.trace if c.method_name == 'loading_terms']
+        self.assertEqual(loads, [])
+
+    def test_data_version_invalidates(self):
+        start, end = self.trading_days[10], self.trading_days[-1]
+        pipe = Pipeline({'counted': CountingFactor()})
+
+        self.make_engine(self.make_cache('v1')).run_pipeline(pipe, start, end)
+
+        CountingFactor.calls = 0
+        cache = self.make_cache('v2')
+        self.make_engine(cache).run_pipeline(pipe, start, end)
+        self.assertGreater(CountingFactor.calls, 0)
+        self.assertEqual(cache.hits, 0)
+
+    def test_eviction(self):
+        pipe = Pipeline({
+            'sma_%d' % n: SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=n,
+            )
+            for n in range(2, 6)
+        })
+        start, end = self.trading_days[10], self.trading_days[-1]
+
+        cache = self.make_cache()
+        self.make_engine(cache).run_pipeline(pipe, start, end)
+        entries = cache.entries()
+        self.assertEqual(len(entries), 4)
+
+        # Touch the oldest entry so that it becomes the most recently used.
+        oldest_path, oldest_size, oldest_mtime = entries[0]
+        os.utime(oldest_path, (oldest_mtime + 1000, oldest_mtime + 1000))
+
+        budget = cache.size_bytes - 1
+        self.assertEqual(cache.evict(budget), 1)
+        self.assertLessEqual(cache.size_bytes, budget)
+        self.assertTrue(os.path.exists(oldest_path))
+
+        cache.clear()
+        self.assertEqual(cache.entries(), [])
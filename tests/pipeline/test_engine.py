@@ -3,7 +3,9 @@ Tests for SimplePipelineEngine
 """
 from __future__ import division
 from collections import OrderedDict
+from contextlib import closing
 from itertools import product
+from multiprocessing.pool import ThreadPool
 from operator import add, sub
 from unittest import skipIf
 
@@ -64,6 +66,7 @@ from zipline.pipeline.factors import (
     SimpleMovingAverage,
 )
 from zipline.pipeline.filters import CustomFilter
+from zipline.pipeline.hooks.testing import TestingHooks
 from zipline.pipeline.loaders.equity_pricing_loader import (
     EquityPricingLoader,
 )
@@ -74,7 +77,7 @@ from zipline.pipeline.loaders.synthetic import (
     expected_bar_values_2d,
 )
 from zipline.pipeline.sentinels import NotSpecified
-from zipline.pipeline.term import InputDates
+from zipline.pipeline.term import AssetExists, InputDates
 from zipline.testing import (
     AssetID,
     AssetIDPlusDay,
@@ -86,12 +89,14 @@ from zipline.testing import (
     product_upper_triangle,
 )
 import zipline.testing.fixtures as zf
+from zipline.utils.date_utils import compute_date_range_chunks
 from zipline.utils.exploding_object import NamedExplodingObject
 from zipline.testing.core import create_simple_domain
 from zipline.testing.predicates import assert_equal
 from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import bool_dtype, datetime64ns_dtype
 from zipline.utils.pandas_utils import new_pandas, skip_pipeline_new_pandas
+from zipline.utils.pool import SequentialPool
 
 
 class RollingSumDifference(CustomFactor):
@@ -909,6 +914,103 @@ class FrameInputTestCase(zf.WithAssetFinder,
                 high_results = results.unstack()['high']
                 assert_frame_equal(high_results, high_base.iloc[iloc_bounds])
 
+    def test_rolling_compute_with_adjustments(self):
+        dates, asset_ids = self.dates, self.asset_ids
+        high = EquityPricing.high
+        apply_idx = 12
+
+        adjustments = DataFrame.from_records([
+            dict(
+                kind=MULTIPLY,
+                sid=asset_ids[1],
+                value=2.0,
+                start_date=None,
+                end_date=dates[apply_idx - 1],
+                apply_date=dates[apply_idx],
+            ),
+        ])
+        base = self.make_frame(
+            arange(len(dates) * len(asset_ids), dtype=float).reshape(
+                len(dates), len(asset_ids),
+            ),
+        )
+        loader = DataFrameLoader(high, base, adjustments)
+        engine = SimplePipelineEngine(
+            {USEquityPricing.high: loader}.__getitem__,
+            self.asset_finder,
+        )
+
+        class Sum(CustomFactor):
+            inputs = [EquityPricing.high]
+            window_length = 5
+
+            def compute(self, today, assets, out, data):
+                out[:] = data.sum(axis=0)
+
+        class RollingSum(Sum):
+            initial_calls = 0
+
+            def compute_rolling_initial(self, out, data):
+                type(self).initial_calls += 1
+                out[:] = data.sum(axis=0)
+                return out.copy()
+
+            def compute_rolling_update(self, state, out, entering, leaving):
+                state += entering[0] - leaving[0]
+                out[:] = state
+                return state
+
+        start, end = dates[5], dates[-1]
+        expected = engine.run_pipeline(
+            Pipeline({'sum': Sum()}, domain=self.domain), start, end,
+        )
+        result = engine.run_pipeline(
+            Pipeline({'sum': RollingSum()}, domain=self.domain), start, end,
+        )
+        assert_frame_equal(result, expected)
+
+        # Most days should have been computed by updating the previous day.
+        self.assertLess(RollingSum.initial_calls, len(dates[5:]) // 2)
+
+    def test_overridden_compute_skips_rolling_compute(self):
+        dates, asset_ids = self.dates, self.asset_ids
+        high = EquityPricing.high
+        base = self.make_frame(
+            arange(len(dates) * len(asset_ids), dtype=float).reshape(
+                len(dates), len(asset_ids),
+            ),
+        )
+        loader = DataFrameLoader(high, base)
+        engine = SimplePipelineEngine(
+            {USEquityPricing.high: loader}.__getitem__,
+            self.asset_finder,
+        )
+
+        class Max(CustomFactor):
+            inputs = [EquityPricing.high]
+            window_length = 5
+
+            def compute(self, today, assets, out, data):
+                out[:] = data.max(axis=0)
+
+        # Only overrides compute, so SimpleMovingAverage's rolling methods
+        # must not be used.
+        class MovingMax(SimpleMovingAverage):
+            inputs = [EquityPricing.high]
+            window_length = 5
+
+            def compute(self, today, assets, out, data):
+                out[:] = data.max(axis=0)
+
+        start, end = dates[5], dates[-1]
+        expected = engine.run_pipeline(
+            Pipeline({'max': Max()}, domain=self.domain), start, end,
+        )
+        result = engine.run_pipeline(
+            Pipeline({'max': MovingMax()}, domain=self.domain), start, end,
+        )
+        assert_frame_equal(result, expected)
+
 
 class SyntheticBcolzTestCase(zf.WithAdjustmentReader,
                              zf.WithAssetFinder,
@@ -1581,6 +1683,377 @@ class ChunkedPipelineTestCase(zf.WithSeededRandomPipelineEngine,
             chunksize=5,
         )
 
+    @parameter_space(max_chunks_in_flight=[None, 1, 3])
+    def test_run_chunked_pipeline_in_pool(self, max_chunks_in_flight):
+        pipe = Pipeline(
+            columns={
+                'float': TestingDataSet.float_col.latest,
+                'custom_factor': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=10,
+                ),
+            },
+            domain=US_EQUITIES,
+        )
+
+        expected = self.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+        )
+
+        hooks = TestingHooks()
+        pool = ThreadPool(4)
+        try:
+            result = self.seeded_random_engine.run_chunked_pipeline(
+                pipe,
+                self.PIPELINE_START_DATE,
+                self.END_DATE,
+                chunksize=22,
+                hooks=[hooks],
+                pool=pool,
+                max_chunks_in_flight=max_chunks_in_flight,
+            )
+        finally:
+            pool.close()
+            pool.join()
+
+        assert_frame_equal(result, expected)
+
+        # Every chunk should still report itself to the hooks.
+        num_chunks = len(list(compute_date_range_chunks(
+            self.trading_days,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            22,
+        )))
+        chunk_enters = [
+            c for c in hooks.trace
+            if c.method_name == 'computing_chunk' and c.state == 'enter'
+        ]
+        self.assertEqual(len(chunk_enters), num_chunks)
+
+    def test_run_chunked_pipeline_in_sequential_pool(self):
+        pipe = Pipeline(
+            columns={'float': TestingDataSet.float_col.latest},
+            domain=US_EQUITIES,
+        )
+        expected = self.run_chunked_pipeline(
+            pipeline=pipe,
+            start_date=self.PIPELINE_START_DATE,
+            end_date=self.END_DATE,
+            chunksize=22,
+        )
+        result = self.seeded_random_engine.run_chunked_pipeline(
+            pipe,
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+            chunksize=22,
+            pool=SequentialPool(),
+            max_chunks_in_flight=2,
+        )
+        assert_frame_equal(result, expected)
+
+    def test_run_chunked_pipeline_with_memory_budget(self):
+        pipe = Pipeline(
+            columns={
+                'float': TestingDataSet.float_col.latest,
+                'custom_factor': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=10,
+                ),
+            },
+            domain=US_EQUITIES,
+        )
+        engine = self.seeded_random_engine
+        plan = pipe.to_execution_plan(
+            US_EQUITIES,
+            AssetExists(),
+            self.PIPELINE_START_DATE,
+            self.END_DATE,
+        )
+        num_assets = len(
+            self.asset_finder.equities_sids_for_country_code('US')
+        )
+
+        expected = self.run_pipeline(
+            pipe, self.PIPELINE_START_DATE, self.END_DATE,
+        )
+        for expected_chunksize, max_chunksize in ((10, None),
+                                                  (10, 30),
+                                                  (7, 7)):
+            hooks = TestingHooks()
+            result = engine.run_chunked_pipeline(
+                pipe,
+                self.PIPELINE_START_DATE,
+                self.END_DATE,
+                chunksize=max_chunksize,
+                hooks=[hooks],
+                max_memory_bytes=plan.estimate_nbytes(10, num_assets),
+            )
+            assert_frame_equal(result, expected)
+
+            chunk_sizes = [
+                len(self.trading_days[
+                    self.trading_days.slice_indexer(*c.args[1:])
+                ])
+                for c in hooks.trace
+                if c.method_name == 'computing_chunk' and c.state == 'enter'
+            ]
+            self.assertEqual(max(chunk_sizes), expected_chunksize)
+
+        with self.assertRaises(ValueError):
+            engine.run_chunked_pipeline(
+                pipe,
+                self.PIPELINE_START_DATE,
+                self.END_DATE,
+                chunksize=None,
+                max_memory_bytes=1,
+            )
+
+    def test_bad_max_chunks_in_flight(self):
+        pipe = Pipeline(
+            columns={'float': TestingDataSet.float_col.latest},
+            domain=US_EQUITIES,
+        )
+        with self.assertRaises(ValueError):
+            self.seeded_random_engine.run_chunked_pipeline(
+                pipe,
+                self.PIPELINE_START_DATE,
+                self.END_DATE,
+                chunksize=22,
+                pool=SequentialPool(),
+                max_chunks_in_flight=0,
+            )
+
+
+class TermPoolTestCase(zf.WithSeededRandomPipelineEngine,
+                       zf.ZiplineTestCase):
+
+    START_DATE = Timestamp('2015-01-02', tz='UTC')
+    END_DATE = Timestamp('2015-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+    SEEDED_RANDOM_PIPELINE_DEFAULT_DOMAIN = US_EQUITIES
+
+    @classmethod
+    def init_class_fixtures(cls):
+        super(TermPoolTestCase, cls).init_class_fixtures()
+        cls.term_pool = cls.enter_class_context(closing(ThreadPool(4)))
+        loader = cls.seeded_random_loader
+        cls.pooled_engine = SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=cls.asset_finder,
+            default_domain=US_EQUITIES,
+            term_pool=cls.term_pool,
+        )
+
+    def make_wide_pipeline(self):
+        columns = {}
+        for window_length in range(2, 12):
+            columns['sma_%d' % window_length] = SimpleMovingAverage(
+                inputs=[TestingDataSet.float_col],
+                window_length=window_length,
+            )
+            columns['max_dd_%d' % window_length] = MaxDrawdown(
+                inputs=[TestingDataSet.float_col],
+                window_length=window_length,
+            )
+        columns['latest'] = TestingDataSet.float_col.latest
+        columns['ranked'] = TestingDataSet.float_col.latest.rank()
+        columns['bool'] = TestingDataSet.bool_col.latest
+
+        # A screen that depends on other computed terms.
+        screen = columns['sma_5'] > columns['sma_10']
+        return Pipeline(columns=columns, screen=screen)
+
+    def test_term_pool_matches_serial(self):
+        pipe = self.make_wide_pipeline()
+        start = self.trading_days[20]
+        end = self.trading_days[-1]
+
+        expected = self.run_pipeline(pipe, start, end)
+        hooks = TestingHooks()
+        result = self.pooled_engine.run_pipeline(pipe, start, end, [hooks])
+        assert_frame_equal(result, expected)
+
+        computed = {
+            c.args[0] for c in hooks.trace
+            if c.method_name == 'computing_term' and c.state == 'enter'
+        }
+        self.assertIn(pipe.columns['ranked'], computed)
+
+    def test_term_pool_reraises(self):
+
+        class Boom(Exception):
+            pass
+
+        class Exploding(CustomFactor):
+            inputs = [TestingDataSet.float_col]
+            window_length = 3
+
+            def compute(self, today, assets, out, data):
+                raise Boom()
+
+        pipe = Pipeline(
+            columns={
+                'boom': Exploding(),
+                'sma': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=5,
+                ),
+            },
+        )
+        with self.assertRaises(Boom):
+            self.pooled_engine.run_pipeline(
+                pipe, self.trading_days[20], self.trading_days[-1],
+            )
+
+
+class SparseMaskTestCase(zf.WithSeededRandomPipelineEngine,
+                         zf.ZiplineTestCase):
+
+    START_DATE = Timestamp('2015-01-02', tz='UTC')
+    END_DATE = Timestamp('2015-03-31', tz='UTC')
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+    SEEDED_RANDOM_PIPELINE_DEFAULT_DOMAIN = US_EQUITIES
+
+    def make_engine(self, sparse_mask_threshold):
+        loader = self.seeded_random_loader
+        return SimplePipelineEngine(
+            get_loader=lambda column: loader,
+            asset_finder=self.asset_finder,
+            default_domain=US_EQUITIES,
+            sparse_mask_threshold=sparse_mask_threshold,
+        )
+
+    @parameter_space(sparse_mask_threshold=[0.01, 0.5, 1.0])
+    def test_sparse_mask_matches_dense(self, sparse_mask_threshold):
+
+        class SumAndMax(CustomFactor):
+            inputs = [TestingDataSet.float_col]
+            outputs = ['sum_', 'max_']
+            window_length = 4
+
+            def compute(self, today, assets, out, data):
+                out.sum_[:] = data.sum(axis=0)
+                out.max_[:] = data.max(axis=0)
+
+        universe = TestingDataSet.float_col.latest.top(2)
+        sum_and_max = SumAndMax(mask=universe)
+        pipe = Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=5,
+                    mask=universe,
+                ),
+                'max_dd': MaxDrawdown(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=3,
+                    mask=~universe,
+                ),
+                'sum_': sum_and_max.sum_,
+                'max_': sum_and_max.max_,
+                'unmasked': SimpleMovingAverage(
+                    inputs=[TestingDataSet.float_col],
+                    window_length=5,
+                ),
+            },
+        )
+        start = self.trading_days[20]
+        end = self.trading_days[-1]
+
+        expected = self.run_pipeline(pipe, start, end)
+        result = self.make_engine(sparse_mask_threshold).run_pipeline(
+            pipe, start, end,
+        )
+        assert_frame_equal(result, expected)
+
+    def test_bad_sparse_mask_threshold(self):
+        for bad in (0, -0.5, 1.5):
+            with self.assertRaises(ValueError):
+                self.make_engine(bad)
+
+
+class RunPipelinesTestCase(zf.WithSeededRandomPipelineEngine,
+                           zf.ZiplineTestCase):
+    SEEDED_RANDOM_PIPELINE_DEFAULT_DOMAIN = US_EQUITIES
+
+    def make_pipelines(self):
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        )
+        universe = TestingDataSet.float_col.latest.top(3)
+        return {
+            'sma': Pipeline({'sma': sma}),
+            'screened': Pipeline(
+                {
+                    'sma': sma,
+                    'ranked': sma.rank(mask=universe),
+                    'latest': TestingDataSet.float_col.latest,
+                },
+                screen=universe,
+            ),
+            'other': Pipeline({
+                'close': TestingDataSet.float_col.latest,
+                'string': TestingDataSet.categorical_col.latest,
+            }),
+            'screen_only': Pipeline(screen=TestingDataSet.bool_col.latest),
+        }
+
+    def test_matches_run_pipeline(self):
+        pipes = self.make_pipelines()
+        start = self.trading_days[20]
+        end = self.trading_days[-1]
+
+        hooks = TestingHooks()
+        result = self.seeded_random_engine.run_pipelines(
+            pipes, start, end, [hooks],
+        )
+        self.assertEqual(set(result), set(pipes))
+        for name, pipe in pipes.items():
+            assert_frame_equal(
+                result[name],
+                self.run_pipeline(pipe, start, end),
+                check_like=True,
+            )
+
+        # Terms shared between pipelines are only loaded and computed once.
+        loaded = [
+            term
+            for c in hooks.trace
+            if c.method_name == 'loading_terms' and c.state == 'enter'
+            for term in c.args[0]
+        ]
+        self.assertEqual(len(loaded), len(set(loaded)))
+
+        sma = pipes['sma'].columns['sma']
+        computed = [
+            c.args[0] for c in hooks.trace
+            if c.method_name == 'computing_term' and c.state == 'enter'
+        ]
+        self.assertEqual(computed.count(sma), 1)
+
+    def test_empty(self):
+        self.assertEqual(
+            self.seeded_random_engine.run_pipelines(
+                {}, self.trading_days[20], self.trading_days[-1],
+            ),
+            {},
+        )
+
+    def test_mismatched_domains(self):
+        pipes = {
+            'us': Pipeline(domain=US_EQUITIES),
+            'jp': Pipeline(domain=JP_EQUITIES),
+        }
+        with self.assertRaises(ValueError):
+            self.seeded_random_engine.run_pipelines(
+                pipes, self.trading_days[20], self.trading_days[-1],
+            )
+
 
 class MaximumRegressionTest(zf.WithSeededRandomPipelineEngine,
                             zf.ZiplineTestCase):
@@ -1,17 +1,24 @@
+from functools import partial
+import importlib
 import itertools
+from multiprocessing.pool import ThreadPool
 from operator import attrgetter
+import threading
 
 import numpy as np
 import pandas as pd
+from six import StringIO
 import toolz
 
 from zipline.pipeline import Pipeline
 from zipline.pipeline.classifiers import Everything
 from zipline.pipeline.domain import US_EQUITIES
-from zipline.pipeline.factors import CustomFactor
+from zipline.pipeline.factors import CustomFactor, SimpleMovingAverage
 from zipline.pipeline.data import Column, DataSet
 from zipline.pipeline.data.testing import TestingDataSet
-from zipline.pipeline.hooks.testing import TestingHooks
+from zipline.pipeline.hooks.profiling import ProfilingHooks
+from zipline.pipeline.hooks import PipelineHooks
+from zipline.pipeline.hooks.testing import Call, TestingHooks
 from zipline.pipeline.hooks.progress import (
     ProgressHooks,
     repr_htmlsafe,
@@ -142,11 +149,21 @@ class HooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
             self.assertIsInstance(ctrace[0].args[0], list)  # terms
             self.assertEqual(ctrace[0].args[1:], (chunk_start, chunk_end))
 
-            # Remainder of calls should be loads and computes. These have to
-            # happen in dependency order, but we don't bother to assert that
-            # here. We just make sure that we see each expected load/compute
-            # exactly once.
-            loads_and_computes = ctrace[1:-1]
+            # Remainder of calls should be loads and computes, each followed
+            # by a call to on_terms_stored. These have to happen in dependency
+            # order, but we don't bother to assert that here. We just make
+            # sure that we see each expected load/compute exactly once.
+            loads_and_computes = []
+            stored = set()
+            for call in ctrace[1:-1]:
+                if call.method_name == 'on_terms_stored':
+                    for stored_term in call.args[0]:
+                        self.assertIn(stored_term, call.args[1])
+                        if isinstance(stored_term, LoadableTerm):
+                            stored_term = stored_term.unspecialize()
+                        stored.add(stored_term)
+                else:
+                    loads_and_computes.append(call)
             loads = set()
             computes = set()
             for enter, exit_ in two_at_a_time(loads_and_computes):
@@ -169,6 +186,7 @@ class HooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
 
             self.assertEqual(loads, expected_loads)
             self.assertEqual(computes, expected_computes)
+            self.assertEqual(stored, loads | computes)
 
     def split_by_chunk(self, trace):
         """
@@ -464,6 +482,206 @@ class ProgressHooksTestCase(WithSeededRandomPipelineEngine, ZiplineTestCase):
         return round((100.0 * days_complete) / total_days, 3)
 
 
+class ProfilingHooksTestCase(WithSeededRandomPipelineEngine,
+                             ZiplineTestCase):
+    """Tests for verifying ProfilingHooks.
+    """
+    ASSET_FINDER_COUNTRY_CODE = 'US'
+
+    def make_hooks(self):
+        # Use a clock that advances by one second every time it's read, so
+        # that every computed term takes exactly one second.
+        return ProfilingHooks(clock=partial(next, itertools.count()))
+
+    @parameter_space(chunked=[True, False])
+    def test_profiling_hooks(self, chunked):
+        hooks = self.make_hooks()
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        )
+        pipeline = Pipeline(
+            {'sma': sma, 'bool_': TestingDataSet.bool_col.latest},
+            domain=US_EQUITIES,
+        )
+        start_date, end_date = self.trading_days[[-10, -1]]
+        if chunked:
+            self.run_chunked_pipeline(
+                pipeline=pipeline,
+                start_date=start_date,
+                end_date=end_date,
+                chunksize=5,
+                hooks=[hooks],
+            )
+            nchunks = 2
+        else:
+            self.run_pipeline(
+                pipeline=pipeline,
+                start_date=start_date,
+                end_date=end_date,
+                hooks=[hooks],
+            )
+            nchunks = 1
+
+        frame = hooks.to_frame()
+        self.assertEqual(
+            list(frame.columns),
+            [
+                'term', 'kind', 'start_date', 'end_date', 'seconds', 'nbytes',
+                'rows', 'columns', 'workspace_nbytes',
+            ],
+        )
+
+        computes = frame[frame.kind == 'compute']
+        loads = frame[frame.kind == 'load']
+        self.assertEqual(
+            set(computes.term),
+            {sma, TestingDataSet.bool_col.latest},
+        )
+        self.assertEqual(
+            {t.unspecialize() for t in loads.term},
+            {TestingDataSet.float_col, TestingDataSet.bool_col},
+        )
+        self.assertEqual(len(computes), 2 * nchunks)
+        self.assertEqual(len(loads), 2 * nchunks)
+        self.assertTrue((computes.seconds == 1.0).all())
+
+        for row in computes.itertuples():
+            self.assertEqual(row.rows, 10 // nchunks)
+            itemsize = 8 if row.term is sma else 1
+            self.assertEqual(row.nbytes, row.rows * row.columns * itemsize)
+
+        # The float column is loaded with extra rows for the moving average.
+        float_load = loads[[
+            t.unspecialize() is TestingDataSet.float_col for t in loads.term
+        ]]
+        self.assertTrue((float_load.rows == 10 // nchunks + 4).all())
+
+        self.assertTrue((frame.workspace_nbytes >= frame.nbytes).all())
+        self.assertEqual(
+            hooks.peak_workspace_nbytes,
+            frame.workspace_nbytes.max(),
+        )
+
+        buf = StringIO()
+        hooks.write_collapsed_stacks(buf)
+        lines = buf.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        totals = {}
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            root, kind, name = stack.split(';')
+            self.assertEqual(root, 'pipeline')
+            totals[kind] = totals.get(kind, 0) + int(count)
+        self.assertEqual(totals['compute'], 2 * nchunks * 1000000)
+
+        hooks.clear()
+        self.assertEqual(len(hooks.to_frame()), 0)
+        self.assertEqual(hooks.peak_workspace_nbytes, 0)
+
+    def test_profiling_hooks_with_chunk_pool(self):
+        hooks = self.make_hooks()
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        )
+        pipeline = Pipeline(
+            {'sma': sma, 'bool_': TestingDataSet.bool_col.latest},
+            domain=US_EQUITIES,
+        )
+        start_date, end_date = self.trading_days[[-10, -1]]
+        pool = ThreadPool(3)
+        try:
+            self.seeded_random_engine.run_chunked_pipeline(
+                pipeline=pipeline,
+                start_date=start_date,
+                end_date=end_date,
+                chunksize=2,
+                hooks=[hooks],
+                pool=pool,
+            )
+        finally:
+            pool.terminate()
+
+        # Every chunk is credited with its own terms, with the shapes of its
+        # own dates.
+        frame = hooks.to_frame()
+        chunks = frame.groupby(['start_date', 'end_date'])
+        self.assertEqual(len(chunks), 5)
+        for (chunk_start, chunk_end), chunk_frame in chunks:
+            self.assertEqual(len(chunk_frame), 4)
+            ndays = len(self.trading_days[
+                self.trading_days.slice_indexer(chunk_start, chunk_end)
+            ])
+            computes = chunk_frame[chunk_frame.kind == 'compute']
+            self.assertEqual(
+                set(computes.term),
+                {sma, TestingDataSet.bool_col.latest},
+            )
+            self.assertTrue((computes.rows == ndays).all())
+
+    def test_profiling_hooks_unknown_chunk(self):
+        hooks = self.make_hooks()
+        sma = SimpleMovingAverage(
+            inputs=[TestingDataSet.float_col],
+            window_length=5,
+        )
+        chunks = self.trading_days[[-4, -3]], self.trading_days[[-2, -1]]
+
+        # Hold two chunks open in other threads, like a chunk pool would.
+        entered = [threading.Event() for _ in chunks]
+        done = threading.Event()
+
+        def compute_chunk(dates, entered):
+            with hooks.computing_chunk([sma], *dates):
+                entered.set()
+                done.wait()
+
+        threads = [
+            threading.Thread(target=compute_chunk, args=args)
+            for args in zip(chunks, entered)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for event in entered:
+                event.wait()
+
+            # A term pool's worker can't tell which chunk the term is part
+            # of, which shouldn't fail the pipeline.
+            with hooks.computing_term(sma):
+                pass
+        finally:
+            done.set()
+            for thread in threads:
+                thread.join()
+
+        profile, = hooks.profiles()
+        self.assertIs(profile.term, sma)
+        self.assertIsNone(profile.start_date)
+        self.assertIsNone(profile.end_date)
+
+
+class HooksImplementationsTestCase(ZiplineTestCase):
+
+    def test_import_hooks(self):
+        # Hooks classes are checked against PipelineHooks when they're
+        # defined, so importing the package checks all of them.
+        hooks = importlib.import_module('zipline.pipeline.hooks')
+
+        for name in PipelineHooks._signatures:
+            self.assertTrue(callable(getattr(hooks.NoHooks, name)), name)
+            self.assertTrue(callable(getattr(TestingHooks, name)), name)
+
+    def test_testing_hooks_records_default_methods(self):
+        hooks = TestingHooks()
+        hooks.on_terms_stored([], {})
+        self.assertEqual(
+            hooks.trace,
+            [Call('on_terms_stored', ([], {}), {})],
+        )
+
+
 class TermReprTestCase(ZiplineTestCase):
 
     def test_htmlsafe_repr(self):
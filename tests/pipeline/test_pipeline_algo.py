@@ -1,12 +1,14 @@
 """
 Tests for Algorithms using the Pipeline API.
 """
+from itertools import chain, repeat
 from os.path import (
     dirname,
     join,
     realpath,
 )
 
+from mock import patch
 from nose_parameterized import parameterized
 import numpy as np
 from numpy import (
@@ -45,7 +47,8 @@ from zipline.finance.trading import SimulationParameters
 from zipline.lib.adjustment import MULTIPLY
 from zipline.pipeline import Pipeline, CustomFactor
 from zipline.pipeline.factors import VWAP
-from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.data import Column, DataSet, USEquityPricing
+from zipline.pipeline.domain import EquitySessionDomain, US_EQUITIES
 from zipline.pipeline.loaders.frame import DataFrameLoader
 from zipline.pipeline.loaders.equity_pricing_loader import (
     USEquityPricingLoader,
@@ -60,6 +63,7 @@ from zipline.testing.fixtures import (
     WithBcolzEquityDailyBarReaderFromCSVs,
     ZiplineTestCase,
 )
+from zipline.testing.predicates import assert_equal
 from zipline.utils.pandas_utils import normalize_date
 
 TEST_RESOURCE_PATH = join(
@@ -361,6 +365,64 @@ class ClosesAndVolumes(WithMakeAlgo, ZiplineTestCase):
         # Run for a week in the middle of our data.
         algo.run()
 
+    def test_memory_budget(self):
+        """
+        Assert that attaching a pipeline with a memory budget shortens its
+        chunks to fit the budget without changing its results.
+        """
+        max_days = 3
+
+        def initialize(context):
+            p = Pipeline()
+            p.add(USEquityPricing.close.latest, 'close')
+
+            # Budget for the estimated workspace of ``max_days`` sessions.
+            engine = context.engine
+            plan = p.to_execution_plan(
+                engine.resolve_domain(p),
+                engine._root_mask_term,
+                self.START_DATE,
+                self.END_DATE,
+            )
+            num_assets = len(
+                context.asset_finder.equities_sids_for_country_code('US'),
+            )
+            attach_pipeline(
+                p,
+                'test',
+                chunks=252,
+                max_memory_bytes=plan.estimate_nbytes(max_days, num_assets),
+            )
+
+        def handle_data(context, data):
+            results = pipeline_output('test')
+            date = get_datetime().normalize()
+            for asset in self.assets:
+                exists_today = self.exists(date, asset)
+                existed_yesterday = self.exists(date - self.trading_day, asset)
+                if exists_today and existed_yesterday:
+                    latest = results.loc[asset, 'close']
+                    self.assertEqual(latest, self.expected_close(date, asset))
+                else:
+                    self.assertNotIn(asset, results.index)
+
+        algo = self.make_algo(
+            initialize=initialize,
+            handle_data=handle_data,
+        )
+        # Eager pipelines are computed with run_pipelines.
+        engine = algo.engine
+        with patch.object(engine,
+                          'run_pipelines',
+                          wraps=engine.run_pipelines) as run_pipelines:
+            algo.run()
+
+        self.assertGreater(run_pipelines.call_count, 1)
+        sessions = self.trading_calendar.all_sessions
+        for (_, start, end), _ in run_pipelines.call_args_list:
+            num_days = sessions.get_loc(end) - sessions.get_loc(start) + 1
+            self.assertLessEqual(num_days, max_days)
+
     def test_multiple_pipelines(self):
         """
         Test that we can attach multiple pipelines and access the correct
@@ -407,6 +469,113 @@ class ClosesAndVolumes(WithMakeAlgo, ZiplineTestCase):
 
         algo.run()
 
+    def test_eager_pipelines_share_runs(self):
+        """
+        Test that eager pipelines computed together give the same results as
+        running each of them on its own.
+        """
+        def initialize(context):
+            close = USEquityPricing.close.latest
+
+            # The pipelines need a new chunk on the same day at the start of
+            # the simulation, and on different days after that.
+            context.pipes = {
+                'every_three_days': attach_pipeline(
+                    Pipeline({'close': close}),
+                    'every_three_days',
+                    chunks=2,
+                ),
+                'staggered': attach_pipeline(
+                    Pipeline({
+                        'close': close,
+                        'volume': USEquityPricing.volume.latest,
+                    }),
+                    'staggered',
+                    chunks=chain([2, 0], repeat(2)),
+                ),
+            }
+
+        def before_trading_start(context, data):
+            date = get_datetime().normalize()
+            for name, pipe in iteritems(context.pipes):
+                result = pipeline_output(name)
+                expected = context.engine.run_pipeline(pipe, date, date)
+                if len(expected):
+                    assert_equal(result, expected.loc[date])
+                else:
+                    self.assertEqual(len(result), 0)
+
+        algo = self.make_algo(
+            initialize=initialize,
+            before_trading_start=before_trading_start,
+        )
+        engine = algo.engine
+        with patch.object(engine,
+                          'run_pipelines',
+                          wraps=engine.run_pipelines) as run_pipelines:
+            algo.run()
+
+        names = [
+            sorted(pipelines)
+            for (pipelines, _, _), _ in run_pipelines.call_args_list
+        ]
+        self.assertIn(['every_three_days', 'staggered'], names)
+        self.assertIn(['staggered'], names)
+
+    def test_eager_pipelines_on_different_domains(self):
+        """
+        Test that eager pipelines on different domains are computed
+        separately.
+        """
+        class Closes(DataSet):
+            close = Column(float64)
+
+        domains = {
+            'us': US_EQUITIES,
+            'sessions': EquitySessionDomain(self.dates, 'US'),
+        }
+        loaders = {
+            Closes.close.specialize(domain): DataFrameLoader(
+                column=Closes.close.specialize(domain),
+                baseline=self.closes,
+            )
+            for domain in itervalues(domains)
+        }
+
+        def initialize(context):
+            context.pipes = {
+                name: attach_pipeline(
+                    Pipeline({'close': Closes.close.latest}, domain=domain),
+                    name,
+                    chunks=2,
+                )
+                for name, domain in iteritems(domains)
+            }
+
+        def before_trading_start(context, data):
+            date = get_datetime().normalize()
+            for name, pipe in iteritems(context.pipes):
+                result = pipeline_output(name)
+                expected = context.engine.run_pipeline(pipe, date, date)
+                if len(expected):
+                    assert_equal(result, expected.loc[date])
+                else:
+                    self.assertEqual(len(result), 0)
+
+        algo = self.make_algo(
+            initialize=initialize,
+            before_trading_start=before_trading_start,
+            get_pipeline_loader=loaders.__getitem__,
+        )
+        engine = algo.engine
+        with patch.object(engine,
+                          'run_pipelines',
+                          wraps=engine.run_pipelines) as run_pipelines:
+            algo.run()
+
+        for (pipelines, _, _), _ in run_pipelines.call_args_list:
+            self.assertEqual(len(pipelines), 1)
+
     def test_duplicate_pipeline_names(self):
         """
         Test that we raise an error when we try to attach a pipeline with a
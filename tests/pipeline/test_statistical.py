@@ -35,8 +35,11 @@ from zipline.pipeline.factors import (
     SimpleBeta,
 )
 from zipline.pipeline.factors.statistical import (
+    rankdata_columns,
     vectorized_beta,
+    vectorized_linregress,
     vectorized_pearson_r,
+    vectorized_spearman_r,
 )
 from zipline.pipeline.loaders.frame import DataFrameLoader
 from zipline.pipeline.sentinels import NotSpecified
@@ -1143,3 +1146,86 @@ class VectorizedCorrelationTestCase(zf.ZiplineTestCase):
         # array with the column tiled 3 times.
         do_check(_independent)
         do_check(np.tile(_independent, 3))
+
+    @parameter_space(seed=[1, 2, 42], broadcast=[True, False])
+    def test_spearman_matches_scipy(self, seed, broadcast):
+        rand = np.random.RandomState(seed)
+
+        # Draw from a small set of integers so that there are plenty of ties.
+        dependents = rand.randint(0, 5, (20, 10)).astype(float)
+        if broadcast:
+            independents = as_column(rand.randint(0, 5, 20).astype(float))
+        else:
+            independents = rand.randint(0, 5, (20, 10)).astype(float)
+
+        # Any missing data should produce nan.
+        dependents[3, 4] = np.nan
+
+        expected = self.naive_columnwise_spearman(
+            dependents,
+            np.broadcast_arrays(independents, dependents)[0],
+        )
+        expected[4] = np.nan
+
+        result = vectorized_spearman_r(dependents, independents)
+        assert_equal(result, expected, array_decimal=10)
+
+    def test_rankdata_columns(self):
+        data = np.array([[3.0, 1.0, 2.0],
+                         [1.0, 1.0, np.nan],
+                         [2.0, 5.0, 2.0],
+                         [3.0, 1.0, 0.0]])
+
+        expected = np.array([[3.5, 2.0, np.nan],
+                             [1.0, 2.0, np.nan],
+                             [2.0, 4.0, np.nan],
+                             [3.5, 2.0, np.nan]])
+        assert_equal(rankdata_columns(data), expected)
+
+
+class VectorizedLinregressTestCase(zf.ZiplineTestCase):
+
+    @parameter_space(seed=[1, 2, 42], broadcast=[True, False])
+    def test_matches_scipy(self, seed, broadcast):
+        rand = np.random.RandomState(seed)
+
+        if broadcast:
+            independents = as_column(rand.randn(20))
+        else:
+            independents = rand.randn(20, 10)
+        dependents = (
+            rand.uniform(-1, 1, 10) +
+            rand.uniform(-2, 2, 10) * independents +
+            rand.randn(20, 10)
+        )
+        dependents[5, 3] = np.nan
+
+        results = vectorized_linregress(dependents, independents)
+        independents = np.broadcast_arrays(independents, dependents)[0]
+        for col in range(dependents.shape[1]):
+            if col == 3:
+                for result in results:
+                    self.assertTrue(np.isnan(result[col]))
+                continue
+
+            slope, intercept, r_value, p_value, stderr = linregress(
+                x=independents[:, col],
+                y=dependents[:, col],
+            )
+            expected = intercept, slope, r_value, p_value, stderr
+            for result, value in zip(results, expected):
+                assert_equal(result[col], value, float_rtol=1e-10)
+
+    def test_perfect_fit(self):
+        independent = as_column(np.arange(10.0))
+        dependents = 1.0 + independent * [2.0, -0.5]
+
+        alpha, beta, r_value, p_value, stderr = vectorized_linregress(
+            dependents,
+            independent,
+        )
+        assert_equal(alpha, np.array([1.0, 1.0]), array_decimal=10)
+        assert_equal(beta, np.array([2.0, -0.5]), array_decimal=10)
+        assert_equal(r_value, np.array([1.0, -1.0]), array_decimal=10)
+        assert_equal(p_value, np.array([0.0, 0.0]), array_decimal=10)
+        assert_equal(stderr, np.array([0.0, 0.0]), array_decimal=10)
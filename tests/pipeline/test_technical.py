@@ -19,7 +19,9 @@ from zipline.pipeline.factors import (
     TrueRange,
     MovingAverageConvergenceDivergenceSignal,
     AnnualizedVolatility,
+    EWMA,
     RSI,
+    SimpleMovingAverage,
 )
 from zipline.testing import check_allclose, parameter_space
 from zipline.testing.fixtures import ZiplineTestCase
@@ -663,3 +665,55 @@ class AnnualizedVolatilityTestCase(ZiplineTestCase):
             expected_vol,
             decimal=8
         )
+
+
+class RollingComputeTestCase(ZiplineTestCase):
+    """
+    Tests for factors that implement compute_rolling_initial and
+    compute_rolling_update.
+    """
+    @parameterized.expand([
+        ('sma', SimpleMovingAverage(
+            inputs=[USEquityPricing.close],
+            window_length=10,
+        )),
+        ('ewma', EWMA(
+            inputs=[USEquityPricing.close],
+            window_length=10,
+            decay_rate=0.8,
+        )),
+        ('annualized_volatility', AnnualizedVolatility(window_length=10)),
+    ])
+    def test_rolling_matches_compute(self, name, factor):
+        rand = RandomState(5)
+        nassets = 4
+        data = rand.normal(loc=0.001, scale=0.01, size=(60, nassets))
+        data[rand.uniform(size=data.shape) < 0.2] = np.nan
+        # One asset with a long run of missing data, and one with an
+        # infinite value.
+        data[15:35, 0] = np.nan
+        data[20, 1] = np.inf
+
+        window_length = factor.window_length
+        num_days = len(data) - window_length + 1
+        dates = pd.date_range('2014', periods=num_days, tz='utc')
+        assets = np.arange(nassets)
+        mask = np.ones((num_days, nassets), dtype=bool)
+        mask[::3, 2] = False
+
+        expected = np.full((num_days, nassets), np.nan)
+        for i in range(num_days):
+            factor.compute(
+                dates[i],
+                assets,
+                expected[i],
+                data[i:i + window_length],
+                **factor.params
+            )
+        expected[~mask] = np.nan
+
+        windows = [
+            AdjustedArray(data, {}, np.nan).traverse(window_length),
+        ]
+        result = factor._compute(windows, dates, assets, mask)
+        check_allclose(result, expected, rtol=1e-10, atol=1e-15)
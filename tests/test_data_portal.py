@@ -14,6 +14,7 @@
 # limitations under the License.
 from collections import OrderedDict
 
+from mock import patch
 from numpy import array, append, nan, full
 from numpy.testing import assert_almost_equal
 import pandas as pd
@@ -398,6 +399,92 @@ class DataPortalTestBase(WithDataPortal,
         ]
         assert_almost_equal(expected.values.tolist(), result)
 
+    @parameter_space(data_frequency=['daily', 'minute'])
+    def test_get_spot_value_multiple_assets_matches_scalar(self,
+                                                           data_frequency):
+        assets = self.asset_finder.retrieve_all(
+            self.ASSET_FINDER_EQUITY_SIDS + (10000, 10001),
+        )
+        calendar = self.trading_calendars[Equity]
+        if data_frequency == 'daily':
+            dts = self.trading_days[:4]
+        else:
+            dts = [
+                minute
+                for session in self.trading_days[1:4]
+                for minute in calendar.minutes_for_session(session)[:3]
+            ]
+
+        for dt in dts:
+            for field in ['open', 'high', 'low', 'close', 'volume', 'price']:
+                expected = [
+                    self.data_portal.get_spot_value(
+                        asset, field, dt, data_frequency,
+                    )
+                    for asset in assets
+                ]
+                # Read the values again instead of serving them from the cache.
+                self.data_portal.clear_spot_value_cache()
+                result = self.data_portal.get_spot_value(
+                    assets, field, dt, data_frequency,
+                )
+                assert_almost_equal(
+                    result,
+                    expected,
+                    err_msg='dt={}; field={}'.format(dt, field),
+                )
+
+    @parameter_space(data_frequency=['daily', 'minute'])
+    def test_spot_value_cache(self, data_frequency):
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+        calendar = self.trading_calendars[Equity]
+        session = self.trading_days[2]
+        if data_frequency == 'daily':
+            dt, next_dt = session, self.trading_days[3]
+        else:
+            dt, next_dt = calendar.minutes_for_session(session)[:2]
+
+        data_portal = self.data_portal
+        reader = data_portal._get_pricing_reader(data_frequency)
+        data_portal.clear_spot_value_cache()
+        before = data_portal.spot_value_cache_info()
+
+        with patch.object(reader, 'get_values', wraps=reader.get_values) \
+                as get_values:
+            expected = data_portal.get_spot_value(
+                assets, 'close', dt, data_frequency,
+            )
+            for _ in range(3):
+                assert_equal(
+                    data_portal.get_spot_value(
+                        assets, 'close', dt, data_frequency,
+                    ),
+                    expected,
+                )
+                for asset, value in zip(assets, expected):
+                    assert_equal(
+                        data_portal.get_scalar_asset_spot_value(
+                            asset, 'close', dt, data_frequency,
+                        ),
+                        value,
+                    )
+            self.assertEqual(get_values.call_count, 1)
+
+            info = data_portal.spot_value_cache_info()
+            self.assertEqual(info.dt, dt)
+            self.assertEqual(info.size, len(assets))
+            self.assertEqual(info.misses - before.misses, len(assets))
+            self.assertEqual(info.hits - before.hits, 6 * len(assets))
+
+            # Moving to the next dt invalidates the cache.
+            data_portal.get_spot_value(
+                assets, 'close', next_dt, data_frequency,
+            )
+            self.assertEqual(get_values.call_count, 2)
+            info = data_portal.spot_value_cache_info()
+            self.assertEqual(info.dt, next_dt)
+            self.assertEqual(info.size, len(assets))
+
     @parameter_space(data_frequency=['daily', 'minute'],
                      field=['close', 'price'])
     def test_get_adjustments(self, data_frequency, field):
@@ -435,6 +522,42 @@ class DataPortalTestBase(WithDataPortal,
                                 err_msg="at dt={} perspective={}"
                                 .format(dt, perspective_dt))
 
+    @parameter_space(field=['close', 'volume'])
+    def test_get_adjustment_ratios(self, field):
+        assets = self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS)
+        day = self.trading_calendars[Equity].day
+        dividend_date = self.trading_days[2]
+
+        for dt, perspective_dt in [(dividend_date - day, dividend_date),
+                                   (dividend_date, dividend_date + day)]:
+            expected = [
+                self.data_portal.get_adjustments(
+                    asset, field, dt, perspective_dt,
+                )[0]
+                for asset in assets
+            ]
+            result = self.data_portal.get_adjustment_ratios(
+                assets, field, dt, perspective_dt,
+            )
+            assert_equal(result, array(expected))
+            assert_equal(
+                self.data_portal.get_adjustments(
+                    assets, field, dt, perspective_dt,
+                ),
+                expected,
+            )
+
+        # The dividend applies to prices only.
+        result = self.data_portal.get_adjustment_ratios(
+            assets, field, dividend_date - day, dividend_date,
+        )
+        expected_changed = field != 'volume'
+        for asset, ratio in zip(assets, result):
+            self.assertEqual(
+                ratio != 1.0,
+                expected_changed and asset.sid == self.DIVIDEND_ASSET_SID,
+            )
+
     def test_bar_count_for_simple_transforms(self):
         # July 2015
         # Su Mo Tu We Th Fr Sa
@@ -13,21 +13,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 from textwrap import dedent
 
+from mock import patch
 from nose_parameterized import parameterized
 import numpy as np
 from numpy import nan
 import pandas as pd
+from pandas.util.testing import assert_frame_equal
 from six import iteritems
 
 from zipline._protocol import handle_non_market_minutes, BarData
 from zipline.assets import Asset, Equity
+from zipline.data.history_loader import (
+    DailyHistoryLoader,
+    HistoryCompatibleUSEquityAdjustmentReader,
+)
 from zipline.errors import (
     HistoryInInitialize,
     HistoryWindowStartsBeforeData,
 )
 from zipline.finance.asset_restrictions import NoRestrictions
+from zipline.lib.adjustment import Float64Multiply
 from zipline.testing import (
     create_minute_df_for_asset,
     str_to_seconds,
@@ -1940,6 +1948,121 @@ class DailyEquityHistoryTestCase(WithHistory, zf.ZiplineTestCase):
             elif asset == self.MERGER_ASSET:
                 np.testing.assert_array_equal(window3_volume, [200, 300, 400])
 
+    def test_daily_history_windows_loaded_together(self):
+        assets = [self.SPLIT_ASSET, self.MERGER_ASSET, self.DIVIDEND_ASSET]
+        end = pd.Timestamp('2015-01-07', tz='UTC')
+        history_loader = self.data_portal._history_loader
+
+        with patch.object(history_loader,
+                          '_arrays',
+                          wraps=history_loader._arrays) as arrays:
+            windows = self.data_portal.get_history_windows(
+                assets, end, 3, '1d', ALL_FIELDS, 'daily',
+            )
+        # 'price' is read as 'close', so all fields are read at once.
+        self.assertEqual(arrays.call_count, 1)
+
+        self.assertEqual(set(windows), set(ALL_FIELDS))
+        for field in ALL_FIELDS:
+            expected = self.data_portal.get_history_window(
+                assets, end, 3, '1d', field, 'daily',
+            )
+            assert_frame_equal(windows[field], expected)
+
+    def test_daily_history_prefetched_in_background(self):
+        assets = [self.SPLIT_ASSET, self.DIVIDEND_ASSET]
+        sessions = self.trading_calendar.sessions_in_range(
+            pd.Timestamp('2015-01-02', tz='UTC'),
+            pd.Timestamp('2015-01-16', tz='UTC'),
+        )
+
+        def make_loader(pool):
+            return DailyHistoryLoader(
+                self.trading_calendar,
+                self.data_portal._get_pricing_reader('daily'),
+                self.adjustment_reader,
+                self.asset_finder,
+                prefetch_length=4,
+                prefetch_pool=pool,
+                prefetch_watermark=1,
+            )
+
+        pool = ThreadPool(1)
+        try:
+            loader = make_loader(pool)
+            expected_loader = make_loader(None)
+
+            def check(end_loc):
+                dts = sessions[end_loc - 2:end_loc + 1]
+                np.testing.assert_array_equal(
+                    loader.history(assets, dts, 'close', False),
+                    expected_loader.history(assets, dts, 'close', False),
+                )
+
+            with patch.object(loader,
+                              '_arrays',
+                              wraps=loader._arrays) as arrays:
+                # The first window reads through sessions[6], and the next
+                # block is read in the background once a session is left.
+                for end_loc in range(2, 6):
+                    check(end_loc)
+                # The pool has one thread, so this waits for that read.
+                pool.apply(int)
+                self.assertEqual(arrays.call_count, 2)
+
+                # The background block is used past the end of the first.
+                for end_loc in range(6, 8):
+                    check(end_loc)
+                self.assertEqual(arrays.call_count, 2)
+        finally:
+            pool.terminate()
+
+    def test_asset_pricing_adjustments(self):
+        reader = HistoryCompatibleUSEquityAdjustmentReader(
+            self.adjustment_reader,
+        )
+        assets = [
+            self.SPLIT_ASSET,
+            self.MERGER_ASSET,
+            self.DIVIDEND_ASSET,
+            self.ASSET1,
+        ]
+        dts = self.trading_calendar.sessions_in_range(
+            pd.Timestamp('2015-01-05', tz='UTC'),
+            pd.Timestamp('2015-01-09', tz='UTC'),
+        )
+        columns = ['close', 'volume']
+
+        def expected_adjustments(asset, tablenames, invert):
+            adjs = {}
+            for tablename in tablenames:
+                for dt, ratio in self.adjustment_reader.\
+                        get_adjustments_for_sid(tablename, asset.sid):
+                    if not dts[0] < dt <= dts[-1]:
+                        continue
+                    loc = dts.searchsorted(dt)
+                    adjs.setdefault(loc, []).append(Float64Multiply(
+                        0, loc - 1, 0, 0, 1.0 / ratio if invert else ratio,
+                    ))
+            return adjs
+
+        result = reader.load_asset_pricing_adjustments(columns, dts, assets)
+
+        self.assertEqual(len(result), len(assets))
+        for asset, (close_adjs, volume_adjs) in zip(assets, result):
+            self.assertEqual(
+                close_adjs,
+                expected_adjustments(
+                    asset, ['mergers', 'dividends', 'splits'], False,
+                ),
+            )
+            self.assertEqual(
+                volume_adjs,
+                expected_adjustments(asset, ['splits'], True),
+            )
+        self.assertTrue(result[0][0])
+        self.assertEqual(result[3], [{}, {}])
+
     def test_daily_dividends(self):
         # self.DIVIDEND_ASSET had dividends on 1/6 and 1/7
 
@@ -2,7 +2,13 @@ from unittest import TestCase
 
 from pandas import Timestamp, Timedelta
 
-from zipline.utils.cache import CachedObject, Expired, ExpiringCache
+from zipline.utils.cache import (
+    CachedObject,
+    CacheStats,
+    Expired,
+    ExpiringCache,
+    SizedLRUCache,
+)
 
 
 class CachedObjectTestCase(TestCase):
@@ -65,3 +71,51 @@ class ExpiringCacheTestCase(TestCase):
         with self.assertRaises(KeyError) as e:
             self.assertEqual(cache.get('baz', expiry_3))
         self.assertEqual(e.exception.args, ('baz',))
+
+
+class SizedLRUCacheTestCase(TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = SizedLRUCache(capacity=10)
+
+        cache.set('a', 1, size=4)
+        cache.set('b', 2, size=4)
+        # Reading 'a' makes 'b' the least recently used entry.
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3, size=4)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        with self.assertRaises(KeyError):
+            cache.get('b')
+
+        self.assertEqual(
+            cache.stats(),
+            CacheStats(
+                hits=1,
+                misses=1,
+                evictions=1,
+                entries=2,
+                size=8,
+                capacity=10,
+            ),
+        )
+
+    def test_replace_and_oversized_entries(self):
+        cache = SizedLRUCache(capacity=10)
+
+        cache.set('a', 1, size=4)
+        cache.set('a', 2, size=6)
+        self.assertEqual(cache.get('a'), 2)
+        self.assertEqual(cache.stats().size, 6)
+
+        # Entries that can never fit are dropped without evicting anything.
+        cache.set('b', 3, size=11)
+        self.assertNotIn('b', cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats().evictions, 0)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats().size, 0)
@@ -378,7 +378,30 @@ def zipline_magic(line, cell=None):
     default=True,
     help='Print progress information to the terminal.'
 )
-def ingest(bundle, assets_version, show_progress):
+@click.option(
+    '--bar-storage',
+    type=click.Choice(bundles_module.BAR_STORAGES),
+    default='bcolz',
+    show_default=True,
+    help='The format in which to store pricing data.',
+)
+@click.option(
+    '--daily-rollup/--no-daily-rollup',
+    default=False,
+    help='Resample the minute bars to daily bars after ingesting.',
+)
+@click.option(
+    '--incremental/--no-incremental',
+    default=False,
+    help='Append the sessions since the most recent ingestion to a copy of'
+         ' it instead of ingesting all sessions.',
+)
+def ingest(bundle,
+           assets_version,
+           show_progress,
+           bar_storage,
+           daily_rollup,
+           incremental):
     """Ingest the data for the given bundle.
     """
     bundles_module.ingest(
@@ -387,6 +410,9 @@ def ingest(bundle, assets_version, show_progress):
         pd.Timestamp.utcnow(),
         assets_version,
         show_progress,
+        bar_storage,
+        daily_rollup,
+        incremental,
     )
 
 
@@ -432,6 +458,34 @@ def clean(bundle, before, after, keep_last):
     )
 
 
+@main.command('mmap-daily-bars')
+@click.option(
+    '-b',
+    '--bundle',
+    default='quandl',
+    metavar='BUNDLE-NAME',
+    show_default=True,
+    help='The data bundle whose daily bars should be copied.',
+)
+@click.option(
+    '--shared-memory/--no-shared-memory',
+    default=False,
+    help='Publish the copy to POSIX shared memory instead of writing it to'
+         ' disk next to the bundle.',
+)
+def mmap_daily_bars(bundle, shared_memory):
+    """Write a memory-mapped copy of the most recent ingestion's daily bars.
+
+    Bundles loaded afterwards read their daily bars from the copy, so that
+    processes on the same host share one copy of the data.
+    """
+    bundles_module.mmap_daily_bars(
+        bundle,
+        os.environ,
+        shared_memory=shared_memory,
+    )
+
+
 @main.command()
 def bundles():
     """List all of the available data bundles.
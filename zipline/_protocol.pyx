@@ -382,15 +382,16 @@ cdef class BarData:
                 # assume assets is iterable
                 # return a Series indexed by asset
                 if not self._adjust_minutes:
-                    return pd.Series(data={
-                        asset: self.data_portal.get_spot_value(
-                                    asset,
-                                    field,
-                                    self._get_current_minute(),
-                                    self.data_frequency
-                               )
-                        for asset in assets
-                        }, index=assets, name=fields)
+                    return pd.Series(
+                        data=self.data_portal.get_spot_value(
+                            assets,
+                            field,
+                            self._get_current_minute(),
+                            self.data_frequency
+                        ),
+                        index=assets,
+                        name=fields,
+                    )
                 else:
                     return pd.Series(data={
                         asset: self.data_portal.get_adjusted_value(
@@ -409,15 +410,16 @@ cdef class BarData:
 
                 if not self._adjust_minutes:
                     for field in fields:
-                        series = pd.Series(data={
-                            asset: self.data_portal.get_spot_value(
-                                        asset,
-                                        field,
-                                        self._get_current_minute(),
-                                        self.data_frequency
-                                   )
-                            for asset in assets
-                            }, index=assets, name=field)
+                        series = pd.Series(
+                            data=self.data_portal.get_spot_value(
+                                assets,
+                                field,
+                                self._get_current_minute(),
+                                self.data_frequency
+                            ),
+                            index=assets,
+                            name=field,
+                        )
                         data[field] = series
                 else:
                     for field in fields:
@@ -702,19 +704,21 @@ cdef class BarData:
                 return df
         else:
             if isinstance(assets, PricingDataAssociable):
-                # one asset, multiple fields. for now, just make multiple
-                # history calls, one per field, then stitch together the
-                # results. this can definitely be optimized!
+                # one asset, multiple fields. the windows of all the fields
+                # are loaded together, then stitched together.
 
                 df_dict = {
-                    field: self.data_portal.get_history_window(
-                        [assets],
-                        self._get_current_minute(),
-                        bar_count,
-                        frequency,
-                        field,
-                        self.data_frequency,
-                    )[assets] for field in fields
+                    field: df[assets]
+                    for field, df in iteritems(
+                        self.data_portal.get_history_windows(
+                            [assets],
+                            self._get_current_minute(),
+                            bar_count,
+                            frequency,
+                            fields,
+                            self.data_frequency,
+                        )
+                    )
                 }
 
                 if self._adjust_minutes:
@@ -735,16 +739,14 @@ cdef class BarData:
                 return pd.DataFrame(df_dict)
 
             else:
-                df_dict = {
-                    field: self.data_portal.get_history_window(
-                        assets,
-                        self._get_current_minute(),
-                        bar_count,
-                        frequency,
-                        field,
-                        self.data_frequency,
-                    ) for field in fields
-                }
+                df_dict = self.data_portal.get_history_windows(
+                    assets,
+                    self._get_current_minute(),
+                    bar_count,
+                    frequency,
+                    fields,
+                    self.data_frequency,
+                )
 
                 if self._adjust_minutes:
                     adjs = {
@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections import Iterable, namedtuple
+from collections import Iterable, defaultdict, namedtuple
 from copy import copy
 import warnings
 from datetime import tzinfo, time
@@ -137,7 +137,10 @@ from zipline.zipline_warnings import ZiplineDeprecationWarning
 log = logbook.Logger("ZiplineLog")
 
 # For creating and storing pipeline instances
-AttachedPipeline = namedtuple('AttachedPipeline', 'pipe chunks eager')
+AttachedPipeline = namedtuple(
+    'AttachedPipeline',
+    'pipe chunks eager max_memory_bytes',
+)
 
 
 class TradingAlgorithm(object):
@@ -599,10 +602,28 @@ class TradingAlgorithm(object):
     def compute_eager_pipelines(self):
         """
         Compute any pipelines attached with eager=True.
+
+        Eager pipelines on the same domain that need a new chunk of the same
+        size on the same day are computed together, so terms they have in
+        common are only computed once.
         """
-        for name, pipe in self._pipelines.items():
-            if pipe.eager:
-                self.pipeline_output(name)
+        today = normalize_date(self.get_datetime())
+
+        expired = defaultdict(dict)
+        for name, attached in self._pipelines.items():
+            if not attached.eager:
+                continue
+            try:
+                self._pipeline_cache.get(name, today)
+            except KeyError:
+                chunksize = self._next_pipeline_chunksize(attached, today)
+                domain = self.engine.resolve_domain(attached.pipe)
+                expired[chunksize, domain][name] = attached.pipe
+
+        for (chunksize, _), pipes in expired.items():
+            results, valid_until = self.run_pipelines(pipes, today, chunksize)
+            for name, data in results.items():
+                self._pipeline_cache.set(name, data, valid_until)
 
     def get_generator(self):
         """
@@ -2233,8 +2254,14 @@ class TradingAlgorithm(object):
         pipeline=Pipeline,
         name=string_types,
         chunks=(int, Iterable, type(None)),
+        max_memory_bytes=(int, type(None)),
     )
-    def attach_pipeline(self, pipeline, name, chunks=None, eager=True):
+    def attach_pipeline(self,
+                        pipeline,
+                        name,
+                        chunks=None,
+                        eager=True,
+                        max_memory_bytes=None):
         """Register a pipeline to be computed at the start of each day.
 
         Parameters
@@ -2252,6 +2279,10 @@ class TradingAlgorithm(object):
         eager : bool, optional
             Whether or not to compute this pipeline prior to
             before_trading_start.
+        max_memory_bytes : int, optional
+            Memory budget for computing this pipeline. If provided, each
+            chunk is shortened until the estimated size of its workspace fits
+            in the budget.
 
         Returns
         -------
@@ -2272,7 +2303,12 @@ class TradingAlgorithm(object):
         if name in self._pipelines:
             raise DuplicatePipelineName(name=name)
 
-        self._pipelines[name] = AttachedPipeline(pipeline, iter(chunks), eager)
+        self._pipelines[name] = AttachedPipeline(
+            pipeline,
+            iter(chunks),
+            eager,
+            max_memory_bytes,
+        )
 
         # Return the pipeline to allow expressions like
         # p = attach_pipeline(Pipeline(), 'name')
@@ -2306,15 +2342,15 @@ class TradingAlgorithm(object):
         :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
         """
         try:
-            pipe, chunks, _ = self._pipelines[name]
+            attached = self._pipelines[name]
         except KeyError:
             raise NoSuchPipeline(
                 name=name,
                 valid=list(self._pipelines.keys()),
             )
-        return self._pipeline_output(pipe, chunks, name)
+        return self._pipeline_output(attached, name)
 
-    def _pipeline_output(self, pipeline, chunks, name):
+    def _pipeline_output(self, attached, name):
         """
         Internal implementation of `pipeline_output`.
         """
@@ -2324,7 +2360,9 @@ class TradingAlgorithm(object):
         except KeyError:
             # Calculate the next block.
             data, valid_until = self.run_pipeline(
-                pipeline, today, next(chunks),
+                attached.pipe,
+                today,
+                self._next_pipeline_chunksize(attached, today),
             )
             self._pipeline_cache.set(name, data, valid_until)
 
@@ -2336,6 +2374,26 @@ class TradingAlgorithm(object):
             # day.
             return pd.DataFrame(index=[], columns=data.columns)
 
+    def _next_pipeline_chunksize(self, attached, start_session):
+        """
+        Get the size of the next chunk of an attached pipeline starting at
+        ``start_session``, shortened to fit the pipeline's memory budget.
+        """
+        chunksize = next(attached.chunks)
+        if attached.max_memory_bytes is None:
+            return chunksize
+
+        # A chunk of size n computes the n sessions after its first session.
+        num_days = self.engine._chunksize_for_memory_budget(
+            attached.pipe,
+            self.engine.resolve_domain(attached.pipe),
+            start_session,
+            self.sim_params.end_session,
+            chunksize + 1,
+            attached.max_memory_bytes,
+        )
+        return num_days - 1
+
     def run_pipeline(self, pipeline, start_session, chunksize):
         """
         Compute `pipeline`, providing values for at least `start_date`.
@@ -2354,6 +2412,43 @@ class TradingAlgorithm(object):
         --------
         PipelineEngine.run_pipeline
         """
+        end_session = self._pipeline_end_session(start_session, chunksize)
+        return \
+            self.engine.run_pipeline(pipeline, start_session, end_session), \
+            end_session
+
+    def run_pipelines(self, pipelines, start_session, chunksize):
+        """
+        Compute each of ``pipelines``, providing values for at least
+        ``start_date``.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> Pipeline]
+            Map from name to pipeline to compute.
+        start_session : pd.Timestamp
+            The first session to compute.
+        chunksize : int
+            The number of sessions to compute after ``start_session``.
+
+        Returns
+        -------
+        (results, valid_until) : tuple (dict, pd.Timestamp)
+
+        See Also
+        --------
+        PipelineEngine.run_pipelines
+        """
+        end_session = self._pipeline_end_session(start_session, chunksize)
+        return \
+            self.engine.run_pipelines(pipelines, start_session, end_session), \
+            end_session
+
+    def _pipeline_end_session(self, start_session, chunksize):
+        """
+        Get the last session of a pipeline chunk starting at
+        ``start_session``.
+        """
         sessions = self.trading_calendar.all_sessions
 
         # Load data starting from the previous trading day...
@@ -2368,11 +2463,7 @@ class TradingAlgorithm(object):
             sessions.get_loc(sim_end_session)
         )
 
-        end_session = sessions[end_loc]
-
-        return \
-            self.engine.run_pipeline(pipeline, start_session, end_session), \
-            end_session
+        return sessions[end_loc]
 
     @staticmethod
     def default_pipeline_domain(calendar):
@@ -9,7 +9,7 @@ from zipline.utils.events import EventRule
 from zipline.utils.security_list import SecurityList
 
 
-def attach_pipeline(pipeline, name, chunks=None, eager=True):
+def attach_pipeline(pipeline, name, chunks=None, eager=True, max_memory_bytes=None):
     """Register a pipeline to be computed at the start of each day.
 
     Parameters
@@ -27,6 +27,10 @@ def attach_pipeline(pipeline, name, chunks=None, eager=True):
     eager : bool, optional
         Whether or not to compute this pipeline prior to
         before_trading_start.
+    max_memory_bytes : int, optional
+        Memory budget for computing this pipeline. If provided, each
+        chunk is shortened until the estimated size of its workspace fits
+        in the budget.
 
     Returns
     -------
@@ -129,6 +129,7 @@ class SQLiteAdjustmentReader(object):
     @preprocess(conn=coerce_string_to_conn(require_exists=True))
     def __init__(self, conn):
         self.conn = conn
+        self._ratio_tables = {}
 
     def __enter__(self):
         return self
@@ -218,6 +219,42 @@ class SQLiteAdjustmentReader(object):
                 for adjustment in
                 adjustments_for_sid]
 
+    def get_ratio_table(self, table_name):
+        """
+        Get the ratios of the splits, mergers or dividends table, read once
+        and indexed by sid for lookups of many sids at once.
+
+        Parameters
+        ----------
+        table_name : {'splits', 'mergers', 'dividends'}
+            The table to read.
+
+        Returns
+        -------
+        ratios : AdjustmentRatios
+            The ratios of the table.
+        """
+        try:
+            return self._ratio_tables[table_name]
+        except KeyError:
+            pass
+
+        if table_name not in SQLITE_ADJUSTMENT_TABLENAMES:
+            raise ValueError(
+                "Requested table %s has no ratios.\n"
+                "Available tables: %s\n" % (
+                    table_name,
+                    sorted(SQLITE_ADJUSTMENT_TABLENAMES),
+                )
+            )
+        frame = self.get_df_from_table(table_name)
+        ratios = self._ratio_tables[table_name] = AdjustmentRatios(
+            frame['sid'].values,
+            frame['effective_date'].values,
+            frame['ratio'].values,
+        )
+        return ratios
+
     def get_dividends_with_ex_date(self, assets, date, asset_finder):
         seconds = date.value / int(1e9)
         c = self.conn.cursor()
@@ -335,6 +372,100 @@ class SQLiteAdjustmentReader(object):
         return out
 
 
+class AdjustmentRatios(object):
+    """
+    The ratios of one of the splits, mergers or dividends tables, sorted by
+    sid and effective date so that the ratios of many sids over a range of
+    dates are found with one search.
+
+    Parameters
+    ----------
+    sids : np.array[int64]
+        The sid of each ratio.
+    effective_dates : np.array[int64]
+        The effective date of each ratio, in seconds since the epoch.
+    ratios : np.array[float64]
+        The ratios.
+    """
+    def __init__(self, sids, effective_dates, ratios):
+        effective_dates = np.asarray(effective_dates, dtype=int64_dtype)
+        # Rows are keyed by their sid in the high bits and their effective
+        # date in the low 32 bits, so one sorted array orders both.
+        keys = (np.asarray(sids, dtype=int64_dtype) << 32) + effective_dates
+        # A stable sort keeps the ratios of a sid and date in table order.
+        order = keys.argsort(kind='mergesort')
+        self._keys = keys[order]
+        self.effective_dates = effective_dates[order]
+        self.ratios = np.asarray(ratios, dtype=float64_dtype)[order]
+
+    def rows_in_range(self, sids, start, end):
+        """
+        Find the ratios of ``sids`` effective after ``start`` and on or before
+        ``end``.
+
+        Parameters
+        ----------
+        sids : np.array[int64]
+            The sids whose ratios to find.
+        start : int
+            The exclusive start of the range, in seconds since the epoch.
+        end : int
+            The inclusive end of the range, in seconds since the epoch.
+
+        Returns
+        -------
+        owners : np.array[int64]
+            The index into ``sids`` of each ratio found.
+        rows : np.array[int64]
+            The index into ``effective_dates`` and ``ratios`` of each ratio
+            found, earliest first for each sid.
+        """
+        base = np.asarray(sids, dtype=int64_dtype) << 32
+        lo = self._keys.searchsorted(base + start, side='right')
+        hi = self._keys.searchsorted(base + end, side='right')
+
+        counts = hi - lo
+        owners = np.repeat(np.arange(len(base)), counts)
+        rows = (
+            np.arange(counts.sum()) +
+            np.repeat(lo - (counts.cumsum() - counts), counts)
+        )
+        return owners, rows
+
+    def products(self, sids, start, end, invert=False, out=None):
+        """
+        Multiply the ratios of each of ``sids`` effective after ``start`` and
+        on or before ``end``.
+
+        Parameters
+        ----------
+        sids : np.array[int64]
+            The sids whose ratios to multiply.
+        start : int
+            The exclusive start of the range, in seconds since the epoch.
+        end : int
+            The inclusive end of the range, in seconds since the epoch.
+        invert : bool, optional
+            Multiply the reciprocals of the ratios instead.
+        out : np.array[float64], optional
+            The products to multiply the ratios into. Defaults to ones.
+
+        Returns
+        -------
+        out : np.array[float64]
+            The product of each sid's ratios.
+        """
+        if out is None:
+            out = np.ones(len(sids), dtype=float64_dtype)
+        owners, rows = self.rows_in_range(sids, start, end)
+        if len(rows):
+            ratios = self.ratios[rows]
+            if invert:
+                ratios = 1.0 / ratios
+            np.multiply.at(out, owners, ratios)
+        return out
+
+
 class SQLiteAdjustmentWriter(object):
     """
     Writer for data to be read by SQLiteAdjustmentReader
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod, abstractproperty
+
+import numpy as np
 from six import with_metaclass
 
 
@@ -125,6 +127,34 @@ class BarReader(with_metaclass(ABCMeta, object)):
         """
         pass
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of one field for many assets at the same dt.
+
+        Parameters
+        ----------
+        sids : list[int]
+            The asset identifiers.
+        dt : pd.Timestamp
+            The timestamp for the desired data points.
+        field : string
+            The OHLVC name for the desired data points.
+
+        Returns
+        -------
+        values : np.ndarray[float64]
+            The value for each of ``sids``, as ``get_value`` would return it.
+            Entries for which ``get_value`` would raise ``NoDataOnDate`` or
+            ``NoDataForSid`` are nan.
+        """
+        out = np.full(len(sids), np.nan)
+        for i, sid in enumerate(sids):
+            try:
+                out[i] = self.get_value(sid, dt, field)
+            except (NoDataOnDate, NoDataForSid):
+                pass
+        return out
+
     @abstractmethod
     def get_last_traded_dt(self, asset, dt):
         """
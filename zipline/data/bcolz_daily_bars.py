@@ -129,6 +129,12 @@ class BcolzDailyBarWriter(object):
         Midnight UTC session label.
     end_session: pd.Timestamp
         Midnight UTC session label.
+    append_to : BcolzDailyBarReader, optional
+        Existing daily bars to extend. Written tables hold the rows of
+        ``append_to`` followed by the rows of the data passed to ``write``,
+        which must begin after each asset's last existing row. Sessions
+        between the two are filled with zeros. ``append_to`` must not read
+        from ``filename``.
 
     See Also
     --------
@@ -142,7 +148,12 @@ class BcolzDailyBarWriter(object):
         'volume': float64_dtype,
     }
 
-    def __init__(self, filename, calendar, start_session, end_session):
+    def __init__(self,
+                 filename,
+                 calendar,
+                 start_session,
+                 end_session,
+                 append_to=None):
         self._filename = filename
 
         if start_session != end_session:
@@ -155,10 +166,19 @@ class BcolzDailyBarWriter(object):
                     "End session %s is invalid!" % end_session
                 )
 
+        if append_to is not None and (
+                append_to.sessions[0] < start_session or
+                append_to.trading_calendar.name != calendar.name):
+            raise ValueError(
+                'Can only append to daily bars on calendar %r starting on or '
+                'after %s.' % (calendar.name, start_session)
+            )
+
         self._start_session = start_session
         self._end_session = end_session
 
         self._calendar = calendar
+        self._append_to = append_to
 
     @property
     def progress_bar_message(self):
@@ -193,11 +213,17 @@ class BcolzDailyBarWriter(object):
         table : bcolz.ctable
             The newly-written table.
         """
+        tables = (
+            (sid, self.to_ctable(df, invalid_data_behavior))
+            for sid, df in data
+        )
+        if self._append_to is not None:
+            tables = self._append(tables)
+            if assets is not None:
+                assets = set(assets).union(self._append_to._first_rows)
+
         ctx = maybe_show_progress(
-            (
-                (sid, self.to_ctable(df, invalid_data_behavior))
-                for sid, df in data
-            ),
+            tables,
             show_progress=show_progress,
             item_show_func=self.progress_bar_item_show_func,
             label=self.progress_bar_message,
@@ -236,6 +262,70 @@ class BcolzDailyBarWriter(object):
             invalid_data_behavior=invalid_data_behavior,
         )
 
+    def _append(self, iterator):
+        """
+        Prepend the rows of ``self._append_to`` to the tables in
+        ``iterator``, and add the assets that only have existing rows.
+        """
+        existing = self._append_to
+        first_rows = existing._first_rows
+        last_rows = existing._last_rows
+        columns = [
+            existing._table[name]
+            for name in US_EQUITY_PRICING_BCOLZ_COLUMNS[:-1]
+        ]
+        names = US_EQUITY_PRICING_BCOLZ_COLUMNS[:-1]
+
+        def existing_rows(asset_id):
+            start = first_rows[asset_id]
+            stop = last_rows[asset_id] + 1
+            return [column[start:stop] for column in columns]
+
+        seen = set()
+        for asset_id, table in iterator:
+            seen.add(asset_id)
+            if asset_id not in first_rows:
+                yield asset_id, table
+                continue
+            if not len(table):
+                yield asset_id, ctable(
+                    columns=existing_rows(asset_id),
+                    names=list(names),
+                )
+                continue
+
+            old = existing_rows(asset_id)
+            old_last_day = Timestamp(old[-1][-1], unit='s', tz='UTC')
+            new_first_day = Timestamp(table['day'][0], unit='s', tz='UTC')
+            if new_first_day <= old_last_day:
+                raise ValueError(
+                    'Data for sid %d starting on %s overlaps existing data'
+                    ' ending on %s.' % (
+                        asset_id, new_first_day.date(), old_last_day.date(),
+                    )
+                )
+
+            gap = self._calendar.sessions_in_range(
+                old_last_day,
+                new_first_day,
+            )[1:-1]
+            fill = [np.zeros(len(gap), dtype=uint32_dtype)] * 5 + [
+                (gap.asi8 // 10 ** 9).astype(uint32_dtype),
+            ]
+            yield asset_id, ctable(
+                columns=[
+                    np.concatenate([o, f, table[name][:]])
+                    for o, f, name in zip(old, fill, names)
+                ],
+                names=list(names),
+            )
+
+        for asset_id in sorted(viewkeys(first_rows) - seen):
+            yield asset_id, ctable(
+                columns=existing_rows(asset_id),
+                names=list(names),
+            )
+
     def _write_internal(self, iterator, assets):
         """
         Internal implementation of write.
@@ -516,6 +606,20 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
         except KeyError:
             return None
 
+    @lazyval
+    def last_written_session(self):
+        """The last session with a row for any asset, or NaT if the table
+        has no rows.
+        """
+        if not self._last_rows:
+            return NaT
+        days = self._table['day']
+        return Timestamp(
+            max(days[row] for row in self._last_rows.values()),
+            unit='s',
+            tz='UTC',
+        )
+
     @lazyval
     def trading_calendar(self):
         if 'calendar_name' in self._table.attrs.attrs:
@@ -705,6 +809,48 @@ class BcolzDailyBarReader(CurrencyAwareSessionBarReader):
         else:
             return price
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of one field for many assets on the same day.
+
+        The rows for all of ``sids`` are gathered from the column in a single
+        read.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        out = full(len(sids), nan)
+        try:
+            day_loc = self.sessions.get_loc(dt)
+        except Exception:
+            return out
+
+        first_rows = self._first_rows
+        last_rows = self._last_rows
+        calendar_offsets = self._calendar_offsets
+
+        positions = []
+        rows = []
+        for i, sid in enumerate(sids):
+            sid = int(sid)
+            try:
+                first_row = first_rows[sid]
+            except KeyError:
+                continue
+            ix = first_row + day_loc - calendar_offsets[sid]
+            if first_row <= ix <= last_rows[sid]:
+                positions.append(i)
+                rows.append(ix)
+
+        if rows:
+            values = self._spot_col(field)[array(rows)].astype(float64_dtype)
+            if field != 'volume':
+                values[values == 0] = nan
+                values *= 0.001
+            out[positions] = values
+        return out
+
     def currency_codes(self, sids):
         # XXX: This is pretty inefficient. This reader doesn't really support
         # country codes, so we always either return USD or None if we don't
@@ -3,6 +3,7 @@ from . import quandl  # noqa
 from . import csvdir  # noqa
 
 from .core import (
+    BAR_STORAGES,
     UnknownBundle,
     bundles,
     clean,
@@ -10,6 +11,7 @@ from .core import (
     ingest,
     ingestions_for_bundle,
     load,
+    mmap_daily_bars,
     register,
     to_bundle_ingest_dirname,
     unregister,
@@ -17,6 +19,7 @@ from .core import (
 
 
 __all__ = [
+    'BAR_STORAGES',
     'UnknownBundle',
     'bundles',
     'clean',
@@ -24,6 +27,7 @@ __all__ = [
     'ingest',
     'ingestions_for_bundle',
     'load',
+    'mmap_daily_bars',
     'register',
     'to_bundle_ingest_dirname',
     'unregister',
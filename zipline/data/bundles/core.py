@@ -1,6 +1,8 @@
 from collections import namedtuple
 import errno
+import hashlib
 import os
+import re
 import shutil
 import warnings
 
@@ -13,10 +15,34 @@ from toolz import curry, complement, take
 
 from ..adjustments import SQLiteAdjustmentReader, SQLiteAdjustmentWriter
 from ..bcolz_daily_bars import BcolzDailyBarReader, BcolzDailyBarWriter
+from ..mmap_daily_bars import (
+    MmapDailyBarReader,
+    MmapDailyBarWriter,
+    is_mmap_daily_bar_dir,
+)
+from ..shared_daily_bars import (
+    SharedMemoryDailyBarReader,
+    is_published,
+    publish_daily_bars,
+    unlink_daily_bars,
+)
 from ..minute_bars import (
     BcolzMinuteBarReader,
     BcolzMinuteBarWriter,
 )
+from ..parquet_bars import (
+    ParquetDailyBarReader,
+    ParquetDailyBarWriter,
+    ParquetMinuteBarReader,
+    ParquetMinuteBarWriter,
+    is_parquet_bar_dir,
+)
+from ..resample import (
+    DAILY_ROLLUP_DIRNAME,
+    daily_rollup_path,
+    daily_rollup_reader,
+    write_daily_rollup,
+)
 from zipline.assets import AssetDBWriter, AssetFinder, ASSET_DB_VERSION
 from zipline.assets.asset_db_migrations import downgrade
 from zipline.utils.cache import (
@@ -25,12 +51,19 @@ from zipline.utils.cache import (
     working_file,
 )
 from zipline.utils.compat import mappingproxy
-from zipline.utils.input_validation import ensure_timestamp, optionally
+from zipline.utils.input_validation import (
+    ensure_timestamp,
+    expect_element,
+    optionally,
+)
 import zipline.utils.paths as pth
 from zipline.utils.preprocess import preprocess
 
 log = Logger(__name__)
 
+# The formats in which ``ingest`` can store a bundle's pricing data.
+BAR_STORAGES = ('bcolz', 'parquet')
+
 
 def asset_db_path(bundle_name, timestr, environ=None, db_version=None):
     return pth.data_path(
@@ -53,6 +86,27 @@ def daily_equity_path(bundle_name, timestr, environ=None):
     )
 
 
+def daily_equity_parquet_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        daily_equity_parquet_relative(bundle_name, timestr),
+        environ=environ,
+    )
+
+
+def minute_equity_parquet_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        minute_equity_parquet_relative(bundle_name, timestr),
+        environ=environ,
+    )
+
+
+def daily_equity_mmap_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        daily_equity_mmap_relative(bundle_name, timestr),
+        environ=environ,
+    )
+
+
 def adjustment_db_path(bundle_name, timestr, environ=None):
     return pth.data_path(
         adjustment_db_relative(bundle_name, timestr),
@@ -67,6 +121,36 @@ def cache_path(bundle_name, environ=None):
     )
 
 
+def shared_daily_bars_name(bundle_name, timestr, environ=None):
+    """Get the name under which an ingestion's daily bars are published to
+    shared memory.
+
+    Shared memory is global to the host, so the name includes a hash of the
+    ingestion's absolute path to keep the same bundle and ingestion time in
+    different zipline roots apart.
+    """
+    timestr = os.path.basename(timestr)
+    root = os.path.abspath(
+        pth.data_path([bundle_name, timestr], environ=environ),
+    )
+    return '{}-{}-{}'.format(
+        bundle_name,
+        timestr,
+        hashlib.sha1(root.encode('utf-8')).hexdigest()[:8],
+    )
+
+
+def shared_memory_dir(environ=None):
+    """Get the directory that daily bars are published to.
+
+    This is ``$ZIPLINE_SHM_DIR`` if it is set, otherwise None, meaning the
+    host's shared memory filesystem.
+    """
+    if environ is None:
+        environ = os.environ
+    return environ.get('ZIPLINE_SHM_DIR')
+
+
 def adjustment_db_relative(bundle_name, timestr):
     return bundle_name, timestr, 'adjustments.sqlite'
 
@@ -79,6 +163,18 @@ def daily_equity_relative(bundle_name, timestr):
     return bundle_name, timestr, 'daily_equities.bcolz'
 
 
+def daily_equity_parquet_relative(bundle_name, timestr):
+    return bundle_name, timestr, 'daily_equities.parquet'
+
+
+def minute_equity_parquet_relative(bundle_name, timestr):
+    return bundle_name, timestr, 'minute_equities.parquet'
+
+
+def daily_equity_mmap_relative(bundle_name, timestr):
+    return bundle_name, timestr, 'daily_equities.mmap'
+
+
 def minute_equity_relative(bundle_name, timestr):
     return bundle_name, timestr, 'minute_equities.bcolz'
 
@@ -131,6 +227,58 @@ def ingestions_for_bundle(bundle, environ=None):
     )
 
 
+_BCOLZ_CHUNK_RE = re.compile(r'^__(\d+)\.blp$')
+
+
+def _copy_minute_bars_for_append(src, dst):
+    """Copy the bcolz minute bars in ``src`` to ``dst`` so that they can be
+    appended to without changing ``src``.
+
+    Appending to a bcolz carray never rewrites its full chunks, so those are
+    hard linked where the filesystem allows it. The last chunk of each carray
+    holds the leftover rows that appends rewrite in place, so it is copied,
+    along with the metadata. Rolled up daily bars are not copied.
+    """
+    for dirpath, dirnames, filenames in os.walk(src):
+        if dirpath == src and DAILY_ROLLUP_DIRNAME in dirnames:
+            dirnames.remove(DAILY_ROLLUP_DIRNAME)
+
+        target = os.path.join(dst, os.path.relpath(dirpath, src))
+        pth.ensure_directory(target)
+
+        linkable = set()
+        if os.path.basename(dirpath) == 'data':
+            chunks = sorted(
+                (f for f in filenames if _BCOLZ_CHUNK_RE.match(f)),
+                key=lambda f: int(_BCOLZ_CHUNK_RE.match(f).group(1)),
+            )
+            linkable.update(chunks[:-1])
+
+        for filename in filenames:
+            src_path = os.path.join(dirpath, filename)
+            dst_path = os.path.join(target, filename)
+            if filename in linkable:
+                try:
+                    os.link(src_path, dst_path)
+                    continue
+                except OSError:
+                    # Different filesystems, or no hard link support.
+                    pass
+            shutil.copy2(src_path, dst_path)
+
+
+def _last_ingested_session(daily_bar_reader, minute_bar_writer, sids):
+    """The last session with daily or minute bars in an ingestion, or NaT
+    if it has no bars.
+    """
+    sessions = [daily_bar_reader.last_written_session]
+    sessions.extend(
+        minute_bar_writer.last_date_in_output_for_sid(sid) for sid in sids
+    )
+    sessions = [session for session in sessions if not pd.isnull(session)]
+    return max(sessions) if sessions else pd.NaT
+
+
 RegisteredBundle = namedtuple(
     'RegisteredBundle',
     ['calendar_name',
@@ -149,7 +297,7 @@ BundleData = namedtuple(
 
 BundleCore = namedtuple(
     'BundleCore',
-    'bundles register unregister ingest load clean',
+    'bundles register unregister ingest load clean mmap_daily_bars',
 )
 
 
@@ -334,11 +482,15 @@ def _make_bundle_core():
         except KeyError:
             raise UnknownBundle(name)
 
+    @expect_element(bar_storage=BAR_STORAGES)
     def ingest(name,
                environ=os.environ,
                timestamp=None,
                assets_versions=(),
-               show_progress=False):
+               show_progress=False,
+               bar_storage='bcolz',
+               daily_rollup=False,
+               incremental=False):
         """Ingest data for a given bundle.
 
         Parameters
@@ -354,12 +506,49 @@ def _make_bundle_core():
             Versions of the assets db to which to downgrade.
         show_progress : bool, optional
             Tell the ingest function to display the progress where possible.
+        bar_storage : {'bcolz', 'parquet'}, optional
+            The format in which to store the bundle's pricing data. 'parquet'
+            keeps the bars in a few partitioned Parquet files instead of many
+            bcolz directories, and requires pyarrow.
+        daily_rollup : bool, optional
+            Resample the bundle's equity minute bars to session bars once
+            the bundle has been ingested, and store them with the minute
+            bars. ``load`` then serves the daily bars from the rollup instead
+            of any daily bars written by the bundle. This is meant for
+            bundles with only minute data.
+        incremental : bool, optional
+            Extend the most recent ingestion instead of ingesting the full
+            history. The bundle's ingest function is called with a
+            ``start_session`` just after the last session of the previous
+            ingestion, and should only write bars and adjustments from that
+            session on; they are appended to copies of the previous bars and
+            adjustments. The bundle should still write all of its assets, but
+            the previous asset db is kept if it writes none. Only bcolz bar
+            storage can be ingested incrementally. Without a previous
+            ingestion this is a full ingest.
         """
         try:
             bundle = bundles[name]
         except KeyError:
             raise UnknownBundle(name)
 
+        if daily_rollup and not bundle.create_writers:
+            raise ValueError(
+                'Need to ingest a bundle that creates writers in order to '
+                'roll up its minute bars.'
+            )
+
+        if incremental:
+            if not bundle.create_writers:
+                raise ValueError(
+                    'Need to ingest a bundle that creates writers in order to '
+                    'ingest incrementally.'
+                )
+            if bar_storage != 'bcolz':
+                raise ValueError(
+                    'Only bcolz bar storage can be ingested incrementally.'
+                )
+
         calendar = get_calendar(bundle.calendar_name)
 
         start_session = bundle.start_session
@@ -375,6 +564,50 @@ def _make_bundle_core():
             timestamp = pd.Timestamp.utcnow()
         timestamp = timestamp.tz_convert('utc').tz_localize(None)
 
+        # The sessions the bundle's ingest function is asked to write.
+        ingest_start_session = start_session
+
+        previous = None
+        if incremental:
+            try:
+                previous = most_recent_data(name, timestamp, environ=environ)
+            except ValueError:
+                log.info(
+                    "No previous ingestion of {}, ingesting all sessions.",
+                    name,
+                )
+
+        if previous is not None:
+            if is_parquet_bar_dir(
+                    minute_equity_parquet_path(name, previous,
+                                               environ=environ)):
+                raise ValueError(
+                    'Only bcolz bar storage can be ingested incrementally.'
+                )
+            previous_daily_bar_reader = BcolzDailyBarReader(
+                daily_equity_path(name, previous, environ=environ),
+            )
+            last_session = _last_ingested_session(
+                previous_daily_bar_reader,
+                BcolzMinuteBarWriter.open(
+                    minute_equity_path(name, previous, environ=environ),
+                ),
+                AssetFinder(
+                    asset_db_path(name, previous, environ=environ),
+                ).sids,
+            )
+            if not pd.isnull(last_session):
+                if last_session >= end_session:
+                    log.info(
+                        "{} is up to date through {}.",
+                        name,
+                        last_session.date(),
+                    )
+                    return
+                ingest_start_session = calendar.next_session_label(
+                    last_session,
+                )
+
         timestr = to_bundle_ingest_dirname(timestamp)
         cachepath = cache_path(name, environ=environ)
         pth.ensure_directory(pth.data_path([name, timestr], environ=environ))
@@ -387,36 +620,97 @@ def _make_bundle_core():
                 wd = stack.enter_context(working_dir(
                     pth.data_path([], environ=environ))
                 )
-                daily_bars_path = wd.ensure_dir(
-                    *daily_equity_relative(name, timestr)
-                )
-                daily_bar_writer = BcolzDailyBarWriter(
-                    daily_bars_path,
-                    calendar,
-                    start_session,
-                    end_session,
-                )
-                # Do an empty write to ensure that the daily ctables exist
+                if bar_storage == 'parquet':
+                    daily_bars_path = wd.ensure_dir(
+                        *daily_equity_parquet_relative(name, timestr)
+                    )
+                    daily_bar_writer = ParquetDailyBarWriter(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                    )
+                    minute_bars_path = wd.ensure_dir(
+                        *minute_equity_parquet_relative(name, timestr)
+                    )
+                    minute_bar_writer = ParquetMinuteBarWriter(
+                        minute_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                    )
+                    daily_bar_reader_type = ParquetDailyBarReader
+                    minute_bar_reader_type = ParquetMinuteBarReader
+                elif previous is not None:
+                    # Append to copies of the previous ingestion's bars.
+                    daily_bars_path = wd.ensure_dir(
+                        *daily_equity_relative(name, timestr)
+                    )
+                    daily_bar_writer = BcolzDailyBarWriter(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        append_to=previous_daily_bar_reader,
+                    )
+                    minute_bars_path = wd.ensure_dir(
+                        *minute_equity_relative(name, timestr)
+                    )
+                    _copy_minute_bars_for_append(
+                        minute_equity_path(name, previous, environ=environ),
+                        minute_bars_path,
+                    )
+                    minute_bar_writer = BcolzMinuteBarWriter.open(
+                        minute_bars_path,
+                        end_session=end_session,
+                    )
+                    daily_bar_reader_type = BcolzDailyBarReader
+                    minute_bar_reader_type = BcolzMinuteBarReader
+                else:
+                    daily_bars_path = wd.ensure_dir(
+                        *daily_equity_relative(name, timestr)
+                    )
+                    daily_bar_writer = BcolzDailyBarWriter(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                    )
+                    minute_bars_path = wd.ensure_dir(
+                        *minute_equity_relative(name, timestr)
+                    )
+                    minute_bar_writer = BcolzMinuteBarWriter(
+                        minute_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        minutes_per_day=bundle.minutes_per_day,
+                    )
+                    daily_bar_reader_type = BcolzDailyBarReader
+                    minute_bar_reader_type = BcolzMinuteBarReader
+
+                # Do an empty write to ensure that the daily bars exist
                 # when we create the SQLiteAdjustmentWriter below. The
-                # SQLiteAdjustmentWriter needs to open the daily ctables so
+                # SQLiteAdjustmentWriter needs to open the daily bars so
                 # that it can compute the adjustment ratios for the dividends.
-
                 daily_bar_writer.write(())
-                minute_bar_writer = BcolzMinuteBarWriter(
-                    wd.ensure_dir(*minute_equity_relative(name, timestr)),
-                    calendar,
-                    start_session,
-                    end_session,
-                    minutes_per_day=bundle.minutes_per_day,
-                )
                 assets_db_path = wd.getpath(*asset_db_relative(name, timestr))
                 asset_db_writer = AssetDBWriter(assets_db_path)
 
+                adjustments_path = wd.getpath(
+                    *adjustment_db_relative(name, timestr)
+                )
+                if previous is not None:
+                    # New adjustments are appended to the previous ones.
+                    shutil.copy2(
+                        adjustment_db_path(name, previous, environ=environ),
+                        adjustments_path,
+                    )
                 adjustment_db_writer = stack.enter_context(
                     SQLiteAdjustmentWriter(
-                        wd.getpath(*adjustment_db_relative(name, timestr)),
-                        BcolzDailyBarReader(daily_bars_path),
-                        overwrite=True,
+                        adjustments_path,
+                        daily_bar_reader_type(daily_bars_path),
+                        overwrite=previous is None,
                     )
                 )
             else:
@@ -436,13 +730,27 @@ def _make_bundle_core():
                 daily_bar_writer,
                 adjustment_db_writer,
                 calendar,
-                start_session,
+                ingest_start_session,
                 end_session,
                 cache,
                 show_progress,
                 pth.data_path([name, timestr], environ=environ),
             )
 
+            if previous is not None and not os.path.exists(assets_db_path):
+                shutil.copy2(
+                    asset_db_path(name, previous, environ=environ),
+                    assets_db_path,
+                )
+
+            if daily_rollup:
+                log.info("Rolling up minute bars for {}.", name)
+                write_daily_rollup(
+                    minute_bar_reader_type(minute_bars_path),
+                    AssetFinder(assets_db_path).equities_sids,
+                    show_progress=show_progress,
+                )
+
             for version in sorted(set(assets_versions), reverse=True):
                 version_path = wd.getpath(*asset_db_relative(
                     name, timestr, db_version=version,
@@ -511,21 +819,123 @@ def _make_bundle_core():
         if timestamp is None:
             timestamp = pd.Timestamp.utcnow()
         timestr = most_recent_data(name, timestamp, environ=environ)
+
+        minute_parquet_path = minute_equity_parquet_path(
+            name, timestr, environ=environ,
+        )
+        if is_parquet_bar_dir(minute_parquet_path):
+            equity_minute_bar_reader = ParquetMinuteBarReader(
+                minute_parquet_path,
+            )
+        else:
+            equity_minute_bar_reader = BcolzMinuteBarReader(
+                minute_equity_path(name, timestr, environ=environ),
+            )
+
+        # Prefer a memory-mapped copy of the daily bars, in shared memory or
+        # on disk, if one has been written with ``$ zipline mmap-daily-bars``.
+        # Otherwise, prefer daily bars rolled up from the minute bars at
+        # ingest.
+        shared_name = shared_daily_bars_name(name, timestr, environ=environ)
+        shm_dir = shared_memory_dir(environ)
+        mmap_path = daily_equity_mmap_path(name, timestr, environ=environ)
+        daily_parquet_path = daily_equity_parquet_path(
+            name, timestr, environ=environ,
+        )
+        rollup = daily_rollup_reader(equity_minute_bar_reader)
+        if is_published(shared_name, shm_dir):
+            equity_daily_bar_reader = SharedMemoryDailyBarReader(
+                shared_name,
+                shm_dir,
+            )
+        elif is_mmap_daily_bar_dir(mmap_path):
+            equity_daily_bar_reader = MmapDailyBarReader(mmap_path)
+        elif rollup is not None:
+            equity_daily_bar_reader = rollup
+        elif is_parquet_bar_dir(daily_parquet_path):
+            equity_daily_bar_reader = ParquetDailyBarReader(daily_parquet_path)
+        else:
+            equity_daily_bar_reader = BcolzDailyBarReader(
+                daily_equity_path(name, timestr, environ=environ),
+            )
+
         return BundleData(
             asset_finder=AssetFinder(
                 asset_db_path(name, timestr, environ=environ),
             ),
-            equity_minute_bar_reader=BcolzMinuteBarReader(
-                minute_equity_path(name, timestr, environ=environ),
-            ),
-            equity_daily_bar_reader=BcolzDailyBarReader(
-                daily_equity_path(name, timestr, environ=environ),
-            ),
+            equity_minute_bar_reader=equity_minute_bar_reader,
+            equity_daily_bar_reader=equity_daily_bar_reader,
             adjustment_reader=SQLiteAdjustmentReader(
                 adjustment_db_path(name, timestr, environ=environ),
             ),
         )
 
+    def mmap_daily_bars(name,
+                        environ=os.environ,
+                        timestamp=None,
+                        shared_memory=False):
+        """Write a memory-mapped copy of the daily equity bars of a previously
+        ingested bundle.
+
+        Once the copy exists, ``load`` reads the bundle's daily bars from it
+        with a :class:`~zipline.data.mmap_daily_bars.MmapDailyBarReader`, so
+        that processes loading the same bundle share one copy of the data in
+        the OS page cache.
+
+        Parameters
+        ----------
+        name : str
+            The name of the bundle.
+        environ : mapping, optional
+            The environment variables. Defaults of os.environ.
+        timestamp : datetime, optional
+            The timestamp of the data to lookup.
+            Defaults to the current time.
+        shared_memory : bool, optional
+            Publish the copy to POSIX shared memory instead of writing it
+            next to the bundle. Shared copies are read with a
+            :class:`~zipline.data.shared_daily_bars.SharedMemoryDailyBarReader`
+            and last until the ingestion is cleaned or the host restarts.
+            They are published to ``$ZIPLINE_SHM_DIR`` if it is set.
+
+        Returns
+        -------
+        reader : MmapDailyBarReader
+            A reader for the newly written copy.
+        """
+        if timestamp is None:
+            timestamp = pd.Timestamp.utcnow()
+        timestr = most_recent_data(name, timestamp, environ=environ)
+        # Daily bars rolled up from the minute bars take precedence, as
+        # they do in ``load``.
+        candidates = [
+            daily_rollup_path(minute_equity_path(
+                name, timestr, environ=environ,
+            )),
+            daily_rollup_path(minute_equity_parquet_path(
+                name, timestr, environ=environ,
+            )),
+        ]
+        daily_path = next(
+            (p for p in candidates if os.path.isdir(p)),
+            daily_equity_path(name, timestr, environ=environ),
+        )
+        if not os.path.isdir(daily_path):
+            raise ValueError(
+                'memory-mapped daily bars can only be made from bcolz daily '
+                'bars, and bundle {!r} has none at {}'.format(name, timestr),
+            )
+        if shared_memory:
+            return publish_daily_bars(
+                shared_daily_bars_name(name, timestr, environ=environ),
+                daily_path,
+                shared_memory_dir(environ),
+            )
+        writer = MmapDailyBarWriter(
+            daily_equity_mmap_path(name, timestr, environ=environ),
+        )
+        return writer.write_from_bcolz(daily_path)
+
     @preprocess(
         before=optionally(ensure_timestamp),
         after=optionally(ensure_timestamp),
@@ -605,11 +1015,29 @@ def _make_bundle_core():
                 log.info("Cleaning {}.", run)
                 path = pth.data_path([name, run], environ=environ)
                 shutil.rmtree(path)
+                unlink_daily_bars(
+                    shared_daily_bars_name(name, run, environ=environ),
+                    shared_memory_dir(environ),
+                )
                 cleaned.add(path)
 
         return cleaned
 
-    return BundleCore(bundles, register, unregister, ingest, load, clean)
+    return BundleCore(
+        bundles,
+        register,
+        unregister,
+        ingest,
+        load,
+        clean,
+        mmap_daily_bars,
+    )
 
 
-bundles, register, unregister, ingest, load, clean = _make_bundle_core()
+(bundles,
+ register,
+ unregister,
+ ingest,
+ load,
+ clean,
+ mmap_daily_bars) = _make_bundle_core()
@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from operator import mul
+from collections import namedtuple
 
 from logbook import Logger
 
@@ -21,7 +21,6 @@ from numpy import float64, int64, nan
 import pandas as pd
 from pandas import isnull
 from six import iteritems
-from six.moves import reduce
 
 from zipline.assets import (
     Asset,
@@ -45,8 +44,10 @@ from zipline.data.dispatch_bar_reader import (
 )
 from zipline.data.resample import (
     DailyHistoryAggregator,
+    MinuteResampleSessionBarReader,
     ReindexMinuteBarReader,
     ReindexSessionBarReader,
+    daily_rollup_reader,
 )
 from zipline.data.history_loader import (
     DailyHistoryLoader,
@@ -96,6 +97,11 @@ DEFAULT_DAILY_HISTORY_PREFETCH = 40
 _DEF_M_HIST_PREFETCH = DEFAULT_MINUTE_HISTORY_PREFETCH
 _DEF_D_HIST_PREFETCH = DEFAULT_DAILY_HISTORY_PREFETCH
 
+SpotValueCacheInfo = namedtuple(
+    'SpotValueCacheInfo',
+    ['dt', 'hits', 'misses', 'size'],
+)
+
 
 class DataPortal(object):
     """Interface to all of the data that a zipline simulation needs.
@@ -117,6 +123,10 @@ class DataPortal(object):
         daily data backtests or daily history calls in a minute backetest.
         If a daily bar reader is not provided but a minute bar reader is,
         the minutes will be rolled up to serve the daily requests.
+        If the minute bars have a rollup written by
+        :func:`~zipline.data.resample.write_daily_rollup`, it is used instead
+        of a missing reader or a
+        :class:`~zipline.data.resample.MinuteResampleSessionBarReader`.
     equity_minute_reader : BcolzMinuteBarReader, optional
         The minute bar reader for equities. This will be used to service
         minute data backtests or minute history calls. This can be used
@@ -126,6 +136,7 @@ class DataPortal(object):
         daily data backtests or daily history calls in a minute backetest.
         If a daily bar reader is not provided but a minute bar reader is,
         the minutes will be rolled up to serve the daily requests.
+        As for equities, a rollup of the minute bars is preferred.
     future_minute_reader : BcolzFutureMinuteBarReader, optional
         The minute bar reader for futures. This will be used to service
         minute data backtests or minute history calls. This can be used
@@ -137,6 +148,18 @@ class DataPortal(object):
         The last session to make available in session-level data.
     last_available_minute : pd.Timestamp, optional
         The last minute to make available in minute-level data.
+    minute_history_prefetch_length : int, optional
+        The number of minutes to read past the end of a minute history window
+        when it is loaded.
+    daily_history_prefetch_length : int, optional
+        The number of sessions to read past the end of a daily history window
+        when it is loaded.
+    history_prefetch_pool : Pool, optional
+        A pool, such as a :class:`multiprocessing.pool.ThreadPool`, on which
+        to read the next prefetched block of history for the assets of a
+        window before the current block runs out. The readers must be safe to
+        use from the pool's threads, as the bcolz readers are. If not
+        provided, history is only read when a window runs out.
     """
     def __init__(self,
                  asset_finder,
@@ -150,7 +173,8 @@ class DataPortal(object):
                  last_available_session=None,
                  last_available_minute=None,
                  minute_history_prefetch_length=_DEF_M_HIST_PREFETCH,
-                 daily_history_prefetch_length=_DEF_D_HIST_PREFETCH):
+                 daily_history_prefetch_length=_DEF_D_HIST_PREFETCH,
+                 history_prefetch_pool=None):
 
         self.trading_calendar = trading_calendar
 
@@ -158,17 +182,29 @@ class DataPortal(object):
 
         self._adjustment_reader = adjustment_reader
 
-        # caches of sid -> adjustment list
-        self._splits_dict = {}
-        self._mergers_dict = {}
-        self._dividends_dict = {}
-
         # Handle extra sources, like Fetcher.
         self._augmented_sources_map = {}
         self._extra_source_df = None
 
+        # The spot values looked up at _spot_value_dt, keyed by
+        # (asset, field, data_frequency). Cleared whenever values are looked
+        # up at another dt.
+        self._spot_value_dt = None
+        self._spot_values = {}
+        self._spot_value_hits = 0
+        self._spot_value_misses = 0
+
         self._first_available_session = first_trading_day
 
+        equity_daily_reader = self._prefer_daily_rollup(
+            equity_daily_reader,
+            equity_minute_reader,
+        )
+        future_daily_reader = self._prefer_daily_rollup(
+            future_daily_reader,
+            future_minute_reader,
+        )
+
         if last_available_session:
             self._last_available_session = last_available_session
         else:
@@ -271,6 +307,7 @@ class DataPortal(object):
             self.asset_finder,
             self._roll_finders,
             prefetch_length=daily_history_prefetch_length,
+            prefetch_pool=history_prefetch_pool,
         )
         self._minute_history_loader = MinuteHistoryLoader(
             self.trading_calendar,
@@ -279,6 +316,7 @@ class DataPortal(object):
             self.asset_finder,
             self._roll_finders,
             prefetch_length=minute_history_prefetch_length,
+            prefetch_pool=history_prefetch_pool,
         )
 
         self._first_trading_day = first_trading_day
@@ -297,6 +335,23 @@ class DataPortal(object):
             if self._first_trading_day is not None else None
         )
 
+    @staticmethod
+    def _prefer_daily_rollup(daily_reader, minute_reader):
+        """Replace ``daily_reader`` with the rollup of ``minute_reader``, if
+        ``daily_reader`` is missing or would resample the same minutes on
+        every call.
+        """
+        if minute_reader is None:
+            return daily_reader
+        if daily_reader is not None and not isinstance(
+                daily_reader, MinuteResampleSessionBarReader):
+            return daily_reader
+
+        rollup = daily_rollup_reader(minute_reader)
+        if rollup is None:
+            return daily_reader
+        return rollup
+
     def _ensure_reader_aligned(self, reader):
         if reader is None:
             return
@@ -392,6 +447,8 @@ class DataPortal(object):
             extra_source_df = extra_source_df.append(df)
 
         self._extra_source_df = extra_source_df
+        # Extra source values may have been cached as missing.
+        self.clear_spot_value_cache()
 
     def _get_pricing_reader(self, data_frequency):
         return self._pricing_readers[data_frequency]
@@ -428,12 +485,76 @@ class DataPortal(object):
         except KeyError:
             return np.NaN
 
+    def _spot_values_at(self, dt):
+        """
+        The cache of spot values looked up at ``dt``.
+        """
+        try:
+            is_new_dt = dt != self._spot_value_dt
+        except TypeError:
+            # A tz-naive dt can't be compared with a tz-aware one.
+            is_new_dt = True
+        if is_new_dt:
+            self._spot_value_dt = dt
+            self._spot_values = {}
+        return self._spot_values
+
+    def spot_value_cache_info(self):
+        """
+        Statistics of the spot value cache, which keeps the values looked up
+        at the most recent dt so that the many lookups of the same asset and
+        field within a bar read them once.
+
+        Returns
+        -------
+        info : SpotValueCacheInfo
+            The dt of the cached values, the number of lookups served from and
+            missing the cache since the data portal was created, and the
+            number of values cached.
+        """
+        return SpotValueCacheInfo(
+            self._spot_value_dt,
+            self._spot_value_hits,
+            self._spot_value_misses,
+            len(self._spot_values),
+        )
+
+    def clear_spot_value_cache(self):
+        """
+        Forget the cached spot values, e.g. after the underlying data changed.
+        """
+        self._spot_value_dt = None
+        self._spot_values = {}
+
     def _get_single_asset_value(self,
                                 session_label,
                                 asset,
                                 field,
                                 dt,
                                 data_frequency):
+        spot_values = self._spot_values_at(dt)
+        key = asset, field, data_frequency
+        try:
+            value = spot_values[key]
+        except KeyError:
+            self._spot_value_misses += 1
+            value = spot_values[key] = self._read_single_asset_value(
+                session_label,
+                asset,
+                field,
+                dt,
+                data_frequency,
+            )
+        else:
+            self._spot_value_hits += 1
+        return value
+
+    def _read_single_asset_value(self,
+                                 session_label,
+                                 asset,
+                                 field,
+                                 dt,
+                                 data_frequency):
         if self._is_extra_source(
                 asset, field, self._augmented_sources_map):
             return self._get_fetcher_value(asset, field, dt)
@@ -523,6 +644,14 @@ class DataPortal(object):
                 dt,
                 data_frequency,
             )
+        elif field in OHLCVP_FIELDS:
+            return self._get_spot_values(
+                session_label,
+                list(assets),
+                field,
+                dt,
+                data_frequency,
+            )
         else:
             get_single_asset_value = self._get_single_asset_value
             return [
@@ -536,6 +665,75 @@ class DataPortal(object):
                 for asset in assets
             ]
 
+    def _get_spot_values(self,
+                         session_label,
+                         assets,
+                         field,
+                         dt,
+                         data_frequency):
+        """
+        Get the spot value of an OHLCV or price field for many assets.
+
+        The assets that are alive at ``dt`` are read from the pricing reader
+        in one batch. Values the batch can't provide (e.g. a price that needs
+        to be forward filled) are looked up one asset at a time. Values
+        already in the spot value cache are not read again.
+        """
+        get_single_asset_value = self._get_single_asset_value
+        spot_values = self._spot_values_at(dt)
+
+        out = [None] * len(assets)
+        batch_positions = []
+        for i, asset in enumerate(assets):
+            try:
+                out[i] = spot_values[asset, field, data_frequency]
+            except KeyError:
+                pass
+            else:
+                self._spot_value_hits += 1
+                continue
+
+            if (isinstance(asset, Asset) and
+                    asset.start_date <= dt and
+                    session_label <= asset.end_date):
+                batch_positions.append(i)
+            else:
+                out[i] = get_single_asset_value(
+                    session_label,
+                    asset,
+                    field,
+                    dt,
+                    data_frequency,
+                )
+
+        if not batch_positions:
+            return out
+
+        values = self._get_pricing_reader(data_frequency).get_values(
+            [assets[i].sid for i in batch_positions],
+            session_label if data_frequency == 'daily' else dt,
+            'close' if field == 'price' else field,
+        )
+        missing = np.isnan(values)
+        for i, value, is_missing in zip(batch_positions,
+                                        values.tolist(),
+                                        missing.tolist()):
+            if is_missing:
+                out[i] = get_single_asset_value(
+                    session_label,
+                    assets[i],
+                    field,
+                    dt,
+                    data_frequency,
+                )
+            else:
+                if field == 'volume':
+                    value = int(value)
+                out[i] = spot_values[assets[i], field, data_frequency] = value
+                self._spot_value_misses += 1
+
+        return out
+
     def get_scalar_asset_spot_value(self, asset, field, dt, data_frequency):
         """
         Public API method that returns a scalar value representing the value
@@ -594,48 +792,57 @@ class DataPortal(object):
         adjustments : list[Adjustment]
             The adjustments to that field.
         """
+        return self.get_adjustment_ratios(
+            assets, field, dt, perspective_dt,
+        ).tolist()
+
+    def get_adjustment_ratios(self, assets, field, dt, perspective_dt):
+        """
+        Returns the ratio by which to multiply the value of each of the given
+        assets at dt to adjust it for the splits, mergers and dividends
+        between dt and perspective_dt.
+
+        The ratios of all the assets are found together from the adjustment
+        tables, read once and indexed by sid.
+
+        Parameters
+        ----------
+        assets : list of type Asset, or Asset
+            The asset, or assets whose adjustment ratios are desired.
+        field : {'open', 'high', 'low', 'close', 'volume', \
+                 'price', 'last_traded'}
+            The desired field of the asset.
+        dt : pd.Timestamp
+            The timestamp for the desired value.
+        perspective_dt : pd.Timestamp
+            The timestamp from which the data is being viewed back from.
+
+        Returns
+        -------
+        ratios : np.array[float64]
+            The adjustment ratio of each asset.
+        """
         if isinstance(assets, Asset):
             assets = [assets]
 
-        adjustment_ratios_per_asset = []
+        out = np.ones(len(assets), dtype=float64)
+        if self._adjustment_reader is None or not len(assets):
+            return out
 
-        def split_adj_factor(x):
-            return x if field != 'volume' else 1.0 / x
+        sids = np.array([int(asset) for asset in assets], dtype=int64)
+        # The adjustments db stores dates as seconds since the epoch.
+        start = dt.value // 10 ** 9
+        end = perspective_dt.value // 10 ** 9
 
-        for asset in assets:
-            adjustments_for_asset = []
-            split_adjustments = self._get_adjustment_list(
-                asset, self._splits_dict, "SPLITS"
-            )
-            for adj_dt, adj in split_adjustments:
-                if dt < adj_dt <= perspective_dt:
-                    adjustments_for_asset.append(split_adj_factor(adj))
-                elif adj_dt > perspective_dt:
-                    break
-
-            if field != 'volume':
-                merger_adjustments = self._get_adjustment_list(
-                    asset, self._mergers_dict, "MERGERS"
-                )
-                for adj_dt, adj in merger_adjustments:
-                    if dt < adj_dt <= perspective_dt:
-                        adjustments_for_asset.append(adj)
-                    elif adj_dt > perspective_dt:
-                        break
-
-                dividend_adjustments = self._get_adjustment_list(
-                    asset, self._dividends_dict, "DIVIDENDS",
+        self._adjustment_reader.get_ratio_table('splits').products(
+            sids, start, end, invert=field == 'volume', out=out,
+        )
+        if field != 'volume':
+            for table_name in ('mergers', 'dividends'):
+                self._adjustment_reader.get_ratio_table(table_name).products(
+                    sids, start, end, out=out,
                 )
-                for adj_dt, adj in dividend_adjustments:
-                    if dt < adj_dt <= perspective_dt:
-                        adjustments_for_asset.append(adj)
-                    elif adj_dt > perspective_dt:
-                        break
-
-            ratio = reduce(mul, adjustments_for_asset, 1.0)
-            adjustment_ratios_per_asset.append(ratio)
-
-        return adjustment_ratios_per_asset
+        return out
 
     def get_adjusted_value(self, asset, field, dt,
                            perspective_dt,
@@ -683,7 +890,9 @@ class DataPortal(object):
                                                  data_frequency)
 
         if isinstance(asset, Equity):
-            ratio = self.get_adjustments(asset, field, dt, perspective_dt)[0]
+            ratio = self.get_adjustment_ratios(
+                asset, field, dt, perspective_dt,
+            )[0]
             spot_value *= ratio
 
         return spot_value
@@ -1033,6 +1242,51 @@ class DataPortal(object):
                     df.loc[normed_index > asset.end_date, asset] = nan
         return df
 
+    def get_history_windows(self,
+                            assets,
+                            end_dt,
+                            bar_count,
+                            frequency,
+                            fields,
+                            data_frequency,
+                            ffill=True):
+        """
+        Public API method that returns dataframes containing the requested
+        history windows of several fields, as ``get_history_window`` would
+        for each of them.
+
+        The windows of all of ``fields`` are loaded together, with one read
+        of pricing data and one lookup of adjustments per asset.
+
+        Parameters
+        ----------
+        fields : iterable[str]
+            The desired fields of the assets.
+
+        See ``get_history_window`` for the other parameters.
+
+        Returns
+        -------
+        A dict of field to a dataframe containing the requested data.
+        """
+        loader_fields = {
+            'close' if field == 'price' else field for field in fields
+        }
+        with self._history_loader.load_together(loader_fields), \
+                self._minute_history_loader.load_together(loader_fields):
+            return {
+                field: self.get_history_window(
+                    assets,
+                    end_dt,
+                    bar_count,
+                    frequency,
+                    field,
+                    data_frequency,
+                    ffill,
+                )
+                for field in fields
+            }
+
     def _get_minute_window_data(self, assets, field, minutes_for_window):
         """
         Internal method that gets a window of adjusted minute data for an asset
@@ -1121,40 +1375,6 @@ class DataPortal(object):
                 return_array[:len(data)] = data
         return return_array
 
-    def _get_adjustment_list(self, asset, adjustments_dict, table_name):
-        """
-        Internal method that returns a list of adjustments for the given sid.
-
-        Parameters
-        ----------
-        asset : Asset
-            The asset for which to return adjustments.
-
-        adjustments_dict: dict
-            A dictionary of sid -> list that is used as a cache.
-
-        table_name: string
-            The table that contains this data in the adjustments db.
-
-        Returns
-        -------
-        adjustments: list
-            A list of [multiplier, pd.Timestamp], earliest first
-
-        """
-        if self._adjustment_reader is None:
-            return []
-
-        sid = int(asset)
-
-        try:
-            adjustments = adjustments_dict[sid]
-        except KeyError:
-            adjustments = adjustments_dict[sid] = self._adjustment_reader.\
-                get_adjustments_for_sid(table_name, sid)
-
-        return adjustments
-
     def get_splits(self, assets, dt):
         """
         Returns any splits for the given sids and the given dt.
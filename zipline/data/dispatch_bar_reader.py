@@ -96,11 +96,7 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
         r = self._readers[type(asset)]
         return r.get_value(asset, dt, field)
 
-    def get_last_traded_dt(self, asset, dt):
-        r = self._readers[type(asset)]
-        return r.get_last_traded_dt(asset, dt)
-
-    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+    def _group_by_asset_type(self, sids):
         asset_types = self._asset_types
         sid_groups = {t: [] for t in asset_types}
         out_pos = {t: [] for t in asset_types}
@@ -112,6 +108,28 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
             sid_groups[t].append(asset)
             out_pos[t].append(i)
 
+        return sid_groups, out_pos
+
+    def get_values(self, sids, dt, field):
+        asset_types = self._asset_types
+        sid_groups, out_pos = self._group_by_asset_type(sids)
+
+        out = full(len(sids), nan)
+        for t in asset_types:
+            if sid_groups[t]:
+                out[out_pos[t]] = self._readers[t].get_values(
+                    sid_groups[t], dt, field,
+                )
+        return out
+
+    def get_last_traded_dt(self, asset, dt):
+        r = self._readers[type(asset)]
+        return r.get_last_traded_dt(asset, dt)
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        asset_types = self._asset_types
+        sid_groups, out_pos = self._group_by_asset_type(sids)
+
         batched_arrays = {
             t: self._readers[t].load_raw_arrays(fields,
                                                 start_dt,
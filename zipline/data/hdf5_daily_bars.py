@@ -147,6 +147,11 @@ START_DATE = 'start_date'
 END_DATE = 'end_date'
 
 
+# Number of slots in the chunk cache of each dataset, if the cache is
+# configured. HDF5 recommends a prime number about 100 times the number of
+# chunks that fit in the cache.
+DEFAULT_CHUNK_CACHE_SLOTS = 10007
+
 # XXX is reserved for "transactions involving no currency".
 MISSING_CURRENCY = 'XXX'
 
@@ -490,15 +495,66 @@ def convert_price_with_scaling_factor(a, scaling_factor):
     return np.where(zeroes, np.nan, a.astype('float64')) * conversion_factor
 
 
+def _open_dataset(group, name, chunk_cache_bytes, chunk_cache_slots):
+    """Open the dataset ``name`` in ``group`` with its own raw data chunk
+    cache of ``chunk_cache_bytes`` bytes.
+    """
+    dapl = h5py.h5p.create(h5py.h5p.DATASET_ACCESS)
+    # 0.75 is HDF5's default preemption policy.
+    dapl.set_chunk_cache(chunk_cache_slots, chunk_cache_bytes, 0.75)
+    return h5py.Dataset(
+        h5py.h5d.open(group.id, name.encode('ascii'), dapl=dapl),
+    )
+
+
+def _coalesce(indices):
+    """Group sorted, unique ``indices`` into runs of consecutive values.
+
+    Returns
+    -------
+    runs : list[slice]
+        Slices covering ``indices``, in order.
+    """
+    if not len(indices):
+        return []
+    breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+    starts = np.r_[indices[0], indices[breaks]]
+    stops = np.r_[indices[breaks - 1], indices[-1]] + 1
+    return [slice(int(start), int(stop)) for start, stop in zip(starts, stops)]
+
+
 class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
     """
     Parameters
     ---------
     country_group : h5py.Group
         The group for a single country in an HDF5 daily pricing file.
+    chunk_cache_bytes : int, optional
+        Size of the raw data chunk cache of each field's dataset. Chunks hold
+        every sid for a range of dates, so the cache should fit the chunks of
+        a typical window to avoid decompressing them for every run of sids
+        read. If not provided, HDF5's default cache size is used, and the
+        rows between the first and last requested sid are read at once.
+    chunk_cache_slots : int, optional
+        Number of hash table slots in each dataset's chunk cache. Ignored if
+        ``chunk_cache_bytes`` is not provided.
+    pool : Pool, optional
+        Pool used by ``load_raw_arrays`` to read fields concurrently. This
+        object must support ``map``, and is normally a
+        :class:`multiprocessing.pool.ThreadPool`. h5py lets one thread into
+        HDF5 at a time, so the pool overlaps reads with the conversion of
+        their results. If not provided, fields are read serially.
     """
-    def __init__(self, country_group):
+    def __init__(self,
+                 country_group,
+                 chunk_cache_bytes=None,
+                 chunk_cache_slots=DEFAULT_CHUNK_CACHE_SLOTS,
+                 pool=None):
         self._country_group = country_group
+        self._chunk_cache_bytes = chunk_cache_bytes
+        self._chunk_cache_slots = chunk_cache_slots
+        self._pool = pool
+        self._datasets = {}
 
         self._postprocessors = {
             OPEN: partial(convert_price_with_scaling_factor,
@@ -513,7 +569,7 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
         }
 
     @classmethod
-    def from_file(cls, h5_file, country_code):
+    def from_file(cls, h5_file, country_code, **kwargs):
         """
         Construct from an h5py.File and a country code.
 
@@ -523,6 +579,8 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
             An HDF5 daily pricing file.
         country_code : str
             The ISO 3166 alpha-2 country code for the country to read.
+        **kwargs
+            Forwarded to :class:`HDF5DailyBarReader`.
         """
         if h5_file.attrs['version'] != VERSION:
             raise ValueError(
@@ -532,10 +590,10 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
                 ),
             )
 
-        return cls(h5_file[country_code])
+        return cls(h5_file[country_code], **kwargs)
 
     @classmethod
-    def from_path(cls, path, country_code):
+    def from_path(cls, path, country_code, **kwargs):
         """
         Construct from a file path and a country code.
 
@@ -545,12 +603,33 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
             The path to an HDF5 daily pricing file.
         country_code : str
             The ISO 3166 alpha-2 country code for the country to read.
+        **kwargs
+            Forwarded to :class:`HDF5DailyBarReader`.
         """
-        return cls.from_file(h5py.File(path), country_code)
+        return cls.from_file(h5py.File(path), country_code, **kwargs)
 
     def _read_scaling_factor(self, field):
         return self._country_group[DATA][field].attrs[SCALING_FACTOR]
 
+    def _dataset(self, field):
+        """Get the dataset for ``field``, opening it on first use.
+        """
+        try:
+            return self._datasets[field]
+        except KeyError:
+            data_group = self._country_group[DATA]
+            if self._chunk_cache_bytes is None:
+                dataset = data_group[field]
+            else:
+                dataset = _open_dataset(
+                    data_group,
+                    field,
+                    self._chunk_cache_bytes,
+                    self._chunk_cache_slots,
+                )
+            self._datasets[field] = dataset
+            return dataset
+
     def load_raw_arrays(self,
                         columns,
                         start_date,
@@ -583,41 +662,60 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
         date_slice = self._compute_date_range_slice(start, end)
         n_dates = date_slice.stop - date_slice.start
 
-        # Create a buffer into which we'll read data from the h5 file.
-        # Allocate an extra row of space that will always contain null values.
-        # We'll use that space to provide "data" for entries in ``assets`` that
-        # are unknown to us.
-        full_buf = np.zeros((len(self.sids) + 1, n_dates), dtype=np.uint32)
-        # We'll only read values into this portion of the read buf.
-        mutable_buf = full_buf[:-1]
-
         # Indexer that converts an array aligned to self.sids (which is what we
         # pull from the h5 file) into an array aligned to ``assets``.
         #
         # Unknown assets will have an index of -1, which means they'll always
-        # pull from the last row of the read buffer. We allocated an extra
-        # empty row above so that these lookups will cause us to fill our
-        # output buffer with "null" values.
+        # pull from the last row of the read buffer. We allocate an extra
+        # empty row for that below, so that these lookups will cause us to
+        # fill our output buffer with "null" values.
         sid_selector = self._make_sid_selector(assets)
 
-        out = []
-        for column in columns:
-            # Zero the buffer to prepare to receive new data.
-            mutable_buf.fill(0)
-
-            dataset = self._country_group[DATA][column]
-
-            # Fill the mutable portion of our buffer with data from the file.
-            dataset.read_direct(
-                mutable_buf,
-                np.s_[:, date_slice],
+        # Only read the rows of the sids we were asked for, one slice per run
+        # of consecutive rows.
+        rows = np.unique(sid_selector[sid_selector != -1])
+        runs = _coalesce(rows)
+        if self._chunk_cache_bytes is None and len(runs) > 1:
+            # Without a chunk cache big enough to hold the window, every run
+            # would decompress the window's chunks again, so read the rows in
+            # between as well.
+            runs = [slice(runs[0].start, runs[-1].stop)]
+
+        # Map the rows of the file to the rows of the read buffer.
+        buf_offsets = np.cumsum([0] + [run.stop - run.start for run in runs])
+        buf_selector = np.full(
+            len(sid_selector),
+            buf_offsets[-1],
+            dtype='int64',
+        )
+        for run, offset in zip(runs, buf_offsets):
+            in_run = (sid_selector >= run.start) & (sid_selector < run.stop)
+            buf_selector[in_run] = sid_selector[in_run] - run.start + offset
+
+        def load_column(column):
+            # Allocate the extra row of space that will always contain null
+            # values. We'll only read values into the rows above it.
+            full_buf = np.zeros(
+                (buf_offsets[-1] + 1, n_dates),
+                dtype=np.uint32,
             )
 
+            dataset = self._dataset(column)
+            if n_dates:
+                for run, offset in zip(runs, buf_offsets):
+                    dataset.read_direct(
+                        full_buf,
+                        np.s_[run, date_slice],
+                        np.s_[offset:offset + run.stop - run.start],
+                    )
+
             # Select data from the **full buffer**. Unknown assets will pull
             # from the last row, which is always empty.
-            out.append(self._postprocessors[column](full_buf[sid_selector].T))
+            return self._postprocessors[column](full_buf[buf_selector].T)
 
-        return out
+        if self._pool is None:
+            return list(map(load_column, columns))
+        return self._pool.map(load_column, columns)
 
     def _make_sid_selector(self, assets):
         """
@@ -799,7 +897,7 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
         dt_ix = self.dates.searchsorted(dt.asm8)
 
         value = self._postprocessors[field](
-            self._country_group[DATA][field][sid_ix, dt_ix]
+            self._dataset(field)[sid_ix, dt_ix]
         )
 
         # When the value is nan, this dt may be outside the asset's lifetime.
@@ -815,6 +913,35 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
 
         return value
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of one field for many assets on the same day.
+
+        The values for all of ``sids`` are read from the day's column of the
+        field's dataset in a single read.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        out = np.full(len(sids), np.nan)
+        dt_ix = self.dates.searchsorted(dt.asm8)
+        if dt_ix == len(self.dates) or self.dates[dt_ix] != dt.asm8:
+            return out
+
+        sid_selector = self._make_sid_selector([int(sid) for sid in sids])
+        known = sid_selector != -1
+        if not known.any():
+            return out
+
+        # h5py needs increasing, unique indices for fancy reads, so read the
+        # whole column and select from it in memory.
+        column = self._postprocessors[field](
+            self._dataset(field)[:, dt_ix]
+        )
+        out[known] = column[sid_selector[known]]
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         """
         Get the latest day on or before ``dt`` in which ``asset`` traded.
@@ -840,7 +967,7 @@ class HDF5DailyBarReader(CurrencyAwareSessionBarReader):
 
         # Get the indices of all dates with nonzero volume.
         nonzero_volume_ixs = np.ravel(
-            np.nonzero(self._country_group[DATA][VOLUME][sid_ix, :dt_limit_ix])
+            np.nonzero(self._dataset(VOLUME)[sid_ix, :dt_limit_ix])
         )
 
         if len(nonzero_volume_ixs) == 0:
@@ -856,16 +983,22 @@ class MultiCountryDailyBarReader(CurrencyAwareSessionBarReader):
     readers : dict[str -> SessionBarReader]
         A dict mapping country codes to SessionBarReader instances to
         service each country.
+    pool : Pool, optional
+        Pool used by ``load_raw_arrays`` to read each pair of country and
+        field concurrently. This object must support ``map``, and is normally
+        a :class:`multiprocessing.pool.ThreadPool`. It should not also be
+        given to the country readers. If not provided, reads are serial.
     """
-    def __init__(self, readers):
+    def __init__(self, readers, pool=None):
         self._readers = readers
+        self._pool = pool
         self._country_map = pd.concat([
             pd.Series(index=reader.sids, data=country_code)
             for country_code, reader in iteritems(readers)
         ])
 
     @classmethod
-    def from_file(cls, h5_file):
+    def from_file(cls, h5_file, pool=None, **kwargs):
         """
         Construct from an h5py.File.
 
@@ -873,14 +1006,25 @@ class MultiCountryDailyBarReader(CurrencyAwareSessionBarReader):
         ----------
         h5_file : h5py.File
             An HDF5 daily pricing file.
+        pool : Pool, optional
+            Pool used to read countries and fields concurrently.
+        **kwargs
+            Forwarded to the :class:`HDF5DailyBarReader` of each country.
         """
-        return cls({
-            country: HDF5DailyBarReader.from_file(h5_file, country)
-            for country in h5_file.keys()
-        })
+        return cls(
+            {
+                country: HDF5DailyBarReader.from_file(
+                    h5_file,
+                    country,
+                    **kwargs
+                )
+                for country in h5_file.keys()
+            },
+            pool=pool,
+        )
 
     @classmethod
-    def from_path(cls, path):
+    def from_path(cls, path, pool=None, **kwargs):
         """
         Construct from a file path.
 
@@ -888,8 +1032,12 @@ class MultiCountryDailyBarReader(CurrencyAwareSessionBarReader):
         ----------
         path : str
             Path to an HDF5 daily pricing file.
+        pool : Pool, optional
+            Pool used to read countries and fields concurrently.
+        **kwargs
+            Forwarded to the :class:`HDF5DailyBarReader` of each country.
         """
-        return cls.from_file(h5py.File(path))
+        return cls.from_file(h5py.File(path), pool=pool, **kwargs)
 
     @property
     def countries(self):
@@ -944,14 +1092,84 @@ class MultiCountryDailyBarReader(CurrencyAwareSessionBarReader):
             (minutes in range, sids) with a dtype of float64, containing the
             values for the respective field over start and end dt range.
         """
-        country_code = self._country_code_for_assets(assets)
+        sids = np.array([int(asset) for asset in assets], dtype='int64')
+        country_codes = self._country_map.reindex(sids).values
+        masks = {
+            country_code: country_codes == country_code
+            for country_code in self._readers
+        }
+        masks = {code: mask for code, mask in iteritems(masks) if mask.any()}
+        if not masks:
+            raise ValueError('At least one valid asset id is required.')
 
-        return self._readers[country_code].load_raw_arrays(
-            columns,
-            start_date,
-            end_date,
-            assets,
-        )
+        if len(masks) == 1:
+            # Let the country's reader fill in unknown assets.
+            (country_code,) = masks
+            masks[country_code] = slice(None)
+        else:
+            self._check_sessions_match(masks, start_date, end_date)
+
+        def load(task):
+            country_code, column = task
+            return self._readers[country_code].load_raw_arrays(
+                [column],
+                start_date,
+                end_date,
+                sids[masks[country_code]],
+            )[0]
+
+        tasks = [(code, column) for code in masks for column in columns]
+        if self._pool is None:
+            results = list(map(load, tasks))
+        else:
+            results = self._pool.map(load, tasks)
+
+        if len(masks) == 1:
+            return results
+
+        # Assemble each column from the countries' reads. Assets that aren't
+        # in any country get null values.
+        out = []
+        results = iter(results)
+        by_column = [[] for _ in columns]
+        for _ in masks:
+            for column_results in by_column:
+                column_results.append(next(results))
+
+        for column_results in by_column:
+            first = column_results[0]
+            buf = np.full(
+                (first.shape[0], len(sids)),
+                np.nan if first.dtype.kind == 'f' else 0,
+                dtype=first.dtype,
+            )
+            for mask, result in zip(masks.values(), column_results):
+                buf[:, mask] = result
+            out.append(buf)
+
+        return out
+
+    def _check_sessions_match(self, country_codes, start_date, end_date):
+        """
+        Raise a ValueError if the readers for ``country_codes`` don't have the
+        same sessions between ``start_date`` and ``end_date``, since their
+        reads couldn't be combined into one array.
+        """
+        start = start_date.asm8
+        end = end_date.asm8
+        expected = None
+        for country_code in country_codes:
+            reader = self._readers[country_code]
+            dates = reader.dates[
+                reader._compute_date_range_slice(start, end)
+            ]
+            if expected is None:
+                expected = dates
+            elif not np.array_equal(dates, expected):
+                raise ValueError(
+                    'Countries {} have different sessions between {} and {}.'
+                    .format(sorted(country_codes), start_date, end_date)
+                )
 
     @property
     def last_available_dt(self):
@@ -1043,6 +1261,24 @@ class MultiCountryDailyBarReader(CurrencyAwareSessionBarReader):
             )
         return self._readers[country_code].get_value(sid, dt, field)
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of one field for many assets on the same day,
+        reading from each country's reader once.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        sids = np.array([int(sid) for sid in sids], dtype='int64')
+        out = np.full(len(sids), np.nan)
+        country_codes = self._country_map.reindex(sids).values
+        for country_code, reader in iteritems(self._readers):
+            mask = country_codes == country_code
+            if mask.any():
+                out[mask] = reader.get_values(sids[mask], dt, field)
+        return out
+
     def get_last_traded_dt(self, asset, dt):
         """
         Get the latest day on or before ``dt`` in which ``asset`` traded.
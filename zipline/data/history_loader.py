@@ -17,13 +17,15 @@ from abc import (
     abstractmethod,
     abstractproperty,
 )
+from collections import namedtuple
+from contextlib import contextmanager
 
-from numpy import concatenate
+from numpy import array, concatenate
 from lru import LRU
 from pandas import isnull
 from toolz import sliding_window
 
-from six import with_metaclass
+from six import iteritems, with_metaclass
 
 from zipline.assets import Equity, Future
 from zipline.assets.continuous_futures import ContinuousFuture
@@ -33,15 +35,21 @@ from zipline.lib.adjustment import Float64Multiply, Float64Add
 from zipline.utils.cache import ExpiringCache
 from zipline.utils.math_utils import number_of_decimal_places
 from zipline.utils.memoize import lazyval
-from zipline.utils.numpy_utils import float64_dtype
+from zipline.utils.numpy_utils import float64_dtype, int64_dtype
 from zipline.utils.pandas_utils import find_in_sorted_index, normalize_date
 
 # Default number of decimal places used for rounding asset prices.
 DEFAULT_ASSET_PRICE_DECIMALS = 3
 
+NANOS_IN_SECOND = 10 ** 9
+
 
 class HistoryCompatibleUSEquityAdjustmentReader(object):
 
+    # The tables contributing to price adjustments, in the order in which
+    # their adjustments are applied at a location.
+    PRICE_TABLES = ('mergers', 'dividends', 'splits')
+
     def __init__(self, adjustment_reader):
         self._adjustments_reader = adjustment_reader
 
@@ -53,15 +61,68 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
             A list, where each element corresponds to the `columns`, of
             mappings from index to adjustment objects to apply at that index.
         """
-        out = [None] * len(columns)
-        for i, column in enumerate(columns):
-            adjs = {}
-            for asset in assets:
-                adjs.update(self._get_adjustments_in_range(
-                    asset, dts, column))
-            out[i] = adjs
+        out = [{} for _ in columns]
+        for asset_adjs in self.load_asset_pricing_adjustments(columns,
+                                                              dts,
+                                                              assets):
+            for adjs, column_adjs in zip(out, asset_adjs):
+                adjs.update(column_adjs)
         return out
 
+    def load_asset_pricing_adjustments(self, columns, dts, assets):
+        """
+        Get the adjustments of each of ``assets`` separately, structured as
+        in ``_get_adjustments_in_range``.
+
+        The adjustments of all the assets are found with one search of each
+        table.
+
+        Returns
+        -------
+        adjustments : list[list[dict[int -> Adjustment]]]
+            A list, where each element corresponds to the `assets`, of lists
+            where each element corresponds to the `columns`.
+        """
+        sids = array([int(asset) for asset in assets], dtype=int64_dtype)
+        start = normalize_date(dts[0]).value // NANOS_IN_SECOND
+        end = normalize_date(dts[-1]).value // NANOS_IN_SECOND
+
+        price_adjs = [{} for _ in assets]
+        volume_adjs = [{} for _ in assets]
+        searches = []
+        if any(column != 'volume' for column in columns):
+            searches.extend(
+                (tablename, price_adjs, False)
+                for tablename in self.PRICE_TABLES
+            )
+        if 'volume' in columns:
+            searches.append(('splits', volume_adjs, True))
+
+        for tablename, out, invert in searches:
+            owners, locs, ratios = self._ratios_in_range(
+                tablename, sids, dts, start, end,
+            )
+            if invert:
+                ratios = 1.0 / ratios
+            for i, loc, ratio in zip(owners, locs, ratios):
+                mult = Float64Multiply(0, loc - 1, 0, 0, ratio)
+                try:
+                    out[i][loc].append(mult)
+                except KeyError:
+                    out[i][loc] = [mult]
+
+        return [
+            [
+                {
+                    loc: list(mults) for loc, mults in iteritems(
+                        (volume_adjs if column == 'volume' else price_adjs)[i]
+                    )
+                }
+                for column in columns
+            ]
+            for i in range(len(assets))
+        ]
+
     def _get_adjustments_in_range(self, asset, dts, field):
         """
         Get the Float64Multiply objects to pass to an AdjustedArrayWindow.
@@ -91,64 +152,28 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
         out : dict[loc -> Float64Multiply]
             The adjustments as a dict of loc -> Float64Multiply
         """
-        sid = int(asset)
-        start = normalize_date(dts[0])
-        end = normalize_date(dts[-1])
-        adjs = {}
-        if field != 'volume':
-            mergers = self._adjustments_reader.get_adjustments_for_sid(
-                'mergers', sid)
-            for m in mergers:
-                dt = m[0]
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
-                    adj_loc = end_loc
-                    mult = Float64Multiply(0,
-                                           end_loc - 1,
-                                           0,
-                                           0,
-                                           m[1])
-                    try:
-                        adjs[adj_loc].append(mult)
-                    except KeyError:
-                        adjs[adj_loc] = [mult]
-            divs = self._adjustments_reader.get_adjustments_for_sid(
-                'dividends', sid)
-            for d in divs:
-                dt = d[0]
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
-                    adj_loc = end_loc
-                    mult = Float64Multiply(0,
-                                           end_loc - 1,
-                                           0,
-                                           0,
-                                           d[1])
-                    try:
-                        adjs[adj_loc].append(mult)
-                    except KeyError:
-                        adjs[adj_loc] = [mult]
-        splits = self._adjustments_reader.get_adjustments_for_sid(
-            'splits', sid)
-        for s in splits:
-            dt = s[0]
-            if start < dt <= end:
-                if field == 'volume':
-                    ratio = 1.0 / s[1]
-                else:
-                    ratio = s[1]
-                end_loc = dts.searchsorted(dt)
-                adj_loc = end_loc
-                mult = Float64Multiply(0,
-                                       end_loc - 1,
-                                       0,
-                                       0,
-                                       ratio)
-                try:
-                    adjs[adj_loc].append(mult)
-                except KeyError:
-                    adjs[adj_loc] = [mult]
-        return adjs
+        return self.load_asset_pricing_adjustments([field], dts, [asset])[0][0]
+
+    def _ratios_in_range(self, tablename, sids, dts, start, end):
+        """
+        Find the ratios of ``tablename`` for ``sids`` effective in
+        ``(start, end]``, given in seconds.
+
+        Returns
+        -------
+        owners : np.array[int64]
+            The index into ``sids`` of each ratio.
+        locs : np.array[int64]
+            The location in ``dts`` of the effective date of each ratio.
+        ratios : np.array[float64]
+            The ratios.
+        """
+        table = self._adjustments_reader.get_ratio_table(tablename)
+        owners, rows = table.rows_in_range(sids, start, end)
+        locs = dts.asi8.searchsorted(
+            table.effective_dates[rows] * NANOS_IN_SECOND,
+        )
+        return owners, locs, table.ratios[rows]
 
 
 class ContinuousFutureAdjustmentReader(object):
@@ -186,6 +211,20 @@ class ContinuousFutureAdjustmentReader(object):
             out[i] = adjs
         return out
 
+    def load_asset_pricing_adjustments(self, columns, dts, assets):
+        """
+        Returns
+        -------
+        adjustments : list[list[dict[int -> Adjustment]]]
+            A list, where each element corresponds to the `assets`, of lists
+            where each element corresponds to the `columns`.
+        """
+        return [
+            [self._get_adjustments_in_range(asset, dts, column)
+             for column in columns]
+            for asset in assets
+        ]
+
     def _make_adjustment(self,
                          adjustment_type,
                          front_close,
@@ -293,6 +332,12 @@ class SlidingWindow(object):
         return self.current
 
 
+_PendingPrefetch = namedtuple(
+    '_PendingPrefetch',
+    'result assets fields start_ix prefetch_end_ix',
+)
+
+
 class HistoryLoader(with_metaclass(ABCMeta)):
     """
     Loader for sliding history windows, with support for adjustments.
@@ -305,6 +350,19 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         Reader for pricing bars.
     adjustment_reader : SQLiteAdjustmentReader
         Reader for adjustment data.
+    prefetch_length : int, optional
+        The number of bars to read past the end of a window when it is built,
+        so that later windows can be served without reading.
+    prefetch_pool : Pool, optional
+        A pool, such as a :class:`multiprocessing.pool.ThreadPool`, on which
+        to read the next block of bars for the assets of a window before the
+        current block runs out, so that the simulation does not wait on the
+        read. The reader must be safe to use from the pool's threads. If not
+        provided, bars are only read when a window runs out.
+    prefetch_watermark : int, optional
+        The number of prefetched bars left in a block at which to start
+        reading the next one on ``prefetch_pool``. Defaults to half of
+        ``prefetch_length``.
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume', 'sid')
 
@@ -312,7 +370,9 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                  asset_finder,
                  roll_finders=None,
                  sid_cache_size=1000,
-                 prefetch_length=0):
+                 prefetch_length=0,
+                 prefetch_pool=None,
+                 prefetch_watermark=None):
         self.trading_calendar = trading_calendar
         self._asset_finder = asset_finder
         self._reader = reader
@@ -333,6 +393,17 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             for field in self.FIELDS
         }
         self._prefetch_length = prefetch_length
+        self._fields_loaded_together = ()
+
+        self._prefetch_pool = prefetch_pool
+        if prefetch_watermark is None:
+            prefetch_watermark = prefetch_length // 2
+        self._prefetch_watermark = prefetch_watermark
+        # (field, size, is_perspective_after) -> calendar index of the last
+        # bar prefetched by the most recently built windows.
+        self._block_ends = {}
+        # (field, size, is_perspective_after) -> _PendingPrefetch
+        self._pending_prefetches = {}
 
     @abstractproperty
     def _frequency(self):
@@ -346,6 +417,35 @@ class HistoryLoader(with_metaclass(ABCMeta)):
     def _array(self, start, end, assets, field):
         pass
 
+    def _arrays(self, dts, assets, fields):
+        return [self._array(dts, assets, field) for field in fields]
+
+    @contextmanager
+    def load_together(self, fields):
+        """
+        Build the windows of all of ``fields`` whenever a window of one of
+        them is built, while in this context.
+
+        Use this around consecutive ``history`` calls for several fields of
+        the same assets and dts, so that their windows are loaded with one
+        read and share their adjustments, instead of a read and adjustment
+        lookup per field. Only OHLCV fields are loaded together.
+
+        Parameters
+        ----------
+        fields : iterable[str]
+            The fields about to be requested.
+        """
+        previous = self._fields_loaded_together
+        self._fields_loaded_together = tuple(
+            field for field in self.FIELDS
+            if field in fields and field != 'sid'
+        )
+        try:
+            yield
+        finally:
+            self._fields_loaded_together = previous
+
     def _decimal_places_for_asset(self, asset, reference_date):
         if isinstance(asset, Future) and asset.tick_size:
             return number_of_decimal_places(asset.tick_size)
@@ -361,6 +461,24 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                     return number_of_decimal_places(contract.tick_size)
         return DEFAULT_ASSET_PRICE_DECIMALS
 
+    def _cached_window(self, field, asset, size, is_perspective_after, end,
+                       end_ix):
+        """
+        The cached window of ``field`` for ``asset`` that can provide data
+        ending at ``end``, or None.
+        """
+        try:
+            window = self._window_blocks[field].get(
+                (asset, size, is_perspective_after), end)
+        except KeyError:
+            return None
+        if end_ix < window.most_recent_ix:
+            # Window needs reset. Requested end index occurs before the
+            # end index from the previous history call for this window.
+            # Grab new window instead of rewinding adjustments.
+            return None
+        return window
+
     def _ensure_sliding_windows(self, assets, dts, field,
                                 is_perspective_after):
         """
@@ -372,6 +490,10 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         can not provide data for the current dts range, then create a new
         one and replace the expired window.
 
+        When new windows are needed and ``field`` is one of the fields passed
+        to ``load_together``, missing windows of the other fields are created
+        for the same assets from the same read.
+
         Parameters
         ----------
         assets : iterable of Assets
@@ -400,73 +522,231 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         assets = self._asset_finder.retrieve_all(assets)
         end_ix = find_in_sorted_index(cal, end)
 
+        self._install_prefetched(field, size, is_perspective_after, end_ix)
+
         for asset in assets:
-            try:
-                window = self._window_blocks[field].get(
-                    (asset, size, is_perspective_after), end)
-            except KeyError:
+            window = self._cached_window(
+                field, asset, size, is_perspective_after, end, end_ix)
+            if window is None:
                 needed_assets.append(asset)
             else:
-                if end_ix < window.most_recent_ix:
-                    # Window needs reset. Requested end index occurs before the
-                    # end index from the previous history call for this window.
-                    # Grab new window instead of rewinding adjustments.
-                    needed_assets.append(asset)
-                else:
-                    asset_windows[asset] = window
+                asset_windows[asset] = window
 
         if needed_assets:
-            offset = 0
             start_ix = find_in_sorted_index(cal, dts[0])
-
             prefetch_end_ix = min(end_ix + self._prefetch_length, len(cal) - 1)
-            prefetch_end = cal[prefetch_end_ix]
-            prefetch_dts = cal[start_ix:prefetch_end_ix + 1]
-            if is_perspective_after:
-                adj_end_ix = min(prefetch_end_ix + 1, len(cal) - 1)
-                adj_dts = cal[start_ix:adj_end_ix + 1]
-            else:
-                adj_dts = prefetch_dts
-            prefetch_len = len(prefetch_dts)
-            array = self._array(prefetch_dts, needed_assets, field)
 
-            if field == 'sid':
-                window_type = Int64Window
-            else:
-                window_type = Float64Window
+            # The fields to build windows of, with the assets missing them.
+            missing = {field: set(needed_assets)}
+            if field in self._fields_loaded_together:
+                for other in self._fields_loaded_together:
+                    if other == field:
+                        continue
+                    other_missing = {
+                        asset for asset in needed_assets
+                        if self._cached_window(other, asset, size,
+                                               is_perspective_after, end,
+                                               end_ix) is None
+                    }
+                    if other_missing:
+                        missing[other] = other_missing
+            fields = [f for f in self.FIELDS if f in missing]
+
+            arrays = self._arrays(
+                cal[start_ix:prefetch_end_ix + 1], needed_assets, fields,
+            )
+            asset_windows.update(self._build_windows(
+                needed_assets,
+                fields,
+                missing,
+                arrays,
+                start_ix,
+                prefetch_end_ix,
+                size,
+                is_perspective_after,
+                dts[-1],
+            )[field])
+            self._block_ends[field, size, is_perspective_after] = \
+                prefetch_end_ix
+
+        self._schedule_prefetch(assets, field, size, is_perspective_after,
+                                end_ix)
 
-            view_kwargs = {}
-            if field == 'volume':
-                array = array.astype(float64_dtype)
+        return [asset_windows[asset] for asset in assets]
 
-            for i, asset in enumerate(needed_assets):
-                adj_reader = None
-                try:
-                    adj_reader = self._adjustment_readers[type(asset)]
-                except KeyError:
-                    adj_reader = None
-                if adj_reader is not None:
-                    adjs = adj_reader.load_pricing_adjustments(
-                        [field], adj_dts, [asset])[0]
+    def _build_windows(self,
+                       assets,
+                       fields,
+                       missing,
+                       arrays,
+                       start_ix,
+                       prefetch_end_ix,
+                       size,
+                       is_perspective_after,
+                       reference_date):
+        """
+        Build and cache the sliding windows of ``fields`` for ``assets`` from
+        ``arrays``, the raw data of each field from ``start_ix`` through
+        ``prefetch_end_ix`` in the calendar.
+
+        Returns
+        -------
+        windows : dict[str -> dict[Asset -> SlidingWindow]]
+            The new windows of each field.
+        """
+        cal = self._calendar
+        offset = 0
+        prefetch_end = cal[prefetch_end_ix]
+        prefetch_len = prefetch_end_ix - start_ix + 1
+        if is_perspective_after:
+            adj_end_ix = min(prefetch_end_ix + 1, len(cal) - 1)
+            adj_dts = cal[start_ix:adj_end_ix + 1]
+        else:
+            adj_dts = cal[start_ix:prefetch_end_ix + 1]
+
+        arrays = dict(zip(fields, arrays))
+        if 'volume' in arrays:
+            arrays['volume'] = arrays['volume'].astype(float64_dtype)
+
+        # Load the adjustments of all the assets of each type together.
+        by_type = {}
+        for asset in assets:
+            by_type.setdefault(type(asset), []).append(asset)
+        asset_adjs = {}
+        for asset_type, typed_assets in iteritems(by_type):
+            try:
+                adj_reader = self._adjustment_readers[asset_type]
+            except KeyError:
+                continue
+            asset_adjs.update(zip(
+                typed_assets,
+                adj_reader.load_asset_pricing_adjustments(
+                    fields, adj_dts, typed_assets),
+            ))
+
+        windows = {field: {} for field in fields}
+        view_kwargs = {}
+        for i, asset in enumerate(assets):
+            asset_fields = [f for f in fields if asset in missing[f]]
+            try:
+                adjs = [
+                    field_adjs
+                    for f, field_adjs in zip(fields, asset_adjs[asset])
+                    if f in asset_fields
+                ]
+            except KeyError:
+                adjs = [{} for _ in asset_fields]
+
+            decimal_places = self._decimal_places_for_asset(
+                asset, reference_date)
+            for asset_field, field_adjs in zip(asset_fields, adjs):
+                if asset_field == 'sid':
+                    window_type = Int64Window
                 else:
-                    adjs = {}
+                    window_type = Float64Window
                 window = window_type(
-                    array[:, i].reshape(prefetch_len, 1),
+                    arrays[asset_field][:, i].reshape(prefetch_len, 1),
                     view_kwargs,
-                    adjs,
+                    field_adjs,
                     offset,
                     size,
                     int(is_perspective_after),
-                    self._decimal_places_for_asset(asset, dts[-1]),
+                    decimal_places,
                 )
-                sliding_window = SlidingWindow(window, size, start_ix, offset)
-                asset_windows[asset] = sliding_window
-                self._window_blocks[field].set(
+                sliding_window = SlidingWindow(
+                    window, size, start_ix, offset)
+                windows[asset_field][asset] = sliding_window
+                self._window_blocks[asset_field].set(
                     (asset, size, is_perspective_after),
                     sliding_window,
                     prefetch_end)
+        return windows
 
-        return [asset_windows[asset] for asset in assets]
+    def _schedule_prefetch(self, assets, field, size, is_perspective_after,
+                           end_ix):
+        """
+        Start reading the next block of windows of ``field`` for ``assets`` on
+        the prefetch pool if the current block is within the watermark of its
+        end.
+        """
+        if self._prefetch_pool is None or self._prefetch_length <= 0:
+            return
+        key = field, size, is_perspective_after
+        if key in self._pending_prefetches:
+            return
+        try:
+            block_end_ix = self._block_ends[key]
+        except KeyError:
+            return
+        if block_end_ix - end_ix > self._prefetch_watermark:
+            return
+
+        cal = self._calendar
+        prefetch_end_ix = min(end_ix + self._prefetch_length, len(cal) - 1)
+        if prefetch_end_ix <= block_end_ix:
+            # The current block already reaches the end of the calendar.
+            return
+
+        # Continuous futures resolve their contracts through the asset
+        # finder, which may not be used from another thread.
+        assets = [
+            asset for asset in assets
+            if not isinstance(asset, ContinuousFuture)
+        ]
+        if not assets:
+            return
+        fields = [
+            f for f in self.FIELDS
+            if f == field or f in self._fields_loaded_together
+        ]
+        start_ix = end_ix - size + 1
+        self._pending_prefetches[key] = _PendingPrefetch(
+            self._prefetch_pool.apply_async(
+                self._arrays,
+                (cal[start_ix:prefetch_end_ix + 1], assets, fields),
+            ),
+            assets,
+            fields,
+            start_ix,
+            prefetch_end_ix,
+        )
+
+    def _install_prefetched(self, field, size, is_perspective_after, end_ix):
+        """
+        Replace the windows of ``field`` with the block read in the
+        background, if that read has finished and the block covers
+        ``end_ix``. Never waits for a read in progress.
+        """
+        key = field, size, is_perspective_after
+        try:
+            pending = self._pending_prefetches[key]
+        except KeyError:
+            return
+        if not pending.result.ready():
+            return
+        del self._pending_prefetches[key]
+
+        # A new window is first valid after the bar that it starts with.
+        if not pending.start_ix + size <= end_ix <= pending.prefetch_end_ix:
+            return
+        if pending.prefetch_end_ix <= self._block_ends.get(key, -1):
+            # The windows were rebuilt further ahead while reading.
+            return
+        if not pending.result.successful():
+            return
+
+        self._build_windows(
+            pending.assets,
+            pending.fields,
+            {f: set(pending.assets) for f in pending.fields},
+            pending.result.get(),
+            pending.start_ix,
+            pending.prefetch_end_ix,
+            size,
+            is_perspective_after,
+            self._calendar[end_ix],
+        )
+        self._block_ends[key] = pending.prefetch_end_ix
 
     def history(self, assets, dts, field, is_perspective_after):
         """
@@ -573,6 +853,14 @@ class DailyHistoryLoader(HistoryLoader):
             assets,
         )[0]
 
+    def _arrays(self, dts, assets, fields):
+        return self._reader.load_raw_arrays(
+            fields,
+            dts[0],
+            dts[-1],
+            assets,
+        )
+
 
 class MinuteHistoryLoader(HistoryLoader):
 
@@ -594,3 +882,11 @@ class MinuteHistoryLoader(HistoryLoader):
             dts[-1],
             assets,
         )[0]
+
+    def _arrays(self, dts, assets, fields):
+        return self._reader.load_raw_arrays(
+            fields,
+            dts[0],
+            dts[-1],
+            assets,
+        )
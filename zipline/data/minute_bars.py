@@ -18,7 +18,6 @@ from glob import glob
 from os.path import join
 from textwrap import dedent
 
-from lru import LRU
 import bcolz
 from bcolz import ctable
 import h5py
@@ -42,6 +41,7 @@ from zipline.gens.sim_engine import NANOS_IN_MINUTE
 from zipline.data.bar_reader import BarReader, NoDataForSid, NoDataOnDate
 from zipline.data.bcolz_daily_bars import check_uint32_safe
 from zipline.utils.cli import maybe_show_progress
+from zipline.utils.cache import CacheStats, SizedLRUCache
 from zipline.utils.compat import mappingproxy
 from zipline.utils.memoize import lazyval
 
@@ -884,6 +884,12 @@ class BcolzMinuteBarWriter(object):
         metadata.write(self._rootdir)
 
 
+def _open_carray_nbytes(carray):
+    # A carray opened for reading holds a buffer for its leftover elements
+    # and its most recently decompressed chunk, each one chunk long.
+    return 2 * carray.chunklen * carray.dtype.itemsize
+
+
 class BcolzMinuteBarReader(MinuteBarReader):
     """
     Reader for data written by BcolzMinuteBarWriter
@@ -893,6 +899,25 @@ class BcolzMinuteBarReader(MinuteBarReader):
     rootdir : string
         The root directory containing the metadata and asset bcolz
         directories.
+    sid_cache_sizes : dict[str -> int], optional
+        The number of open carrays to keep for each field. Ignored if
+        ``carray_cache_bytes`` is provided.
+    pool : Pool, optional
+        Pool used by ``load_raw_arrays`` to read blocks of assets
+        concurrently. This object must support ``map``, and is normally a
+        :class:`multiprocessing.pool.ThreadPool`: bcolz releases the GIL
+        while decompressing chunks. If not provided, blocks are read serially.
+    block_size : int, optional
+        The number of assets read by each task submitted to ``pool``.
+    carray_cache_bytes : int, optional
+        The approximate number of bytes to spend on open carrays, shared by
+        all fields. An open carray holds two uncompressed chunks in memory.
+        If not provided, open carrays are bounded by ``sid_cache_sizes``.
+    chunk_cache_bytes : int, optional
+        The number of bytes to spend on decompressed chunks. Chunks read by
+        ``get_value`` and ``load_raw_arrays`` are kept so that consecutive
+        reads of nearby minutes, e.g. a sliding history window, don't
+        decompress the same chunks again. Pass 0 to disable the chunk cache.
 
     See Also
     --------
@@ -914,9 +939,20 @@ class BcolzMinuteBarReader(MinuteBarReader):
     # can do so by mutating DEFAULT_MINUTELY_SID_CACHE_SIZES.
     _default_proxy = mappingproxy(DEFAULT_MINUTELY_SID_CACHE_SIZES)
 
-    def __init__(self, rootdir, sid_cache_sizes=_default_proxy):
+    DEFAULT_BLOCK_SIZE = 64
+    DEFAULT_CHUNK_CACHE_BYTES = 128 * 1024 * 1024
+
+    def __init__(self,
+                 rootdir,
+                 sid_cache_sizes=_default_proxy,
+                 pool=None,
+                 block_size=DEFAULT_BLOCK_SIZE,
+                 carray_cache_bytes=None,
+                 chunk_cache_bytes=DEFAULT_CHUNK_CACHE_BYTES):
 
         self._rootdir = rootdir
+        self._pool = pool
+        self._block_size = block_size
 
         metadata = self._get_metadata()
 
@@ -946,10 +982,17 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
         self._minutes_per_day = metadata.minutes_per_day
 
-        self._carrays = {
-            field: LRU(sid_cache_sizes[field])
-            for field in self.FIELDS
-        }
+        if carray_cache_bytes is None:
+            self._carrays = {
+                field: SizedLRUCache(sid_cache_sizes[field])
+                for field in self.FIELDS
+            }
+            self._carray_size = lambda carray: 1
+        else:
+            carrays = SizedLRUCache(carray_cache_bytes)
+            self._carrays = {field: carrays for field in self.FIELDS}
+            self._carray_size = _open_carray_nbytes
+        self._chunks = SizedLRUCache(chunk_cache_bytes)
 
         self._last_get_value_dt_position = None
         self._last_get_value_dt_value = None
@@ -965,6 +1008,10 @@ class BcolzMinuteBarReader(MinuteBarReader):
     def _get_metadata(self):
         return BcolzMinuteBarMetadata.read(self._rootdir)
 
+    @property
+    def rootdir(self):
+        return self._rootdir
+
     @property
     def trading_calendar(self):
         return self.calendar
@@ -1069,20 +1116,98 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
     def _open_minute_file(self, field, sid):
         sid = int(sid)
+        cache = self._carrays[field]
 
         try:
-            carray = self._carrays[field][sid]
+            carray = cache.get((field, sid))
         except KeyError:
             try:
-                carray = self._carrays[field][sid] = bcolz.carray(
+                carray = bcolz.carray(
                     rootdir=self._get_carray_path(sid, field),
                     mode='r',
                 )
             except IOError:
                 raise NoDataForSid('No minute data for sid {}.'.format(sid))
+            cache.set((field, sid), carray, self._carray_size(carray))
 
         return carray
 
+    def _read_chunk(self, carray, field, sid, chunk_ix):
+        key = field, sid, chunk_ix
+        try:
+            return self._chunks.get(key)
+        except KeyError:
+            chunklen = carray.chunklen
+            chunk = carray[chunk_ix * chunklen:(chunk_ix + 1) * chunklen]
+            self._chunks.set(key, chunk, chunk.nbytes)
+            return chunk
+
+    def _read_value(self, field, sid, pos):
+        """Read the value at ``pos`` of the ``field`` carray for ``sid``.
+
+        Raises
+        ------
+        IndexError
+            If nothing has been written at ``pos``.
+        """
+        carray = self._open_minute_file(field, sid)
+        if not self._chunks.capacity:
+            return carray[pos]
+
+        chunklen = carray.chunklen
+        if pos >= len(carray):
+            raise IndexError(pos)
+        return self._read_chunk(
+            carray,
+            field,
+            int(sid),
+            pos // chunklen,
+        )[pos % chunklen]
+
+    def _read_range(self, field, sid, start, stop):
+        """Read positions ``[start, stop)`` of the ``field`` carray for
+        ``sid``. The result is shorter than requested if nothing has been
+        written at the end of the range.
+        """
+        carray = self._open_minute_file(field, sid)
+        stop = min(stop, len(carray))
+        if not self._chunks.capacity or start >= stop:
+            return carray[start:stop]
+
+        chunklen = carray.chunklen
+        first_chunk = start // chunklen
+        chunks = [
+            self._read_chunk(carray, field, int(sid), chunk_ix)
+            for chunk_ix in range(first_chunk, (stop - 1) // chunklen + 1)
+        ]
+        values = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+        offset = first_chunk * chunklen
+        return values[start - offset:stop - offset]
+
+    def cache_stats(self):
+        """
+        Get the counters of the caches of open carrays and decompressed
+        chunks, which can be used to size ``carray_cache_bytes`` and
+        ``chunk_cache_bytes``.
+
+        Returns
+        -------
+        stats : dict[str -> zipline.utils.cache.CacheStats]
+            The stats of the carray cache under 'carrays', and of the chunk
+            cache under 'chunks'. If open carrays are bounded per field by
+            ``sid_cache_sizes``, the stats of the fields are added together
+            and sizes are counted in carrays rather than bytes.
+        """
+        carray_caches = {id(cache): cache for cache in self._carrays.values()}
+        return {
+            'carrays': CacheStats._make(
+                sum(column) for column in zip(*(
+                    cache.stats() for cache in carray_caches.values()
+                ))
+            ),
+            'chunks': self._chunks.stats(),
+        }
+
     def table_len(self, sid):
         """Returns the length of the underlying table for this sid."""
         return len(self._open_minute_file('close', sid))
@@ -1124,19 +1249,10 @@ class BcolzMinuteBarReader(MinuteBarReader):
             Returns the integer value of the volume.
             (A volume of 0 signifies no trades for the given dt.)
         """
-        if self._last_get_value_dt_value == dt.value:
-            minute_pos = self._last_get_value_dt_position
-        else:
-            try:
-                minute_pos = self._find_position_of_minute(dt)
-            except ValueError:
-                raise NoDataOnDate()
-
-            self._last_get_value_dt_value = dt.value
-            self._last_get_value_dt_position = minute_pos
+        minute_pos = self._get_value_position(dt)
 
         try:
-            value = self._open_minute_file(field, sid)[minute_pos]
+            value = self._read_value(field, sid, minute_pos)
         except IndexError:
             value = 0
         if value == 0:
@@ -1149,6 +1265,50 @@ class BcolzMinuteBarReader(MinuteBarReader):
             value *= self._ohlc_ratio_inverse_for_sid(sid)
         return value
 
+    def get_values(self, sids, dt, field):
+        """
+        Retrieve the values of one field for many assets at the same minute.
+
+        The position of ``dt`` is looked up once and reused for every sid.
+
+        See Also
+        --------
+        zipline.data.bar_reader.BarReader.get_values
+        """
+        out = np.full(len(sids), np.nan)
+        try:
+            minute_pos = self._get_value_position(dt)
+        except NoDataOnDate:
+            return out
+
+        is_volume = field == 'volume'
+        for i, sid in enumerate(sids):
+            try:
+                value = self._read_value(field, sid, minute_pos)
+            except NoDataForSid:
+                continue
+            except IndexError:
+                value = 0
+
+            if is_volume:
+                out[i] = value
+            elif value != 0:
+                out[i] = value * self._ohlc_ratio_inverse_for_sid(sid)
+        return out
+
+    def _get_value_position(self, dt):
+        if self._last_get_value_dt_value == dt.value:
+            return self._last_get_value_dt_position
+
+        try:
+            minute_pos = self._find_position_of_minute(dt)
+        except ValueError:
+            raise NoDataOnDate()
+
+        self._last_get_value_dt_value = dt.value
+        self._last_get_value_dt_position = minute_pos
+        return minute_pos
+
     def get_last_traded_dt(self, asset, dt):
         minute_pos = self._find_last_traded_position(asset, dt)
         if minute_pos == -1:
@@ -1251,45 +1411,76 @@ class BcolzMinuteBarReader(MinuteBarReader):
         start_idx = self._find_position_of_minute(start_dt)
         end_idx = self._find_position_of_minute(end_dt)
 
-        num_minutes = (end_idx - start_idx + 1)
+        positions = self._window_positions(start_idx, end_idx)
+        if positions is None:
+            num_minutes = end_idx - start_idx + 1
+        else:
+            num_minutes = len(positions)
 
-        results = []
+        shape = num_minutes, len(sids)
+        results = [
+            np.full(shape, np.nan) if field != 'volume'
+            else np.zeros(shape, dtype=np.uint32)
+            for field in fields
+        ]
+
+        def read_block(columns):
+            # Each block fills its own columns of the shared outputs, so
+            # blocks can be read concurrently.
+            for i in columns:
+                sid = sids[i]
+                ohlc_ratio_inverse = self._ohlc_ratio_inverse_for_sid(sid)
+                for field, out in zip(fields, results):
+                    values = self._read_range(
+                        field,
+                        sid,
+                        start_idx,
+                        end_idx + 1,
+                    )
+                    if positions is not None:
+                        # We might not have written data for all the minutes
+                        # requested.
+                        values = values[positions[positions < len(values)]]
+
+                    where = values != 0
+                    if field != 'volume':
+                        out[:len(where), i][where] = (
+                            values[where] * ohlc_ratio_inverse
+                        )
+                    else:
+                        out[:len(where), i][where] = values[where]
+
+        block_size = self._block_size
+        blocks = [
+            range(block_start, min(block_start + block_size, len(sids)))
+            for block_start in range(0, len(sids), block_size)
+        ]
+        if self._pool is None or len(blocks) < 2:
+            for block in blocks:
+                read_block(block)
+        else:
+            self._pool.map(read_block, blocks)
+
+        return results
 
+    def _window_positions(self, start_idx, end_idx):
+        """
+        Returns
+        -------
+        positions : np.ndarray[int64] or None
+            The positions, relative to ``start_idx``, of the minutes of the
+            window that are not excluded by early closes, or None if no
+            minutes are excluded.
+        """
         indices_to_exclude = self._exclusion_indices_for_range(
             start_idx, end_idx)
-        if indices_to_exclude is not None:
-            for excl_start, excl_stop in indices_to_exclude:
-                length = excl_stop - excl_start + 1
-                num_minutes -= length
-
-        shape = num_minutes, len(sids)
+        if indices_to_exclude is None:
+            return None
 
-        for field in fields:
-            if field != 'volume':
-                out = np.full(shape, np.nan)
-            else:
-                out = np.zeros(shape, dtype=np.uint32)
-
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                values = carray[start_idx:end_idx + 1]
-                if indices_to_exclude is not None:
-                    for excl_start, excl_stop in indices_to_exclude[::-1]:
-                        excl_slice = np.s_[
-                            excl_start - start_idx:excl_stop - start_idx + 1]
-                        values = np.delete(values, excl_slice)
-
-                where = values != 0
-                # first slice down to len(where) because we might not have
-                # written data for all the minutes requested
-                if field != 'volume':
-                    out[:len(where), i][where] = (
-                        values[where] * self._ohlc_ratio_inverse_for_sid(sid))
-                else:
-                    out[:len(where), i][where] = values[where]
-
-            results.append(out)
-        return results
+        keep = np.ones(end_idx - start_idx + 1, dtype=bool)
+        for excl_start, excl_stop in indices_to_exclude:
+            keep[excl_start - start_idx:excl_stop - start_idx + 1] = False
+        return np.flatnonzero(keep)
 
 
 class MinuteBarUpdateReader(with_metaclass(ABCMeta, object)):
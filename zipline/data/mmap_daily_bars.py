@@ -0,0 +1,200 @@
+"""
+Uncompressed, memory-mapped copies of bcolz daily bar tables.
+
+A bcolz daily bar table stores each column as compressed chunks, so every
+process that reads it decompresses its own private copy of the data. The
+layout in this module stores the same rows as one uncompressed ``.npy`` file
+per column, next to a JSON file holding the table's attributes::
+
+    <rootdir>/
+        metadata.json
+        open.npy
+        high.npy
+        low.npy
+        close.npy
+        volume.npy
+        day.npy
+        id.npy
+
+:class:`MmapDailyBarReader` memory-maps the column files, so reads are served
+straight from the OS page cache, and any number of processes on a host share a
+single copy of the data.
+"""
+import json
+import os
+
+from bcolz import ctable
+import numpy as np
+from numpy.lib.format import open_memmap
+from six import iteritems
+
+from zipline.data.bcolz_daily_bars import (
+    BcolzDailyBarReader,
+    US_EQUITY_PRICING_BCOLZ_COLUMNS,
+)
+from zipline.utils.memoize import lazyval
+
+
+METADATA_FILENAME = 'metadata.json'
+VERSION = 0
+
+# Number of rows copied at a time when converting a table.
+_COPY_BLOCKSIZE = 2 ** 20
+
+
+class MmapDailyBarWriter(object):
+    """
+    Class capable of converting a bcolz daily bar table into the layout read
+    by MmapDailyBarReader.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory to write to. It will be created if it doesn't exist.
+
+    See Also
+    --------
+    zipline.data.mmap_daily_bars.MmapDailyBarReader
+    """
+    def __init__(self, rootdir):
+        self._rootdir = rootdir
+
+    def write_from_bcolz(self, table):
+        """
+        Copy a bcolz daily bar table into ``rootdir``.
+
+        Parameters
+        ----------
+        table : bcolz.ctable or str
+            The table to copy, or the path to its rootdir.
+
+        Returns
+        -------
+        reader : MmapDailyBarReader
+            A reader for the newly written data.
+        """
+        if not isinstance(table, ctable):
+            table = ctable(rootdir=table, mode='r')
+        rootdir = self._rootdir
+        if not os.path.isdir(rootdir):
+            os.makedirs(rootdir)
+
+        # Remove any old metadata first, so that a partially written directory
+        # can never be opened.
+        metadata_path = os.path.join(rootdir, METADATA_FILENAME)
+        if os.path.exists(metadata_path):
+            os.remove(metadata_path)
+
+        nrows = len(table)
+        for name in US_EQUITY_PRICING_BCOLZ_COLUMNS:
+            carray = table[name]
+            out = open_memmap(
+                os.path.join(rootdir, name + '.npy'),
+                mode='w+',
+                dtype=carray.dtype,
+                shape=(nrows,),
+            )
+            for start in range(0, nrows, _COPY_BLOCKSIZE):
+                stop = min(start + _COPY_BLOCKSIZE, nrows)
+                out[start:stop] = carray[start:stop]
+            out.flush()
+            del out
+
+        metadata = dict(iteritems(table.attrs.attrs))
+        metadata['version'] = VERSION
+        metadata['nrows'] = nrows
+        with open(metadata_path, 'w') as f:
+            json.dump(metadata, f)
+
+        return MmapDailyBarReader(rootdir)
+
+
+class _MmapTable(object):
+    """
+    Read-only stand-in for a bcolz ctable whose columns are memory-mapped
+    ``.npy`` files.
+
+    Supports the subset of the ctable interface used by BcolzDailyBarReader:
+    ``table[colname]``, ``len(table)`` and ``table.attrs``.
+    """
+    def __init__(self, rootdir):
+        with open(os.path.join(rootdir, METADATA_FILENAME)) as f:
+            attrs = json.load(f)
+
+        version = attrs.pop('version')
+        if version != VERSION:
+            raise ValueError(
+                'Unsupported memory-mapped daily bar version {} in {!r}; '
+                'expected {}.'.format(version, rootdir, VERSION)
+            )
+        self._nrows = attrs.pop('nrows')
+        self.attrs = _Attrs(attrs)
+        self._rootdir = rootdir
+        self._columns = {}
+
+    def __len__(self):
+        return self._nrows
+
+    def __getitem__(self, name):
+        try:
+            return self._columns[name]
+        except KeyError:
+            if name not in US_EQUITY_PRICING_BCOLZ_COLUMNS:
+                raise
+            # Map copy-on-write rather than read-only so that the arrays can
+            # be passed to Cython functions that ask for writable buffers.
+            # Nothing writes to them, so the pages stay shared with every
+            # other process mapping the same file.
+            column = self._columns[name] = np.load(
+                os.path.join(self._rootdir, name + '.npy'),
+                mmap_mode='c',
+            )
+            return column
+
+
+class _Attrs(object):
+    """Mimic the ``attrs`` object of a bcolz ctable.
+    """
+    def __init__(self, attrs):
+        self.attrs = attrs
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+
+class MmapDailyBarReader(BcolzDailyBarReader):
+    """
+    Reader for daily bars written by MmapDailyBarWriter.
+
+    The columns are memory-mapped, so ``get_value`` reads single
+    values out of the page cache, and ``load_raw_arrays`` copies each asset's
+    rows directly from the mapped pages into its output arrays without
+    decompressing or caching whole columns.
+
+    Parameters
+    ----------
+    rootdir : str
+        Directory written by MmapDailyBarWriter.
+
+    See Also
+    --------
+    zipline.data.bcolz_daily_bars.BcolzDailyBarReader
+    zipline.data.mmap_daily_bars.MmapDailyBarWriter
+    """
+    def __init__(self, rootdir):
+        # Slicing a memory-mapped column is free, so always take the
+        # whole-column path in ``load_raw_arrays``.
+        super(MmapDailyBarReader, self).__init__(
+            rootdir,
+            read_all_threshold=-1,
+        )
+
+    @lazyval
+    def _table(self):
+        return _MmapTable(self._maybe_table_rootdir)
+
+
+def is_mmap_daily_bar_dir(path):
+    """Check whether ``path`` contains data written by MmapDailyBarWriter.
+    """
+    return os.path.isfile(os.path.join(path, METADATA_FILENAME))
@@ -0,0 +1,849 @@
+"""
+Daily and minute bars stored in partitioned Parquet files.
+
+The bcolz bar stores keep one directory per column, and the minute store keeps
+one directory per asset and column, so a minute bundle with thousands of
+assets holds tens of thousands of small files. The stores in this module keep
+all of their bars in a handful of Parquet files instead::
+
+    <rootdir>/
+        metadata.json
+        part-00000.parquet
+        part-00001.parquet
+        ...
+
+Each part file holds the bars of up to ``sids_per_file`` assets in the columns
+``sid``, ``dt`` (nanoseconds since the epoch), ``open``, ``high``, ``low``,
+``close`` and ``volume``. Every row group holds the bars of a single asset,
+sorted by ``dt``. The minimum and maximum statistics of each row group's
+``sid`` and ``dt`` columns are stored in the file footers, so a reader can
+find the rows for an asset and time range by reading only the footers.
+
+Prices are stored as float64 and volumes as uint32. As with the bcolz stores,
+a price of 0 is read as nan. Minutes with no prices and no volume are not
+stored.
+
+The stores require the optional ``pyarrow`` dependency.
+"""
+from collections import namedtuple
+import json
+import os
+import uuid
+
+from lru import LRU
+import numpy as np
+import pandas as pd
+from toolz import valmap
+from trading_calendars import get_calendar
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataForSid,
+    NoDataOnDate,
+)
+from zipline.data.bcolz_daily_bars import winsorise_uint32
+from zipline.data.minute_bars import MinuteBarReader
+from zipline.data.session_bars import CurrencyAwareSessionBarReader
+from zipline.utils.cli import maybe_show_progress
+from zipline.utils.memoize import lazyval
+
+
+METADATA_FILENAME = 'metadata.json'
+VERSION = 0
+
+OHLC = ('open', 'high', 'low', 'close')
+COLUMNS = ('sid', 'dt') + OHLC + ('volume',)
+_DTYPES = {
+    'dt': np.dtype('int64'),
+    'open': np.dtype('float64'),
+    'high': np.dtype('float64'),
+    'low': np.dtype('float64'),
+    'close': np.dtype('float64'),
+    'volume': np.dtype('uint32'),
+}
+
+DEFAULT_SIDS_PER_FILE = 1000
+# A row group for every asset is small enough to read whole for daily bars.
+DEFAULT_DAILY_ROW_GROUP_SIZE = 2 ** 20
+# About 168 sessions of US equity minutes.
+DEFAULT_MINUTE_ROW_GROUP_SIZE = 2 ** 16
+# Number of decoded row group columns kept in memory by a reader.
+DEFAULT_CACHE_SIZE = 1024
+
+_PART_PREFIX = 'part-'
+_PART_SUFFIX = '.parquet'
+
+
+class ParquetMinuteOverlappingData(Exception):
+    pass
+
+
+def _check_have_pyarrow():
+    if not HAVE_PYARROW:
+        raise ImportError(
+            "Parquet bars require pyarrow, which can be installed with: "
+            "pip install 'zipline[parquet]'"
+        )
+
+
+def _part_paths(rootdir):
+    return sorted(
+        os.path.join(rootdir, name)
+        for name in os.listdir(rootdir)
+        if name.startswith(_PART_PREFIX) and name.endswith(_PART_SUFFIX)
+    )
+
+
+def is_parquet_bar_dir(path):
+    """Check whether ``path`` contains bars written by a Parquet bar writer.
+    """
+    return os.path.isfile(os.path.join(path, METADATA_FILENAME))
+
+
+_RowGroup = namedtuple('_RowGroup', 'path index start stop')
+
+
+class _ParquetBarWriter(object):
+    """
+    Base class for the Parquet bar writers.
+
+    Subclasses define ``frequency``, ``_bounds``, which returns the first and
+    last dt that may be written, and ``_prepare``, which converts the frame
+    given for an asset into the rows to store.
+    """
+    frequency = None
+
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 sids_per_file,
+                 row_group_size):
+        _check_have_pyarrow()
+        self._rootdir = rootdir
+        self._calendar = calendar
+        self._start_session = start_session
+        self._end_session = end_session
+        self._sids_per_file = sids_per_file
+        self._row_group_size = row_group_size
+
+    def _write_metadata(self):
+        if not os.path.isdir(self._rootdir):
+            os.makedirs(self._rootdir)
+        metadata = {
+            'version': VERSION,
+            'frequency': self.frequency,
+            'calendar_name': self._calendar.name,
+            'start_session': self._start_session.value,
+            'end_session': self._end_session.value,
+        }
+        with open(os.path.join(self._rootdir, METADATA_FILENAME), 'w') as f:
+            json.dump(metadata, f)
+
+    def _to_table(self, sid, frame):
+        dts = frame.index.values.astype('datetime64[ns]').view('int64')
+        arrays = [np.full(len(frame), sid, dtype='int64'), dts]
+        arrays.extend(frame[column].values.astype('float64')
+                      for column in OHLC)
+        arrays.append(frame['volume'].values.astype('uint32'))
+        return pa.Table.from_arrays(
+            [pa.array(a) for a in arrays],
+            names=list(COLUMNS),
+        )
+
+    def _write_parts(self, frames):
+        """
+        Write ``(sid, frame)`` pairs into new part files, starting a new file
+        every ``sids_per_file`` assets.
+
+        Each file is written under a temporary name and renamed into place
+        once it is complete, so readers never see a partially written file.
+        """
+        part = len(_part_paths(self._rootdir))
+        writer = None
+        nsids = 0
+        try:
+            for sid, frame in frames:
+                if not len(frame):
+                    continue
+                table = self._to_table(sid, frame)
+                if writer is None:
+                    path = os.path.join(
+                        self._rootdir,
+                        '{}{:05d}{}'.format(_PART_PREFIX, part, _PART_SUFFIX),
+                    )
+                    tmp_path = '{}.tmp-{}'.format(path, uuid.uuid4().hex)
+                    writer = pq.ParquetWriter(tmp_path, table.schema)
+                writer.write_table(table, row_group_size=self._row_group_size)
+                nsids += 1
+                if nsids == self._sids_per_file:
+                    writer.close()
+                    writer = None
+                    os.rename(tmp_path, path)
+                    nsids = 0
+                    part += 1
+            if writer is not None:
+                writer.close()
+                writer = None
+                os.rename(tmp_path, path)
+        finally:
+            if writer is not None:
+                writer.close()
+                os.remove(tmp_path)
+
+    def _checked_frames(self, data, invalid_data_behavior):
+        start, end = self._bounds()
+        for sid, frame in data:
+            frame = self._prepare(frame, invalid_data_behavior)
+            dts = frame.index.values.astype('datetime64[ns]').view('int64')
+            if len(dts) and (dts[0] < start.value or dts[-1] > end.value):
+                raise ValueError(
+                    'Bars for sid {} from {} to {} are outside of the range '
+                    'from {} to {}.'.format(
+                        sid, frame.index[0], frame.index[-1], start, end,
+                    )
+                )
+            yield sid, frame
+
+
+class ParquetDailyBarWriter(_ParquetBarWriter):
+    """
+    Class capable of writing daily OHLCV data to partitioned Parquet files
+    that can be read by ParquetDailyBarReader.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory to write to. It will be created if it doesn't exist.
+    calendar : trading_calendars.TradingCalendar
+        The calendar of the bars.
+    start_session : pd.Timestamp
+        Midnight UTC session label.
+    end_session : pd.Timestamp
+        Midnight UTC session label.
+    sids_per_file : int, optional
+        The number of assets stored in each part file.
+    row_group_size : int, optional
+        The largest number of rows stored in one row group.
+
+    See Also
+    --------
+    zipline.data.parquet_bars.ParquetDailyBarReader
+    zipline.data.bcolz_daily_bars.BcolzDailyBarWriter
+    """
+    frequency = 'daily'
+
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 sids_per_file=DEFAULT_SIDS_PER_FILE,
+                 row_group_size=DEFAULT_DAILY_ROW_GROUP_SIZE):
+        super(ParquetDailyBarWriter, self).__init__(
+            rootdir,
+            calendar,
+            start_session,
+            end_session,
+            sids_per_file,
+            row_group_size,
+        )
+
+    def write(self,
+              data,
+              assets=None,
+              show_progress=False,
+              invalid_data_behavior='warn'):
+        """
+        Replace the stored bars with ``data``.
+
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame]]
+            The data chunks to write. Each chunk should be a tuple of sid
+            and the data for that asset, indexed by session.
+        assets : set[int], optional
+            The assets that should be in ``data``. If this is provided
+            we will check ``data`` against the assets and provide better
+            progress information.
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}, optional
+            What to do when a volume is encountered that is outside the range
+            of a uint32.
+
+        Returns
+        -------
+        reader : ParquetDailyBarReader
+            A reader for the newly written bars.
+        """
+        self._write_metadata()
+        for path in _part_paths(self._rootdir):
+            os.remove(path)
+
+        if assets is not None:
+            assets = set(assets)
+
+            def check_assets(data=data):
+                for sid, frame in data:
+                    if sid not in assets:
+                        raise ValueError('unknown asset id %r' % sid)
+                    yield sid, frame
+
+            data = check_assets()
+
+        ctx = maybe_show_progress(
+            self._checked_frames(data, invalid_data_behavior),
+            show_progress=show_progress,
+            item_show_func=lambda v: v if v is None else str(v[0]),
+            label='Writing daily bars:',
+            length=len(assets) if assets is not None else None,
+        )
+        with ctx as it:
+            self._write_parts(it)
+
+        return ParquetDailyBarReader(self._rootdir)
+
+    def _bounds(self):
+        return self._start_session, self._end_session
+
+    def _prepare(self, frame, invalid_data_behavior):
+        frame = frame[list(OHLC) + ['volume']].sort_index()
+        winsorise_uint32(frame, invalid_data_behavior, 'volume')
+        return frame
+
+
+class ParquetMinuteBarWriter(_ParquetBarWriter):
+    """
+    Class capable of writing minute OHLCV data to partitioned Parquet files
+    that can be read by ParquetMinuteBarReader.
+
+    Each call to ``write`` adds new part files, so bars can be appended in
+    several batches, as long as the bars for an asset are written in order.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory to write to. It will be created if it doesn't exist.
+    calendar : trading_calendars.TradingCalendar
+        The calendar of the bars.
+    start_session : pd.Timestamp
+        Midnight UTC session label.
+    end_session : pd.Timestamp
+        Midnight UTC session label.
+    sids_per_file : int, optional
+        The number of assets stored in each part file.
+    row_group_size : int, optional
+        The largest number of rows stored in one row group.
+
+    See Also
+    --------
+    zipline.data.parquet_bars.ParquetMinuteBarReader
+    zipline.data.minute_bars.BcolzMinuteBarWriter
+    """
+    frequency = 'minute'
+
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 sids_per_file=DEFAULT_SIDS_PER_FILE,
+                 row_group_size=DEFAULT_MINUTE_ROW_GROUP_SIZE):
+        super(ParquetMinuteBarWriter, self).__init__(
+            rootdir,
+            calendar,
+            start_session,
+            end_session,
+            sids_per_file,
+            row_group_size,
+        )
+
+    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+        """
+        Write a stream of minute data.
+
+        Parameters
+        ----------
+        data : iterable[(int, pd.DataFrame)]
+            The data to write. Each element should be a tuple of sid and the
+            minute bars for that asset, with the columns 'open', 'high',
+            'low', 'close' and 'volume', indexed by UTC minute.
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}, optional
+            What to do when a volume is encountered that is outside the range
+            of a uint32.
+
+        Raises
+        ------
+        ParquetMinuteOverlappingData
+            If bars are written for an asset at or before the last minute
+            already written for it.
+        """
+        self._write_metadata()
+        last_dts = self._last_written_dts()
+
+        def check_order(data):
+            for sid, frame in data:
+                if len(frame):
+                    if sid in last_dts and frame.index[0].value <= \
+                            last_dts[sid]:
+                        raise ParquetMinuteOverlappingData(
+                            'Bars for sid {} start at {}, which is not after '
+                            'the last minute already written, {}.'.format(
+                                sid,
+                                frame.index[0],
+                                pd.Timestamp(last_dts[sid], tz='UTC'),
+                            )
+                        )
+                    last_dts[sid] = frame.index[-1].value
+                yield sid, frame
+
+        ctx = maybe_show_progress(
+            check_order(self._checked_frames(data, invalid_data_behavior)),
+            show_progress=show_progress,
+            item_show_func=lambda v: v if v is None else str(v[0]),
+            label='Writing minute bars:',
+        )
+        with ctx as it:
+            self._write_parts(it)
+
+    def _bounds(self):
+        calendar = self._calendar
+        return (
+            calendar.open_and_close_for_session(self._start_session)[0],
+            calendar.open_and_close_for_session(self._end_session)[1],
+        )
+
+    def _prepare(self, frame, invalid_data_behavior):
+        frame = frame[list(OHLC) + ['volume']].sort_index()
+        winsorise_uint32(frame, invalid_data_behavior, 'volume')
+
+        # Don't store minutes without any data; they read back as missing.
+        prices = frame[list(OHLC)].values
+        empty = (
+            ((prices == 0) | np.isnan(prices)).all(axis=1) &
+            (frame['volume'].values == 0)
+        )
+        return frame[~empty]
+
+    def _last_written_dts(self):
+        return valmap(
+            lambda row_groups: row_groups[-1].stop,
+            _index_row_groups(_part_paths(self._rootdir), pq.ParquetFile),
+        )
+
+
+def _index_row_groups(paths, open_file):
+    """
+    Build a map from sid to the row groups holding its bars, ordered by time,
+    from the statistics in the footers of the files at ``paths``.
+    """
+    sid_ix = COLUMNS.index('sid')
+    dt_ix = COLUMNS.index('dt')
+    out = {}
+    for path in paths:
+        metadata = open_file(path).metadata
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            sid = row_group.column(sid_ix).statistics.min
+            dt_stats = row_group.column(dt_ix).statistics
+            out.setdefault(sid, []).append(
+                _RowGroup(path, i, dt_stats.min, dt_stats.max),
+            )
+    for row_groups in out.values():
+        row_groups.sort(key=lambda row_group: row_group.start)
+    return out
+
+
+class _ParquetBarReader(object):
+    """
+    Base class for the Parquet bar readers.
+
+    Parameters
+    ----------
+    rootdir : str
+        Directory written by a Parquet bar writer.
+    cache_size : int, optional
+        The number of decoded row group columns to keep in memory.
+    """
+    frequency = None
+
+    def __init__(self, rootdir, cache_size=DEFAULT_CACHE_SIZE):
+        _check_have_pyarrow()
+        with open(os.path.join(rootdir, METADATA_FILENAME)) as f:
+            metadata = json.load(f)
+
+        if metadata['version'] != VERSION:
+            raise ValueError(
+                'Unsupported Parquet bar version {} in {!r}; expected '
+                '{}.'.format(metadata['version'], rootdir, VERSION)
+            )
+        if metadata['frequency'] != self.frequency:
+            raise ValueError(
+                '{!r} contains {} bars, not {} bars.'.format(
+                    rootdir,
+                    metadata['frequency'],
+                    self.frequency,
+                )
+            )
+
+        self._rootdir = rootdir
+        self._calendar = get_calendar(metadata['calendar_name'])
+        self._start_session = pd.Timestamp(metadata['start_session'], tz='UTC')
+        self._end_session = pd.Timestamp(metadata['end_session'], tz='UTC')
+        self._files = {}
+        self._cache = LRU(cache_size)
+
+    @property
+    def rootdir(self):
+        return self._rootdir
+
+    @property
+    def trading_calendar(self):
+        return self._calendar
+
+    @property
+    def first_trading_day(self):
+        return self._start_session
+
+    def _file(self, path):
+        try:
+            return self._files[path]
+        except KeyError:
+            parquet_file = self._files[path] = pq.ParquetFile(path)
+            return parquet_file
+
+    @lazyval
+    def _row_groups(self):
+        return _index_row_groups(_part_paths(self._rootdir), self._file)
+
+    def _row_groups_for_sid(self, sid):
+        try:
+            return self._row_groups[int(sid)]
+        except KeyError:
+            raise NoDataForSid(
+                'No {} bars for sid {}.'.format(self.frequency, sid),
+            )
+
+    def _read_row_group(self, row_group, columns):
+        key = (row_group.path, row_group.index)
+        cache = self._cache
+
+        out = {}
+        for column in columns:
+            try:
+                out[column] = cache[key + (column,)]
+            except KeyError:
+                pass
+
+        missing = [column for column in columns if column not in out]
+        if missing:
+            table = self._file(row_group.path).read_row_group(
+                row_group.index,
+                columns=missing,
+            )
+            for column in missing:
+                values = table.column(column).to_numpy()
+                out[column] = cache[key + (column,)] = values
+        return out
+
+    def _read(self, row_groups, columns, start, stop):
+        """
+        Read the rows with ``start <= dt <= stop`` from ``row_groups``.
+
+        Returns
+        -------
+        dts : np.array[int64]
+            The dts of the rows that were read.
+        values : dict[str -> np.array]
+            The values of each of ``columns`` in the rows that were read.
+        """
+        dts = []
+        values = {column: [] for column in columns}
+        for row_group in row_groups:
+            if row_group.stop < start or row_group.start > stop:
+                continue
+            data = self._read_row_group(row_group, ('dt',) + tuple(columns))
+            row_group_dts = data['dt']
+            lo = row_group_dts.searchsorted(start)
+            hi = row_group_dts.searchsorted(stop, side='right')
+            dts.append(row_group_dts[lo:hi])
+            for column in columns:
+                values[column].append(data[column][lo:hi])
+
+        if not dts:
+            return (
+                np.array([], dtype=_DTYPES['dt']),
+                {c: np.array([], dtype=_DTYPES[c]) for c in columns},
+            )
+        return (
+            np.concatenate(dts),
+            {c: np.concatenate(v) for c, v in values.items()},
+        )
+
+    def _load_raw_arrays(self, columns, dts, sids):
+        shape = len(dts), len(sids)
+        out = [
+            np.zeros(shape, dtype=np.uint32) if column == 'volume'
+            else np.full(shape, np.nan)
+            for column in columns
+        ]
+        if not len(dts):
+            return out
+
+        for i, sid in enumerate(sids):
+            row_groups = self._row_groups.get(int(sid))
+            if row_groups is None:
+                continue
+            found, values = self._read(row_groups, columns, dts[0], dts[-1])
+            positions = dts.searchsorted(found)
+            matched = dts[positions] == found
+            positions = positions[matched]
+            for column, buf in zip(columns, out):
+                column_values = values[column][matched]
+                if column != 'volume':
+                    column_values = np.where(
+                        column_values == 0,
+                        np.nan,
+                        column_values,
+                    )
+                buf[positions, i] = column_values
+        return out
+
+    def _get_value(self, row_groups, dt, field):
+        for row_group in row_groups:
+            if row_group.start <= dt <= row_group.stop:
+                data = self._read_row_group(row_group, ('dt', field))
+                ix = data['dt'].searchsorted(dt)
+                if ix < len(data['dt']) and data['dt'][ix] == dt:
+                    value = data[field][ix]
+                    if field == 'volume':
+                        return value
+                    return np.nan if value == 0 else value
+                break
+
+        return 0 if field == 'volume' else np.nan
+
+    def get_last_traded_dt(self, asset, dt):
+        row_groups = self._row_groups.get(int(asset))
+        if row_groups is None:
+            return pd.NaT
+
+        for row_group in reversed(row_groups):
+            if row_group.start > dt.value:
+                continue
+            data = self._read_row_group(row_group, ('dt', 'volume'))
+            hi = data['dt'].searchsorted(dt.value, side='right')
+            traded = np.flatnonzero(data['volume'][:hi])
+            if len(traded):
+                return pd.Timestamp(data['dt'][traded[-1]], tz='UTC')
+        return pd.NaT
+
+
+class ParquetDailyBarReader(_ParquetBarReader, CurrencyAwareSessionBarReader):
+    """
+    Reader for daily bars written by ParquetDailyBarWriter.
+
+    Parameters
+    ----------
+    rootdir : str
+        Directory written by ParquetDailyBarWriter.
+    cache_size : int, optional
+        The number of decoded row group columns to keep in memory.
+
+    See Also
+    --------
+    zipline.data.parquet_bars.ParquetDailyBarWriter
+    zipline.data.bcolz_daily_bars.BcolzDailyBarReader
+    """
+    frequency = 'daily'
+
+    @lazyval
+    def sessions(self):
+        return self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        )
+
+    @property
+    def last_available_dt(self):
+        return self.sessions[-1]
+
+    def _session_loc(self, date):
+        try:
+            return self.sessions.get_loc(date)
+        except KeyError:
+            raise NoDataOnDate(date)
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        start_loc = self._session_loc(start_date)
+        end_loc = self._session_loc(end_date)
+
+        row_groups = self._row_groups
+        if not any(int(asset) in row_groups for asset in assets):
+            raise ValueError(
+                'None of the requested assets have daily bars: {}'.format(
+                    list(assets),
+                )
+            )
+
+        return self._load_raw_arrays(
+            columns,
+            self.sessions[start_loc:end_loc + 1].asi8,
+            assets,
+        )
+
+    def get_value(self, sid, dt, field):
+        """
+        Retrieve the value at the given coordinates.
+
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        dt : pd.Timestamp
+            The session for the desired data point.
+        field : string
+            The OHLVC name for the desired data point.
+
+        Returns
+        -------
+        value : float|int
+            The value at the given coordinates, ``float`` for OHLC, ``int``
+            for 'volume'.
+
+        Raises
+        ------
+        NoDataOnDate
+            If ``dt`` is not a session, or is outside of the asset's lifetime.
+        NoDataForSid
+            If there are no bars for ``sid``.
+        """
+        self._session_loc(dt)
+        row_groups = self._row_groups_for_sid(sid)
+        if dt.value < row_groups[0].start:
+            raise NoDataBeforeDate(
+                'No data on or before day={} for sid={}'.format(dt, sid),
+            )
+        if dt.value > row_groups[-1].stop:
+            raise NoDataAfterDate(
+                'No data on or after day={} for sid={}'.format(dt, sid),
+            )
+        return self._get_value(row_groups, dt.value, field)
+
+    def currency_codes(self, sids):
+        # Like BcolzDailyBarReader, this store doesn't record currencies, so
+        # all known sids are assumed to be quoted in USD.
+        row_groups = self._row_groups
+        return np.array(
+            ['USD' if int(sid) in row_groups else None for sid in sids],
+            dtype=object,
+        )
+
+
+class ParquetMinuteBarReader(_ParquetBarReader, MinuteBarReader):
+    """
+    Reader for minute bars written by ParquetMinuteBarWriter.
+
+    Parameters
+    ----------
+    rootdir : str
+        Directory written by ParquetMinuteBarWriter.
+    cache_size : int, optional
+        The number of decoded row group columns to keep in memory.
+
+    See Also
+    --------
+    zipline.data.parquet_bars.ParquetMinuteBarWriter
+    zipline.data.minute_bars.BcolzMinuteBarReader
+    """
+    frequency = 'minute'
+
+    @property
+    def calendar(self):
+        return self._calendar
+
+    @property
+    def last_available_dt(self):
+        return self._calendar.open_and_close_for_session(self._end_session)[1]
+
+    @lazyval
+    def _minutes(self):
+        return self._calendar.minutes_for_sessions_in_range(
+            self._start_session,
+            self._end_session,
+        ).asi8
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        """
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (minutes in range, sids) with a dtype of float64, containing the
+            values for the respective field over start and end dt range.
+        """
+        for sid in sids:
+            self._row_groups_for_sid(sid)
+
+        minutes = self._minutes
+        dts = minutes[
+            minutes.searchsorted(start_dt.value):
+            minutes.searchsorted(end_dt.value, side='right')
+        ]
+        return self._load_raw_arrays(fields, dts, sids)
+
+    def get_value(self, sid, dt, field):
+        """
+        Retrieve the pricing info for the given sid, dt, and field.
+
+        Parameters
+        ----------
+        sid : int
+            Asset identifier.
+        dt : datetime-like
+            The datetime at which the trade occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        out : float|int
+            The value, or nan for OHLC if there was no trade at ``dt``.
+            Volume is 0 if there was no trade.
+
+        Raises
+        ------
+        NoDataOnDate
+            If ``dt`` is not a market minute of the stored sessions.
+        NoDataForSid
+            If there are no bars for ``sid``.
+        """
+        minutes = self._minutes
+        ix = minutes.searchsorted(dt.value)
+        if ix == len(minutes) or minutes[ix] != dt.value:
+            raise NoDataOnDate(dt)
+        return self._get_value(self._row_groups_for_sid(sid), dt.value, field)
@@ -13,10 +13,13 @@
 # limitations under the License.
 from collections import OrderedDict
 from abc import ABCMeta, abstractmethod
+import os
+import shutil
 
 import numpy as np
 import pandas as pd
 from six import with_metaclass
+from toolz import partition_all
 
 from zipline.data._resample import (
     _minute_to_session_open,
@@ -25,11 +28,17 @@ from zipline.data._resample import (
     _minute_to_session_close,
     _minute_to_session_volume,
 )
-from zipline.data.bar_reader import NoDataOnDate
+from zipline.data.bar_reader import NoDataForSid, NoDataOnDate
+from zipline.data.bcolz_daily_bars import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+)
 from zipline.data.minute_bars import MinuteBarReader
 from zipline.data.session_bars import SessionBarReader
 from zipline.utils.memoize import lazyval
 
+DAILY_ROLLUP_DIRNAME = 'daily_rollup.bcolz'
+
 _MINUTE_TO_SESSION_OHCLV_HOW = OrderedDict((
     ('open', 'first'),
     ('high', 'max'),
@@ -100,6 +109,54 @@ def minute_to_session(column, close_locs, data, out):
     return out
 
 
+def _fold_open(values, window):
+    # The first non-nan open in the window, unless an open was already seen.
+    seen = ~np.isnan(window)
+    first = window[seen.argmax(axis=0), np.arange(window.shape[1])]
+    first[~seen.any(axis=0)] = np.nan
+    return np.where(np.isnan(values), first, values)
+
+
+def _fold_high(values, window):
+    return np.fmax(values, np.fmax.reduce(window, axis=0))
+
+
+def _fold_low(values, window):
+    return np.fmin(values, np.fmin.reduce(window, axis=0))
+
+
+def _fold_close(values, window):
+    # The last non-nan close in the window, else the close already seen.
+    seen = ~np.isnan(window)
+    last_row = len(window) - 1 - seen[::-1].argmax(axis=0)
+    last = window[last_row, np.arange(window.shape[1])]
+    return np.where(seen.any(axis=0), last, values)
+
+
+def _fold_volume(values, window):
+    return values + np.nansum(window, axis=0)
+
+
+_FOLDS = {
+    'open': _fold_open,
+    'high': _fold_high,
+    'low': _fold_low,
+    'close': _fold_close,
+    'volume': _fold_volume,
+}
+
+# The value of a field before any minutes of the session have been seen.
+_EMPTY = {
+    'open': np.nan,
+    'high': np.nan,
+    'low': np.nan,
+    'close': np.nan,
+    'volume': 0.0,
+}
+
+_UNVISITED = np.iinfo(np.int64).min
+
+
 class DailyHistoryAggregator(object):
     """
     Converts minute pricing data into a daily summary, to be used for the
@@ -119,50 +176,118 @@ class DailyHistoryAggregator(object):
         self._minute_reader = minute_reader
         self._trading_calendar = trading_calendar
 
-        # The caches are structured as (date, market_open, entries), where
-        # entries is a dict of asset -> (last_visited_dt, value)
-        #
-        # Whenever an aggregation method determines the current value,
-        # the entry for the respective asset should be overwritten with a new
-        # entry for the current dt.value (int) and aggregation value.
+        # Each asset is given a slot in the state arrays the first time it is
+        # requested, and keeps it for the life of the aggregator.
+        self._slots = {}
+
+        # The states are structured as (session, market_open, values,
+        # last_visited), where values holds the running aggregate of each
+        # slot and last_visited the dt.value (int) of the last minute folded
+        # into it.
         #
-        # When the requested dt's date is different from date the cache is
-        # flushed, so that the cache entries do not grow unbounded.
+        # Each request folds the minutes after each asset's last visited
+        # minute into its running value, in one read per distinct last
+        # visited minute. When assets are requested every minute, that is a
+        # single read of the current minute for all of them.
         #
-        # Example cache:
-        # cache = (date(2016, 3, 17),
-        #          pd.Timestamp('2016-03-17 13:31', tz='UTC'),
-        #          {
-        #              1: (1458221460000000000, np.nan),
-        #              2: (1458221460000000000, 42.0),
-        #         })
-        self._caches = {
+        # When the requested dt's session is different from the state's
+        # session the state is reset.
+        self._states = {
             'open': None,
             'high': None,
             'low': None,
             'close': None,
-            'volume': None
+            'volume': None,
         }
 
         # The int value is used for deltas to avoid extra computation from
         # creating new Timestamps.
         self._one_min = pd.Timedelta('1 min').value
 
-    def _prelude(self, dt, field):
+    def _slots_for(self, assets):
+        slots = self._slots
+        return np.array(
+            [slots.setdefault(asset, len(slots)) for asset in assets],
+            dtype=np.intp,
+        )
+
+    def _state(self, field, session):
+        size = len(self._slots)
+        state = self._states[field]
+        if state is None or state[0] != session:
+            market_open = self._market_opens.loc[session].tz_localize('UTC')
+            state = self._states[field] = (
+                session,
+                market_open,
+                np.full(size, _EMPTY[field]),
+                np.full(size, _UNVISITED, dtype=np.int64),
+            )
+        elif len(state[2]) < size:
+            # Grow geometrically so that adding assets is amortized O(1).
+            capacity = max(size, 2 * len(state[2]))
+            _, market_open, values, last_visited = state
+            grown_values = np.full(capacity, _EMPTY[field])
+            grown_values[:len(values)] = values
+            grown_last_visited = np.full(capacity, _UNVISITED, dtype=np.int64)
+            grown_last_visited[:len(last_visited)] = last_visited
+            state = self._states[field] = (
+                session,
+                market_open,
+                grown_values,
+                grown_last_visited,
+            )
+        return state
+
+    def _aggregate(self, field, assets, dt):
         session = self._trading_calendar.minute_to_session_label(dt)
+        out = np.full(len(assets), _EMPTY[field])
+
+        alive = np.array(
+            [asset.is_alive_for_session(session) for asset in assets],
+            dtype=bool,
+        )
+        if not alive.any():
+            return out
+        live_assets = [asset for asset, a in zip(assets, alive) if a]
+
+        slots = self._slots_for(live_assets)
+        _, market_open, values, last_visited = self._state(field, session)
+
+        one_min = self._one_min
         dt_value = dt.value
-        cache = self._caches[field]
-        if cache is None or cache[0] != session:
-            market_open = self._market_opens.loc[session]
-            cache = self._caches[field] = (session, market_open, {})
-
-        _, market_open, entries = cache
-        market_open = market_open.tz_localize('UTC')
-        if dt != market_open:
-            prev_dt = dt_value - self._one_min
-        else:
-            prev_dt = None
-        return market_open, prev_dt, dt_value, entries
+        last = last_visited[slots]
+
+        # Assets not yet seen this session, or seen after dt, are aggregated
+        # from the market open.
+        stale = (last == _UNVISITED) | (last > dt_value)
+        if stale.any():
+            values[slots[stale]] = _EMPTY[field]
+            last[stale] = market_open.value - one_min
+
+        fold = _FOLDS[field]
+        pending = last < dt_value
+        for start in np.unique(last[pending]):
+            group = np.flatnonzero(pending & (last == start))
+            group_assets = [live_assets[i] for i in group]
+            if start == dt_value - one_min:
+                window = self._minute_reader.get_values(
+                    group_assets,
+                    dt,
+                    field,
+                )[np.newaxis]
+            else:
+                window = self._minute_reader.load_raw_arrays(
+                    [field],
+                    pd.Timestamp(start + one_min, tz='UTC'),
+                    dt,
+                    group_assets,
+                )[0]
+            group_slots = slots[group]
+            values[group_slots] = fold(values[group_slots], window)
+
+        last_visited[slots] = dt_value
+        out[alive] = values[slots]
+        return out
 
     def opens(self, assets, dt):
         """
@@ -177,64 +302,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'open')
-
-        opens = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                opens.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'open')
-                entries[asset] = (dt_value, val)
-                opens.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, first_open = entries[asset]
-                    if last_visited_dt == dt_value:
-                        opens.append(first_open)
-                        continue
-                    elif not pd.isnull(first_open):
-                        opens.append(first_open)
-                        entries[asset] = (dt_value, first_open)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['open'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        nonnan = window[~pd.isnull(window)]
-                        if len(nonnan):
-                            val = nonnan[0]
-                        else:
-                            val = np.nan
-                        entries[asset] = (dt_value, val)
-                        opens.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['open'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    nonnan = window[~pd.isnull(window)]
-                    if len(nonnan):
-                        val = nonnan[0]
-                    else:
-                        val = np.nan
-                    entries[asset] = (dt_value, val)
-                    opens.append(val)
-                    continue
-        return np.array(opens)
+        return self._aggregate('open', assets, dt)
 
     def highs(self, assets, dt):
         """
@@ -246,64 +314,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'high')
-
-        highs = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                highs.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'high')
-                entries[asset] = (dt_value, val)
-                highs.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_max = entries[asset]
-                    if last_visited_dt == dt_value:
-                        highs.append(last_max)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'high')
-                        if pd.isnull(curr_val):
-                            val = last_max
-                        elif pd.isnull(last_max):
-                            val = curr_val
-                        else:
-                            val = max(last_max, curr_val)
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['high'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmax(np.append(window, last_max))
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['high'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmax(window)
-                    entries[asset] = (dt_value, val)
-                    highs.append(val)
-                    continue
-        return np.array(highs)
+        return self._aggregate('high', assets, dt)
 
     def lows(self, assets, dt):
         """
@@ -315,59 +326,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'low')
-
-        lows = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                lows.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'low')
-                entries[asset] = (dt_value, val)
-                lows.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_min = entries[asset]
-                    if last_visited_dt == dt_value:
-                        lows.append(last_min)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'low')
-                        val = np.nanmin([last_min, curr_val])
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['low'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmin(np.append(window, last_min))
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['low'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmin(window)
-                    entries[asset] = (dt_value, val)
-                    lows.append(val)
-                    continue
-        return np.array(lows)
+        return self._aggregate('low', assets, dt)
 
     def closes(self, assets, dt):
         """
@@ -381,69 +340,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'close')
-
-        closes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        def _get_filled_close(asset):
-            """
-            Returns the most recent non-nan close for the asset in this
-            session. If there has been no data in this session on or before the
-            `dt`, returns `nan`
-            """
-            window = self._minute_reader.load_raw_arrays(
-                ['close'],
-                market_open,
-                dt,
-                [asset],
-            )[0]
-            try:
-                return window[~np.isnan(window)][-1]
-            except IndexError:
-                return np.NaN
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                closes.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'close')
-                entries[asset] = (dt_value, val)
-                closes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_close = entries[asset]
-                    if last_visited_dt == dt_value:
-                        closes.append(last_close)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = last_close
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                    else:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = _get_filled_close(asset)
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                except KeyError:
-                    val = self._minute_reader.get_value(
-                        asset, dt, 'close')
-                    if pd.isnull(val):
-                        val = _get_filled_close(asset)
-                    entries[asset] = (dt_value, val)
-                    closes.append(val)
-                    continue
-        return np.array(closes)
+        return self._aggregate('close', assets, dt)
 
     def volumes(self, assets, dt):
         """
@@ -455,59 +352,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=int64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'volume')
-
-        volumes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                volumes.append(0)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'volume')
-                entries[asset] = (dt_value, val)
-                volumes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_total = entries[asset]
-                    if last_visited_dt == dt_value:
-                        volumes.append(last_total)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'volume')
-                        val += last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['volume'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        val = np.nansum(window) + last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['volume'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    val = np.nansum(window)
-                    entries[asset] = (dt_value, val)
-                    volumes.append(val)
-                    continue
-        return np.array(volumes)
+        return self._aggregate('volume', assets, dt).astype(np.int64)
 
 
 class MinuteResampleSessionBarReader(SessionBarReader):
@@ -598,6 +443,138 @@ class MinuteResampleSessionBarReader(SessionBarReader):
             self._minute_bar_reader.get_last_traded_dt(asset, dt))
 
 
+def daily_rollup_path(minute_rootdir):
+    """The path of the session bars rolled up from the minute bars stored
+    in ``minute_rootdir``.
+    """
+    return os.path.join(minute_rootdir, DAILY_ROLLUP_DIRNAME)
+
+
+def write_daily_rollup(minute_bar_reader,
+                       sids,
+                       show_progress=False,
+                       sids_per_read=64,
+                       sessions_per_read=256):
+    """
+    Resample minute bars to session bars once, and store them with the
+    minute bars as a bcolz daily bar table.
+
+    Readers of the rollup serve daily requests without resampling minutes on
+    every call. :func:`daily_rollup_reader` finds the rollup of a minute bar
+    reader, and :class:`~zipline.data.data_portal.DataPortal` prefers it to
+    resampling minutes.
+
+    Parameters
+    ----------
+    minute_bar_reader : BcolzMinuteBarReader
+        The minute bars to roll up. The rollup is written in its rootdir,
+        replacing any existing rollup.
+    sids : iterable[int]
+        The assets to roll up. Assets without minute bars are skipped.
+    show_progress : bool, optional
+        Whether or not to show a progress bar while writing.
+    sids_per_read : int, optional
+        The number of assets to resample at once.
+    sessions_per_read : int, optional
+        The number of sessions of minutes to read at once.
+
+    Returns
+    -------
+    reader : BcolzDailyBarReader
+        A reader for the rollup.
+
+    Notes
+    -----
+    Prices are stored with the precision of a bcolz daily bar table, three
+    decimal places. The rollup isn't updated when minute bars are written
+    afterwards, and must be written again.
+    """
+    calendar = minute_bar_reader.trading_calendar
+    sessions = calendar.sessions_in_range(
+        minute_bar_reader.first_trading_day,
+        calendar.minute_to_session_label(minute_bar_reader.last_available_dt),
+    )
+    resampler = MinuteResampleSessionBarReader(calendar, minute_bar_reader)
+    columns = list(_MINUTE_TO_SESSION_OHCLV_HOW)
+
+    first_minute = calendar.session_open(sessions[0])
+
+    def has_minute_bars(sid):
+        try:
+            minute_bar_reader.get_value(sid, first_minute, 'volume')
+        except NoDataForSid:
+            return False
+        return True
+
+    sids = [sid for sid in sids if has_minute_bars(sid)]
+
+    def session_frames():
+        for block in partition_all(sids_per_read, sids):
+            chunks = [
+                resampler.load_raw_arrays(
+                    columns,
+                    chunk[0],
+                    chunk[-1],
+                    block,
+                )
+                for chunk in partition_all(sessions_per_read, sessions)
+            ]
+            arrays = [np.concatenate(column) for column in zip(*chunks)]
+            for i, sid in enumerate(block):
+                # Sessions without trades are stored as 0, like in any other
+                # bcolz daily bar table.
+                yield sid, pd.DataFrame(
+                    OrderedDict(
+                        (column, array[:, i])
+                        for column, array in zip(columns, arrays)
+                    ),
+                    index=sessions,
+                ).fillna(0)
+
+    path = daily_rollup_path(minute_bar_reader.rootdir)
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    BcolzDailyBarWriter(path, calendar, sessions[0], sessions[-1]).write(
+        session_frames(),
+        assets=sids,
+        show_progress=show_progress,
+    )
+    return BcolzDailyBarReader(path)
+
+
+def daily_rollup_reader(minute_bar_reader):
+    """
+    Get a reader for the session bars written by :func:`write_daily_rollup`
+    for ``minute_bar_reader``.
+
+    Parameters
+    ----------
+    minute_bar_reader : MinuteBarReader
+        The minute bars that were rolled up.
+
+    Returns
+    -------
+    reader : BcolzDailyBarReader or None
+        A reader for the rollup, or None if the minute bars have no rollup, or
+        their sessions extend past the rollup's.
+    """
+    rootdir = getattr(minute_bar_reader, 'rootdir', None)
+    if rootdir is None:
+        return None
+
+    path = daily_rollup_path(rootdir)
+    if not os.path.isdir(path):
+        return None
+
+    reader = BcolzDailyBarReader(path)
+    last_session = minute_bar_reader.trading_calendar.minute_to_session_label(
+        minute_bar_reader.last_available_dt,
+    )
+    if reader.last_available_dt < last_session:
+        return None
+    return reader
+
+
 class ReindexBarReader(with_metaclass(ABCMeta)):
     """
     A base class for readers which reindexes results, filling in the additional
@@ -659,6 +636,9 @@ class ReindexBarReader(with_metaclass(ABCMeta)):
             else:
                 return np.nan
 
+    def get_values(self, sids, dt, field):
+        return self._reader.get_values(sids, dt, field)
+
     @abstractmethod
     def _outer_dts(self, start_dt, end_dt):
         raise NotImplementedError
@@ -0,0 +1,228 @@
+"""
+A SessionBarReader that reuses previously-read rows for rolling requests.
+"""
+from collections import OrderedDict, namedtuple
+import threading
+
+import numpy as np
+from six import itervalues
+
+from zipline.data.bar_reader import NoDataOnDate
+from zipline.data.session_bars import SessionBarReader
+
+
+# The raw arrays of one cached window, with their columns sorted by sid.
+_Block = namedtuple('_Block', 'start_idx end_idx sids arrays')
+
+
+class RollingSessionBarReader(SessionBarReader):
+    """
+    A SessionBarReader that remembers the blocks of raw arrays it read and
+    serves overlapping rows of subsequent ``load_raw_arrays`` calls from
+    memory.
+
+    This is designed for pipelines run one day (or a few days) at a time,
+    e.g. an algorithm's pipeline attached with ``chunks=1``. Each such run
+    asks for the same trailing windows shifted forward by a session, so only
+    the newest rows need to be read from the wrapped reader.
+
+    A pipeline reads one window per group of columns loaded with the same
+    number of extra rows, so one block is kept per set of columns and window
+    length. Each request extends its block with the rows it reads, and drops
+    the rows before its start.
+
+    Parameters
+    ----------
+    reader : SessionBarReader
+        The reader to wrap.
+    max_blocks : int, optional
+        The number of blocks to keep. The least recently used block is
+        dropped past this.
+
+    Notes
+    -----
+    Only raw, unadjusted arrays are reused. Adjustments are still computed
+    for the full window by the caller, so reusing rows never changes the
+    values seen by pipeline terms.
+
+    Arrays returned by ``load_raw_arrays`` are always fresh copies that the
+    caller may modify in place.
+
+    Calls to ``load_raw_arrays`` are serialized with a lock, so the reader
+    may be shared by pipelines computed on a pool.
+    """
+    def __init__(self, reader, max_blocks=16):
+        self._reader = reader
+        self._max_blocks = max_blocks
+
+        # (frozenset(columns), end_idx - start_idx) -> _Block, least recently
+        # used first.
+        self._blocks = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def trading_calendar(self):
+        return self._reader.trading_calendar
+
+    @property
+    def sessions(self):
+        return self._reader.sessions
+
+    @property
+    def last_available_dt(self):
+        return self._reader.last_available_dt
+
+    @property
+    def first_trading_day(self):
+        return self._reader.first_trading_day
+
+    def get_value(self, sid, dt, field):
+        return self._reader.get_value(sid, dt, field)
+
+    def get_values(self, sids, dt, field):
+        return self._reader.get_values(sids, dt, field)
+
+    def get_last_traded_dt(self, asset, dt):
+        return self._reader.get_last_traded_dt(asset, dt)
+
+    def currency_codes(self, sids):
+        return self._reader.currency_codes(sids)
+
+    def _date_to_index(self, date):
+        try:
+            return self.sessions.get_loc(date)
+        except KeyError:
+            raise NoDataOnDate(date)
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        with self._lock:
+            return self._load_raw_arrays(
+                columns, start_date, end_date, assets,
+            )
+
+    def _find_block(self, key, columns, start_idx):
+        """
+        Find the block to serve a request from: the request's own block if it
+        starts inside it, otherwise the block starting before and ending
+        after ``start_idx`` that holds the most of ``columns``.
+        """
+        block = self._blocks.get(key)
+        if block is not None and block.start_idx <= start_idx <= block.end_idx:
+            return block
+
+        best = None
+        best_count = 0
+        for block in itervalues(self._blocks):
+            if not block.start_idx <= start_idx <= block.end_idx:
+                continue
+            count = sum(1 for c in columns if c in block.arrays)
+            if count > best_count:
+                best, best_count = block, count
+        return best
+
+    def _load_raw_arrays(self, columns, start_date, end_date, assets):
+        columns = list(columns)
+        assets = np.asarray(assets)
+        sessions = self.sessions
+        start_idx = self._date_to_index(start_date)
+        end_idx = self._date_to_index(end_date)
+        key = frozenset(columns), end_idx - start_idx
+
+        block = self._find_block(key, columns, start_idx)
+        if block is None:
+            # Nothing to reuse.
+            results = self._reader.load_raw_arrays(
+                columns, start_date, end_date, assets,
+            )
+            self._remember(key, columns, results, start_idx, end_idx, assets)
+            return results
+
+        cached_fields = [c for c in columns if c in block.arrays]
+
+        # Rows [start_idx, overlap_end_idx] can be served from memory.
+        overlap_end_idx = min(end_idx, block.end_idx)
+        row_slice = slice(
+            start_idx - block.start_idx,
+            overlap_end_idx - block.start_idx + 1,
+        )
+
+        # Columns of ``assets`` that we have cached, and where they live in
+        # the cached block.
+        cached_sids = block.sids
+        if len(cached_sids):
+            positions = np.searchsorted(cached_sids, assets)
+            positions[positions == len(cached_sids)] = 0
+            known = cached_sids[positions] == assets
+        else:
+            positions = np.zeros(len(assets), dtype=int)
+            known = np.zeros(len(assets), dtype=bool)
+        unknown = ~known
+
+        new_fields = [c for c in columns if c not in block.arrays]
+        by_field = {}
+        if new_fields:
+            new_field_results = self._reader.load_raw_arrays(
+                new_fields, start_date, end_date, assets,
+            )
+            by_field.update(zip(new_fields, new_field_results))
+
+        if unknown.any():
+            # Assets that aren't in the block need the overlapping rows read
+            # from the underlying reader.
+            unknown_results = self._reader.load_raw_arrays(
+                cached_fields,
+                start_date,
+                sessions[overlap_end_idx],
+                assets[unknown],
+            )
+        else:
+            unknown_results = [None] * len(cached_fields)
+
+        if end_idx > overlap_end_idx:
+            tail_results = self._reader.load_raw_arrays(
+                cached_fields,
+                sessions[overlap_end_idx + 1],
+                end_date,
+                assets,
+            )
+        else:
+            tail_results = [None] * len(cached_fields)
+
+        num_overlap = row_slice.stop - row_slice.start
+        for field, unknown_result, tail_result in zip(cached_fields,
+                                                      unknown_results,
+                                                      tail_results):
+            cached = block.arrays[field]
+            out = np.empty(
+                (end_idx - start_idx + 1, len(assets)),
+                dtype=cached.dtype,
+            )
+            out[:num_overlap, known] = cached[row_slice, positions[known]]
+            if unknown_result is not None:
+                out[:num_overlap, unknown] = unknown_result
+            if tail_result is not None:
+                out[num_overlap:] = tail_result
+            by_field[field] = out
+
+        results = [by_field[c] for c in columns]
+        self._remember(key, columns, results, start_idx, end_idx, assets)
+        return results
+
+    def _remember(self, key, columns, results, start_idx, end_idx, assets):
+        """Store ``results`` as the block for ``key``.
+
+        The cached arrays are stored with their columns sorted by sid. This
+        always makes a copy of ``results``, so callers are free to modify the
+        arrays we return.
+        """
+        order = np.argsort(assets, kind='mergesort')
+        self._blocks.pop(key, None)
+        self._blocks[key] = _Block(
+            start_idx,
+            end_idx,
+            assets[order],
+            {column: result[:, order]
+             for column, result in zip(columns, results)},
+        )
+        while len(self._blocks) > self._max_blocks:
+            self._blocks.popitem(last=False)
@@ -0,0 +1,150 @@
+"""
+Daily bars published once to shared memory and attached to by many processes.
+
+A published table uses the layout written by
+:class:`~zipline.data.mmap_daily_bars.MmapDailyBarWriter` (the raw OHLCV, day
+and id columns, plus the first row, last row and calendar offset of every
+asset), placed on the host's POSIX shared memory filesystem instead of on
+disk. Attaching a :class:`SharedMemoryDailyBarReader` only maps the published
+files, so it is nearly free, and every attached process shares the same
+physical pages.
+
+Published tables live until they are unlinked with :func:`unlink_daily_bars`
+or the host restarts. Processes that are still attached to an unlinked table
+keep working; the memory is released when the last of them exits.
+"""
+import os
+import shutil
+import tempfile
+import uuid
+
+from .mmap_daily_bars import (
+    MmapDailyBarReader,
+    MmapDailyBarWriter,
+    is_mmap_daily_bar_dir,
+)
+
+
+# Directory backing POSIX shared memory (``shm_open``) on Linux. Elsewhere,
+# fall back to the temp directory: mappings of the same file are still shared
+# through the page cache, but the data is also written to disk.
+if os.path.isdir('/dev/shm'):
+    SHARED_MEMORY_DIR = '/dev/shm'
+else:
+    SHARED_MEMORY_DIR = tempfile.gettempdir()
+
+_PREFIX = 'zipline-daily-bars-'
+
+
+def shared_daily_bars_path(name, shm_dir=None):
+    """Get the path of the daily bars published under ``name``.
+
+    Parameters
+    ----------
+    name : str
+        The name the bars were published under.
+    shm_dir : str, optional
+        The shared memory directory. Defaults to ``SHARED_MEMORY_DIR``.
+
+    Returns
+    -------
+    path : str
+    """
+    if shm_dir is None:
+        shm_dir = SHARED_MEMORY_DIR
+    return os.path.join(shm_dir, _PREFIX + name)
+
+
+def is_published(name, shm_dir=None):
+    """Check whether daily bars have been published under ``name``.
+    """
+    return is_mmap_daily_bar_dir(shared_daily_bars_path(name, shm_dir))
+
+
+def publish_daily_bars(name, table, shm_dir=None):
+    """Copy a bcolz daily bar table into shared memory.
+
+    The copy is written under a temporary name and then renamed into place,
+    so readers never attach to a partially written table. Publishing over an
+    existing name replaces it.
+
+    Parameters
+    ----------
+    name : str
+        The name to publish the bars under.
+    table : bcolz.ctable or str
+        The table to copy, or the path to its rootdir.
+    shm_dir : str, optional
+        The shared memory directory. Defaults to ``SHARED_MEMORY_DIR``.
+
+    Returns
+    -------
+    reader : SharedMemoryDailyBarReader
+        A reader attached to the published bars.
+    """
+    path = shared_daily_bars_path(name, shm_dir)
+    tmp_path = '{}.tmp-{}'.format(path, uuid.uuid4().hex)
+    try:
+        MmapDailyBarWriter(tmp_path).write_from_bcolz(table)
+        unlink_daily_bars(name, shm_dir)
+        os.rename(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+
+    return SharedMemoryDailyBarReader(name, shm_dir)
+
+
+def unlink_daily_bars(name, shm_dir=None):
+    """Remove the daily bars published under ``name``, if any.
+
+    Parameters
+    ----------
+    name : str
+        The name the bars were published under.
+    shm_dir : str, optional
+        The shared memory directory. Defaults to ``SHARED_MEMORY_DIR``.
+
+    Returns
+    -------
+    unlinked : bool
+        Whether anything was removed.
+    """
+    path = shared_daily_bars_path(name, shm_dir)
+    if not os.path.exists(path):
+        return False
+    shutil.rmtree(path)
+    return True
+
+
+class SharedMemoryDailyBarReader(MmapDailyBarReader):
+    """
+    Reader for daily bars published to shared memory with
+    :func:`publish_daily_bars`.
+
+    Parameters
+    ----------
+    name : str
+        The name the bars were published under.
+    shm_dir : str, optional
+        The shared memory directory. Defaults to ``SHARED_MEMORY_DIR``.
+
+    Raises
+    ------
+    ValueError
+        If nothing has been published under ``name``.
+
+    See Also
+    --------
+    zipline.data.mmap_daily_bars.MmapDailyBarReader
+    """
+    def __init__(self, name, shm_dir=None):
+        if not is_published(name, shm_dir):
+            raise ValueError(
+                'No daily bars have been published to shared memory under '
+                'the name {!r}.'.format(name)
+            )
+        super(SharedMemoryDailyBarReader, self).__init__(
+            shared_daily_bars_path(name, shm_dir),
+        )
+        self.name = name
@@ -36,12 +36,18 @@ cdef class AdjustedArrayWindow:
     The `rounding_places` attribute is an integer used to specify the number of
     decimal places to which the data should be rounded, given that the data is
     of dtype float. If `rounding_places` is None, no rounding occurs.
+
+    The `adjusted` attribute is True if the most recent step applied an
+    adjustment to any row visible in the previous or current window. Rolling
+    computations can use this to decide whether they need to recompute from
+    the full window.
     """
     cdef:
         # ctype must be defined by the file into which this is being copied.
         readonly databuffer data
         readonly dict view_kwargs
         readonly Py_ssize_t window_length
+        readonly bint adjusted
         Py_ssize_t anchor, max_anchor, next_adj
         Py_ssize_t perspective_offset
         object rounding_places
@@ -78,6 +84,7 @@ cdef class AdjustedArrayWindow:
 
         self.next_adj = self.pop_next_adj()
         self.output = None
+        self.adjusted = False
 
     cdef pop_next_adj(self):
         """
@@ -120,10 +127,14 @@ cdef class AdjustedArrayWindow:
             object adjustment
             Py_ssize_t anchor = self.anchor
             Py_ssize_t target = anchor + N
+            # First row of the window we're moving away from.
+            Py_ssize_t visible_start = anchor - self.window_length
 
         if target > self.max_anchor:
             raise Exhausted()
 
+        self.adjusted = False
+
         # Apply any adjustments that occured before our current anchor.
         # Equivalently, apply any adjustments known **on or before** the date
         # for which we're calculating a window.
@@ -131,6 +142,8 @@ cdef class AdjustedArrayWindow:
 
             for adjustment in self.adjustments[self.next_adj]:
                 adjustment.mutate(self.data)
+                if adjustment.last_row >= visible_start:
+                    self.adjusted = True
 
             self.next_adj = self.pop_next_adj()
 
@@ -10,6 +10,7 @@ from numpy import (
     int16,
     uint16,
     ndarray,
+    searchsorted,
     uint32,
     uint8,
 )
@@ -19,6 +20,7 @@ from zipline.errors import (
     WindowLengthNotPositive,
     WindowLengthTooLong,
 )
+from zipline.lib.adjustment import ArrayAdjustment
 from zipline.lib.labelarray import LabelArray
 from zipline.utils.numpy_utils import (
     datetime64ns_dtype,
@@ -223,6 +225,62 @@ class AdjustedArray(object):
             self.missing_value,
         )
 
+    def take_columns(self, columns):
+        """Produce a new adjusted array containing only ``columns``.
+
+        Parameters
+        ----------
+        columns : np.ndarray[int64]
+            Sorted, unique indices of the columns to keep.
+
+        Returns
+        -------
+        taken : AdjustedArray
+            A new adjusted array whose data is a copy of ``columns`` of our
+            data, and whose adjustments are remapped to the new column
+            indices. Adjustments that don't touch any of ``columns`` are
+            dropped.
+
+        Notes
+        -----
+        Only scalar-valued adjustments are supported. A TypeError is raised
+        if any of our adjustments is an ArrayAdjustment.
+        """
+        if self._invalidated:
+            raise ValueError(
+                'cannot take columns of invalidated AdjustedArray'
+            )
+
+        adjustments = {}
+        for row, row_adjustments in iteritems(self.adjustments):
+            taken = []
+            for adjustment in row_adjustments:
+                if isinstance(adjustment, ArrayAdjustment):
+                    raise TypeError(
+                        "Can't take columns of %s" % type(adjustment).__name__
+                    )
+
+                # The kept columns inside [first_col, last_col] are
+                # contiguous in the output, so each adjustment maps to at
+                # most one new adjustment.
+                first_col = searchsorted(columns, adjustment.first_col, 'left')
+                last_col = searchsorted(columns, adjustment.last_col, 'right')
+                if first_col == last_col:
+                    continue
+
+                cls, args = adjustment.__reduce__()
+                taken.append(
+                    cls(args[0], args[1], first_col, last_col - 1, *args[4:])
+                )
+            if taken:
+                adjustments[row] = taken
+
+        return type(self)(
+            self.data[:, columns],
+            adjustments,
+            self.missing_value,
+        )
+
     def update_adjustments(self, adjustments, method):
         """
         Merge ``adjustments`` with existing adjustments, handling index
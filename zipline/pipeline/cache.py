@@ -0,0 +1,342 @@
+"""
+Persistent on-disk cache of computed pipeline terms.
+"""
+import errno
+from hashlib import sha1
+import os
+from uuid import uuid4
+
+import numpy as np
+from six import iteritems, PY2
+
+from zipline.lib.labelarray import LabelArray
+from zipline.utils.paths import ensure_directory
+
+from .domain import Domain, GENERIC
+from .term import ComputableTerm, Term
+
+
+class DiskTermCache(object):
+    """A content-addressed, size-bounded disk cache of computed term results.
+
+    Results are stored as one ``.npy`` file per entry, keyed on the term's
+    structural identity, the domain of execution, the dates and assets the
+    result is labelled with, and a user-supplied ``data_version``.
+
+    Entries are evicted in least-recently-used order, using file modification
+    times as the recency marker, whenever the total size of the cache exceeds
+    ``max_size_bytes``.
+
+    Parameters
+    ----------
+    path : str
+        Directory in which to store cached results. Created if it doesn't
+        exist.
+    data_version : str
+        A string identifying the underlying data. Entries written with a
+        different ``data_version`` are never read. This should normally be the
+        ingestion timestamp of the bundle being used, e.g. the result of
+        ``to_bundle_ingest_dirname(bundle_timestamp)``.
+    max_size_bytes : int, optional
+        Maximum number of bytes to keep on disk. If not provided, entries are
+        never evicted.
+
+    Attributes
+    ----------
+    hits : int
+        Number of terms read from the cache.
+    misses : int
+        Number of terms requested from the cache but not found.
+
+    Notes
+    -----
+    Only :class:`~zipline.pipeline.ComputableTerm` results stored as plain
+    numeric or boolean arrays are cached. Terms producing
+    :class:`~zipline.lib.labelarray.LabelArray` results are always recomputed.
+
+    A term's identity includes the bytecode of its ``compute`` method, so
+    editing a CustomFactor's ``compute`` invalidates its entries. Changes to
+    functions called from ``compute`` are not detected.
+
+    See Also
+    --------
+    :class:`zipline.pipeline.engine.SimplePipelineEngine`
+    """
+    def __init__(self, path, data_version, max_size_bytes=None):
+        self.path = path
+        self.data_version = data_version
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+
+        ensure_directory(path)
+
+    def key(self, term, domain, dates, assets):
+        """Compute the cache key for a term.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.Term
+            The term being computed.
+        domain : zipline.pipeline.domain.Domain
+            The domain of execution.
+        dates : pd.DatetimeIndex
+            Row labels of the term's result.
+        assets : pd.Int64Index
+            Column labels of the term's result.
+
+        Returns
+        -------
+        key : str or None
+            Hex digest identifying the result, or None if ``term`` can't be
+            cached.
+        """
+        if not isinstance(term, ComputableTerm):
+            return None
+
+        h = sha1()
+        for part in (
+            self.data_version,
+            term_fingerprint(term),
+            _domain_fingerprint(domain),
+        ):
+            h.update(part.encode('utf-8'))
+        h.update(np.asarray(dates.asi8, dtype='int64').tobytes())
+        h.update(np.asarray(assets, dtype='int64').tobytes())
+        return h.hexdigest()
+
+    def _keypath(self, key):
+        return os.path.join(self.path, key + '.npy')
+
+    def get(self, term, domain, dates, assets):
+        """Read a cached result for ``term``.
+
+        Returns
+        -------
+        result : np.ndarray or None
+            The cached result, or None if there is no entry for ``term``.
+        """
+        key = self.key(term, domain, dates, assets)
+        if key is None:
+            return None
+
+        path = self._keypath(key)
+        try:
+            result = np.load(path)
+        except IOError as e:
+            if e.errno != errno.ENOENT:
+                raise
+            self.misses += 1
+            return None
+
+        # Mark the entry as recently used.
+        try:
+            os.utime(path, None)
+        except OSError:
+            # The entry may have been evicted by another process.
+            pass
+
+        self.hits += 1
+        return result
+
+    def set(self, term, domain, dates, assets, result):
+        """Write ``result`` as the cached value for ``term``.
+
+        Results that can't be cached are silently ignored.
+        """
+        if isinstance(result, LabelArray) or result.dtype == object:
+            return
+
+        key = self.key(term, domain, dates, assets)
+        if key is None:
+            return
+
+        path = self._keypath(key)
+        tmp_path = '%s.%s.tmp' % (path, uuid4().hex)
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.asarray(result))
+        # Atomically publish the entry so that concurrent readers never see
+        # partially-written files.
+        os.rename(tmp_path, path)
+
+        if self.max_size_bytes is not None:
+            self.evict(self.max_size_bytes)
+
+    def entries(self):
+        """Get the entries in the cache.
+
+        Returns
+        -------
+        entries : list[(str, int, float)]
+            Tuples of (path, size in bytes, last used time), ordered from
+            least to most recently used.
+        """
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith('.npy'):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda entry: entry[2])
+        return entries
+
+    @property
+    def size_bytes(self):
+        """Total size of the entries in the cache.
+        """
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, max_size_bytes):
+        """Remove least recently used entries until the cache is no larger
+        than ``max_size_bytes``.
+
+        Returns
+        -------
+        evicted : int
+            Number of entries removed.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= max_size_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+            total -= size
+            evicted += 1
+        return evicted
+
+    def clear(self):
+        """Remove all entries from the cache.
+        """
+        self.evict(0)
+
+    def populate_initial_workspace(self,
+                                   initial_workspace,
+                                   root_mask_term,
+                                   execution_plan,
+                                   dates,
+                                   assets):
+        """Pre-seed ``initial_workspace`` with cached results.
+
+        This has the same signature as
+        :func:`zipline.pipeline.engine.default_populate_initial_workspace`.
+        Starting from the outputs of ``execution_plan``, each term with a
+        cached result is added to the workspace. The dependencies of a term
+        that was found in the cache are not read.
+
+        Returns
+        -------
+        populated_initial_workspace : dict[term, array-like]
+            A copy of ``initial_workspace`` with cached terms added.
+        """
+        workspace = initial_workspace.copy()
+        domain = execution_plan.domain
+        extra_rows = execution_plan.extra_rows
+        root_extra_rows = extra_rows[root_mask_term]
+        graph = execution_plan.graph
+
+        seen = set()
+        stack = list(execution_plan.outputs.values())
+        while stack:
+            term = stack.pop()
+            if term in seen or term in workspace:
+                continue
+            seen.add(term)
+
+            term_dates = dates[root_extra_rows - extra_rows[term]:]
+            cached = self.get(term, domain, term_dates, assets)
+            if cached is not None:
+                workspace[term] = cached
+                continue
+
+            stack.extend(dep for dep, _ in graph.in_edges([term]))
+
+        return workspace
+
+
+def term_fingerprint(term):
+    """Compute a string that uniquely identifies ``term`` across processes.
+
+    Parameters
+    ----------
+    term : zipline.pipeline.Term
+        The term to fingerprint.
+
+    Returns
+    -------
+    fingerprint : str
+        Hex digest of the term's structural identity.
+    """
+    return _fingerprint(term, {})
+
+
+def _fingerprint(ob, memo):
+    key = id(ob)
+    try:
+        return memo[key][1]
+    except KeyError:
+        pass
+
+    if isinstance(ob, Term):
+        out = sha1(
+            _fingerprint(ob._identity, memo).encode('utf-8'),
+        ).hexdigest()
+    elif isinstance(ob, Domain):
+        out = _domain_fingerprint(ob)
+    elif isinstance(ob, type):
+        out = _type_fingerprint(ob)
+    elif isinstance(ob, np.dtype):
+        out = 'dtype(%s)' % ob.str
+    elif isinstance(ob, (tuple, list)):
+        out = '(%s)' % ','.join(_fingerprint(v, memo) for v in ob)
+    elif isinstance(ob, frozenset):
+        out = '{%s}' % ','.join(sorted(_fingerprint(v, memo) for v in ob))
+    elif isinstance(ob, dict):
+        out = '{%s}' % ','.join(sorted(
+            '%s:%s' % (_fingerprint(k, memo), _fingerprint(v, memo))
+            for k, v in iteritems(ob)
+        ))
+    else:
+        out = repr(ob)
+
+    # Keep a reference to ``ob`` so that its id isn't reused while ``memo`` is
+    # alive.
+    memo[key] = (ob, out)
+    return out
+
+
+def _type_fingerprint(cls):
+    name = '%s.%s' % (
+        cls.__module__,
+        getattr(cls, '__qualname__', cls.__name__),
+    )
+    compute = getattr(cls, 'compute', None)
+    if PY2:
+        compute = getattr(compute, '__func__', compute)
+    code = getattr(compute, '__code__', None)
+    if code is None:
+        return name
+    return '%s[%s]' % (
+        name,
+        sha1(code.co_code + repr(code.co_names).encode('utf-8')).hexdigest(),
+    )
+
+
+def _domain_fingerprint(domain):
+    if domain is GENERIC:
+        return 'GENERIC'
+    sessions = domain.all_sessions()
+    return '%s(%s, %s)' % (
+        type(domain).__name__,
+        domain.country_code,
+        sha1(np.asarray(sessions.asi8, dtype='int64').tobytes()).hexdigest(),
+    )
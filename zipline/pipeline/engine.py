@@ -49,21 +49,33 @@ implements the following algorithm for executing pipelines:
       significantly reduces the maximum amount of memory that we
       consume during execution
 
-   This logic lives in SimplePipelineEngine.compute_chunk.
+   This logic lives in SimplePipelineEngine.compute_chunk. If the engine
+   was constructed with a ``term_pool``, terms are instead dispatched to
+   the pool as soon as all of their inputs are available, so independent
+   branches of the graph are computed concurrently.
 
 7. Extract the pipeline's outputs from the workspace and convert them
    into "narrow" format, with output labels dictated by the Pipeline's
    screen. This logic lives in SimplePipelineEngine._to_narrow.
 """
 from abc import ABCMeta, abstractmethod
+from collections import deque
 from functools import partial
+import sys
 
-from six import iteritems, with_metaclass, viewkeys
-from numpy import array, arange
+from six import iteritems, reraise, with_metaclass, viewkeys
+from six.moves.queue import Queue
+from numpy import arange, array, empty, flatnonzero
 from pandas import DataFrame, MultiIndex
 from toolz import groupby
 
-from zipline.lib.adjusted_array import ensure_adjusted_array, ensure_ndarray
+from zipline.lib.adjusted_array import (
+    AdjustedArray,
+    ensure_adjusted_array,
+    ensure_ndarray,
+    is_categorical,
+)
+from zipline.lib.adjustment import ArrayAdjustment
 from zipline.errors import NoFurtherDataError
 from zipline.utils.input_validation import expect_types
 from zipline.utils.numpy_utils import (
@@ -75,8 +87,9 @@ from zipline.utils.pandas_utils import explode
 from zipline.utils.string_formatting import bulleted_list
 
 from .domain import Domain, GENERIC
-from .graph import maybe_specialize
+from .graph import maybe_specialize, SCREEN_NAME
 from .hooks import DelegatingHooks
+from .pipeline import Pipeline
 from .term import AssetExists, InputDates, LoadableTerm
 
 from zipline.utils.date_utils import compute_date_range_chunks
@@ -164,6 +177,40 @@ class PipelineEngine(with_metaclass(ABCMeta)):
         """
         raise NotImplementedError("run_chunked_pipeline")
 
+    def run_pipelines(self, pipelines, start_date, end_date, hooks=None):
+        """
+        Compute values for each of ``pipelines`` from ``start_date`` to
+        ``end_date``.
+
+        The default implementation runs each pipeline independently. Engines
+        that can share work between pipelines should override this method.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> zipline.pipeline.Pipeline]
+            Map from name to pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+        hooks : list[implements(PipelineHooks)], optional
+            Hooks for instrumenting Pipeline execution.
+
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            Map from name to the frame that ``run_pipeline`` would have
+            produced for the pipeline with that name.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
+        """
+        return {
+            name: self.run_pipeline(pipeline, start_date, end_date, hooks)
+            for name, pipeline in iteritems(pipelines)
+        }
+
 
 class NoEngineRegistered(Exception):
     """
@@ -247,6 +294,26 @@ class SimplePipelineEngine(PipelineEngine):
     default_hooks : list, optional
         List of hooks that should be used to instrument all pipelines executed
         by this engine.
+    term_pool : Pool, optional
+        Pool to use to compute independent terms concurrently within each
+        chunk. This object must support ``apply_async``, and is normally a
+        :class:`multiprocessing.pool.ThreadPool`: most numpy kernels release
+        the GIL, so wide pipelines can compute many terms at once. Terms are
+        dispatched as soon as all of their dependencies are available. If not
+        provided, terms are computed serially in execution order.
+    term_cache : zipline.pipeline.cache.DiskTermCache, optional
+        Persistent cache of computed terms. Cached terms are added to the
+        initial workspace after ``populate_initial_workspace`` runs, and newly
+        computed terms are written back to the cache.
+    sparse_mask_threshold : float, optional
+        If provided, windowed terms constructed with an explicit ``mask`` are
+        computed only on the assets that pass the mask on at least one date,
+        as long as the fraction of such assets is at most
+        ``sparse_mask_threshold``. Results for the remaining assets are
+        filled with the term's ``missing_value``, which is what they would
+        have been anyway. This makes expensive terms like
+        ``RollingLinearRegressionOfReturns(..., mask=universe)`` cheaper by
+        roughly the selectivity of ``universe``. Must be in (0, 1].
 
     See Also
     --------
@@ -258,6 +325,9 @@ class SimplePipelineEngine(PipelineEngine):
         '_root_mask_term',
         '_root_mask_dates_term',
         '_populate_initial_workspace',
+        '_term_pool',
+        '_term_cache',
+        '_sparse_mask_threshold',
     )
 
     @expect_types(
@@ -269,7 +339,10 @@ class SimplePipelineEngine(PipelineEngine):
                  asset_finder,
                  default_domain=GENERIC,
                  populate_initial_workspace=None,
-                 default_hooks=None):
+                 default_hooks=None,
+                 term_pool=None,
+                 term_cache=None,
+                 sparse_mask_threshold=None):
 
         self._get_loader = get_loader
         self._finder = asset_finder
@@ -287,12 +360,27 @@ class SimplePipelineEngine(PipelineEngine):
         else:
             self._default_hooks = list(default_hooks)
 
+        self._term_pool = term_pool
+        self._term_cache = term_cache
+
+        if sparse_mask_threshold is not None and \
+                not 0 < sparse_mask_threshold <= 1:
+            raise ValueError(
+                'sparse_mask_threshold must be in (0, 1], got %r' % (
+                    sparse_mask_threshold,
+                )
+            )
+        self._sparse_mask_threshold = sparse_mask_threshold
+
     def run_chunked_pipeline(self,
                              pipeline,
                              start_date,
                              end_date,
                              chunksize,
-                             hooks=None):
+                             hooks=None,
+                             pool=None,
+                             max_chunks_in_flight=None,
+                             max_memory_bytes=None):
         """
         Compute values for ``pipeline`` from ``start_date`` to ``end_date``, in
         date chunks of size ``chunksize``.
@@ -312,6 +400,24 @@ class SimplePipelineEngine(PipelineEngine):
             The number of days to execute at a time.
         hooks : list[implements(PipelineHooks)], optional
             Hooks for instrumenting Pipeline execution.
+        pool : Pool, optional
+            Pool to use to compute chunks concurrently. This object must
+            support ``apply_async``, e.g. a
+            :class:`multiprocessing.pool.ThreadPool` or a
+            :class:`multiprocessing.Pool`. If not provided, chunks are
+            computed sequentially in the calling thread.
+        max_chunks_in_flight : int, optional
+            The maximum number of chunks that may be submitted to ``pool``
+            before the earliest outstanding chunk is collected. This bounds
+            the number of chunk workspaces held in memory at once. Defaults
+            to no limit. Ignored if ``pool`` is not provided.
+        max_memory_bytes : int, optional
+            Memory budget for computing chunks. If provided, the number of
+            days per chunk is the largest value no greater than ``chunksize``
+            whose estimated workspace size fits in the budget. ``chunksize``
+            may be None in this case to only bound chunks by memory. When
+            running chunks in a ``pool``, the budget is split evenly between
+            ``max_chunks_in_flight`` chunks, which must be provided.
 
         Returns
         -------
@@ -327,11 +433,39 @@ class SimplePipelineEngine(PipelineEngine):
             A screen of ``None`` indicates that a row should be returned for
             each asset that existed each day.
 
+        Notes
+        -----
+        When ``pool`` is provided, hooks are entered by the workers computing
+        each chunk, so per-chunk callbacks may arrive concurrently and out of
+        date order. Loaders used by this engine must be safe to call from
+        multiple threads when using a thread pool. When using a process pool,
+        this engine, ``pipeline`` and ``hooks`` must be picklable, and any
+        state accumulated by hooks in worker processes is not sent back to
+        the caller.
+
         See Also
         --------
         :meth:`zipline.pipeline.engine.PipelineEngine.run_pipeline`
         """
         domain = self.resolve_domain(pipeline)
+        if max_memory_bytes is not None:
+            if pool is not None:
+                if max_chunks_in_flight is None:
+                    raise ValueError(
+                        "max_chunks_in_flight must be provided when using "
+                        "max_memory_bytes with a pool."
+                    )
+                max_memory_bytes //= max_chunks_in_flight
+
+            chunksize = self._chunksize_for_memory_budget(
+                pipeline,
+                domain,
+                start_date,
+                end_date,
+                chunksize,
+                max_memory_bytes,
+            )
+
         ranges = compute_date_range_chunks(
             domain.all_sessions(),
             start_date,
@@ -342,7 +476,15 @@ class SimplePipelineEngine(PipelineEngine):
 
         run_pipeline = partial(self._run_pipeline_impl, pipeline, hooks=hooks)
         with hooks.running_pipeline(pipeline, start_date, end_date):
-            chunks = [run_pipeline(s, e) for s, e in ranges]
+            if pool is None:
+                chunks = [run_pipeline(s, e) for s, e in ranges]
+            else:
+                chunks = _run_chunks_in_pool(
+                    pool,
+                    run_pipeline,
+                    ranges,
+                    max_chunks_in_flight,
+                )
 
         if len(chunks) == 1:
             # OPTIMIZATION: Don't make an extra copy in `categorical_df_concat`
@@ -354,6 +496,72 @@ class SimplePipelineEngine(PipelineEngine):
         nonempty_chunks = [c for c in chunks if len(c)]
         return categorical_df_concat(nonempty_chunks, inplace=True)
 
+    def _chunksize_for_memory_budget(self,
+                                     pipeline,
+                                     domain,
+                                     start_date,
+                                     end_date,
+                                     max_chunksize,
+                                     max_memory_bytes):
+        """
+        Compute the largest number of days per chunk whose estimated
+        footprint fits in ``max_memory_bytes``.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to be run.
+        domain : zipline.pipeline.domain.Domain
+            The domain on which the pipeline will be run.
+        start_date : pd.Timestamp
+            The start date of the pipeline run.
+        end_date : pd.Timestamp
+            The end date of the pipeline run.
+        max_chunksize : int or None
+            Upper bound on the chunk size. None means no bound.
+        max_memory_bytes : int
+            Memory budget for a single chunk.
+
+        Returns
+        -------
+        chunksize : int
+            The number of days to execute at a time.
+        """
+        plan = pipeline.to_execution_plan(
+            domain, self._root_mask_term, start_date, end_date,
+        )
+        # The root mask only includes assets that were alive during the run,
+        # so the number of assets in the domain is an upper bound.
+        num_assets = len(
+            self._finder.equities_sids_for_country_code(domain.country_code)
+        )
+
+        sessions = domain.all_sessions()
+        start_idx, end_idx = sessions.slice_locs(start_date, end_date)
+        num_days = end_idx - start_idx
+        if max_chunksize is not None:
+            num_days = min(num_days, max_chunksize)
+
+        if plan.estimate_nbytes(1, num_assets) > max_memory_bytes:
+            raise ValueError(
+                "Estimated memory for a single day of pipeline results "
+                "({} bytes for {} assets) exceeds max_memory_bytes={}.".format(
+                    plan.estimate_nbytes(1, num_assets),
+                    num_assets,
+                    max_memory_bytes,
+                )
+            )
+
+        # Binary search for the largest chunk that fits in the budget.
+        low, high = 1, num_days
+        while low < high:
+            mid = (low + high + 1) // 2
+            if plan.estimate_nbytes(mid, num_assets) <= max_memory_bytes:
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
     def run_pipeline(self, pipeline, start_date, end_date, hooks=None):
         """
         Compute values for ``pipeline`` from ``start_date`` to ``end_date``.
@@ -392,6 +600,104 @@ class SimplePipelineEngine(PipelineEngine):
                 hooks,
             )
 
+    def run_pipelines(self, pipelines, start_date, end_date, hooks=None):
+        """
+        Compute values for each of ``pipelines`` from ``start_date`` to
+        ``end_date``.
+
+        The terms of all the pipelines are compiled into a single execution
+        plan, so any term used by more than one pipeline (for example,
+        ``EquityPricing.close``, or a shared universe filter) is loaded or
+        computed only once. The outputs are then split back out per pipeline.
+
+        Parameters
+        ----------
+        pipelines : dict[str -> zipline.pipeline.Pipeline]
+            Map from name to pipeline to run. All pipelines must resolve to
+            the same domain.
+        start_date : pd.Timestamp
+            Start date of the computed matrices.
+        end_date : pd.Timestamp
+            End date of the computed matrices.
+        hooks : list[implements(PipelineHooks)], optional
+            Hooks for instrumenting Pipeline execution.
+
+        Returns
+        -------
+        results : dict[str -> pd.DataFrame]
+            Map from name to the frame that ``run_pipeline`` would have
+            produced for the pipeline with that name.
+
+        Raises
+        ------
+        ValueError
+            If the pipelines resolve to different domains.
+        """
+        if end_date < start_date:
+            raise ValueError(
+                "start_date must be before or equal to end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+        if not pipelines:
+            return {}
+
+        domains = {
+            name: self.resolve_domain(pipeline)
+            for name, pipeline in iteritems(pipelines)
+        }
+        if len(set(domains.values())) > 1:
+            raise ValueError(
+                "Can't run pipelines with different domains together.\n"
+                "Resolved domains were:\n{}".format(
+                    bulleted_list(
+                        '{!r}: {}'.format(name, domain)
+                        for name, domain in sorted(iteritems(domains))
+                    )
+                )
+            )
+        domain = next(iter(domains.values()))
+
+        # Give every output of every pipeline, including its screen, a unique
+        # name in a single combined pipeline. Terms are memoized, so anything
+        # shared between pipelines becomes a single node of the combined
+        # graph. The combined pipeline has no screen of its own, so its screen
+        # output is the default screen used by pipelines without one.
+        combined_names = {}
+        combined_columns = {}
+        for i, (name, pipeline) in enumerate(iteritems(pipelines)):
+            combined_names[name] = names = {SCREEN_NAME: SCREEN_NAME}
+            outputs = pipeline.columns.copy()
+            if pipeline.screen is not None:
+                outputs[SCREEN_NAME] = pipeline.screen
+            for column, term in iteritems(outputs):
+                combined_name = '{}_{}'.format(i, column)
+                names[column] = combined_name
+                combined_columns[combined_name] = term
+
+        combined = Pipeline(columns=combined_columns, domain=domain)
+
+        hooks = self._resolve_hooks(hooks)
+        with hooks.running_pipeline(combined, start_date, end_date):
+            plan = combined.to_execution_plan(
+                domain, self._root_mask_term, start_date, end_date,
+            )
+            results, dates, sids = self._compute_plan(
+                plan, domain, start_date, end_date, hooks,
+            )
+
+        out = {}
+        for name, pipeline in iteritems(pipelines):
+            names = combined_names[name]
+            screen = results[names.pop(SCREEN_NAME)]
+            out[name] = self._to_narrow(
+                pipeline.columns,
+                {column: results[names[column]] for column in names},
+                screen,
+                dates,
+                sids,
+            )
+        return out
+
     def _run_pipeline_impl(self, pipeline, start_date, end_date, hooks):
         """Shared core for ``run_pipeline`` and ``run_chunked_pipeline``.
         """
@@ -408,6 +714,32 @@ class SimplePipelineEngine(PipelineEngine):
         plan = pipeline.to_execution_plan(
             domain, self._root_mask_term, start_date, end_date,
         )
+        results, dates, sids = self._compute_plan(
+            plan, domain, start_date, end_date, hooks,
+        )
+
+        return self._to_narrow(
+            plan.outputs,
+            results,
+            results.pop(plan.screen_name),
+            dates,
+            sids,
+        )
+
+    def _compute_plan(self, plan, domain, start_date, end_date, hooks):
+        """
+        Compute the outputs of ``plan`` from ``start_date`` to ``end_date``.
+
+        Returns
+        -------
+        results : dict[str -> ndarray[ndim=2]]
+            Dict mapping the names of ``plan.outputs`` to their computed
+            values, with extra rows already removed.
+        dates : pd.DatetimeIndex
+            Row labels for the arrays in ``results``.
+        sids : pd.Int64Index
+            Column labels for the arrays in ``results``.
+        """
         extra_rows = plan.extra_rows[self._root_mask_term]
         root_mask = self._compute_root_mask(
             domain, start_date, end_date, extra_rows,
@@ -424,6 +756,14 @@ class SimplePipelineEngine(PipelineEngine):
             dates,
             sids,
         )
+        if self._term_cache is not None:
+            workspace = self._term_cache.populate_initial_workspace(
+                workspace,
+                self._root_mask_term,
+                plan,
+                dates,
+                sids,
+            )
 
         refcounts = plan.initial_refcounts(workspace)
         execution_order = plan.execution_order(workspace, refcounts)
@@ -442,13 +782,7 @@ class SimplePipelineEngine(PipelineEngine):
                 hooks=hooks,
             )
 
-        return self._to_narrow(
-            plan.outputs,
-            results,
-            results.pop(plan.screen_name),
-            dates[extra_rows:],
-            sids,
-        )
+        return results, dates[extra_rows:], sids
 
     def _compute_root_mask(self, domain, start_date, end_date, extra_rows):
         """
@@ -536,13 +870,21 @@ class SimplePipelineEngine(PipelineEngine):
         return ret
 
     @staticmethod
-    def _inputs_for_term(term, workspace, graph, domain, refcounts):
+    def _inputs_for_term(term,
+                         workspace,
+                         graph,
+                         domain,
+                         refcounts,
+                         columns=None):
         """
         Compute inputs for the given term.
 
         This is mostly complicated by the fact that for each input we store as
         many rows as will be necessary to serve **any** computation requiring
         that input.
+
+        If ``columns`` is provided, two-dimensional inputs are restricted to
+        those asset columns.
         """
         offsets = graph.offset
         out = []
@@ -559,16 +901,21 @@ class SimplePipelineEngine(PipelineEngine):
                 adjusted_array = ensure_adjusted_array(
                     workspace[input_], input_.missing_value,
                 )
+                # If the refcount for the input is > 1, we will need to
+                # traverse this array again so we must copy. If the refcount
+                # for the input == 0, this is the last traversal that will
+                # happen so we can invalidate the AdjustedArray and mutate the
+                # data in place.
+                copy = refcounts[input_] > 1
+                if columns is not None and input_.ndim == 2:
+                    # take_columns already made a copy.
+                    adjusted_array = adjusted_array.take_columns(columns)
+                    copy = False
                 out.append(
                     adjusted_array.traverse(
                         window_length=term.window_length,
                         offset=offsets[term, input_],
-                        # If the refcount for the input is > 1, we will need
-                        # to traverse this array again so we must copy.
-                        # If the refcount for the input == 0, this is the last
-                        # traversal that will happen so we can invalidate
-                        # the AdjustedArray and mutate the data in place.
-                        copy=refcounts[input_] > 1,
+                        copy=copy,
                     )
                 )
         else:
@@ -581,6 +928,8 @@ class SimplePipelineEngine(PipelineEngine):
                 # offset is zero.
                 if offset:
                     input_data = input_data[offset:]
+                if columns is not None and input_.ndim == 2:
+                    input_data = input_data[:, columns]
                 out.append(input_data)
         return out
 
@@ -631,7 +980,6 @@ class SimplePipelineEngine(PipelineEngine):
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = workspace.copy()
-        domain = graph.domain
 
         # Many loaders can fetch data more efficiently if we ask them to
         # retrieve all their inputs at once. For example, a loader backed by a
@@ -663,6 +1011,62 @@ class SimplePipelineEngine(PipelineEngine):
             (t for t in execution_order if t in will_be_loaded),
         )
 
+        if self._term_pool is None:
+            self._compute_terms_serially(
+                graph,
+                dates,
+                sids,
+                workspace,
+                refcounts,
+                execution_order,
+                hooks,
+                loader_groups,
+                loader_group_key,
+            )
+        else:
+            self._compute_terms_in_pool(
+                self._term_pool,
+                graph,
+                dates,
+                sids,
+                workspace,
+                refcounts,
+                execution_order,
+                hooks,
+                loader_groups,
+                loader_group_key,
+            )
+
+        # At this point, all the output terms are in the workspace.
+        out = {}
+        graph_extra_rows = graph.extra_rows
+        for name, term in iteritems(graph.outputs):
+            # Truncate off extra rows from outputs.
+            out[name] = workspace[term][graph_extra_rows[term]:]
+        return out
+
+    def _compute_terms_serially(self,
+                                graph,
+                                dates,
+                                sids,
+                                workspace,
+                                refcounts,
+                                execution_order,
+                                hooks,
+                                loader_groups,
+                                loader_group_key):
+        """
+        Compute the terms in ``execution_order`` one at a time, storing the
+        results in ``workspace``.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.engine.SimplePipelineEngine.compute_chunk`
+        """
+        get_loader = self._get_loader
+        term_cache = self._term_cache
+        domain = graph.domain
+
         for term in execution_order:
             # `term` may have been supplied in `initial_workspace`, or we may
             # have loaded `term` as part of a batch with another term coming
@@ -701,37 +1105,262 @@ class SimplePipelineEngine(PipelineEngine):
                     )
                 )
                 workspace.update(loaded)
+                hooks.on_terms_stored(to_load, workspace)
             else:
+                columns = self._columns_to_compute(
+                    term, workspace, domain, mask,
+                )
                 with hooks.computing_term(term):
-                    workspace[term] = term._compute(
+                    workspace[term] = _compute_on_columns(
+                        term,
                         self._inputs_for_term(
                             term,
                             workspace,
                             graph,
                             domain,
                             refcounts,
+                            columns,
                         ),
                         mask_dates,
                         sids,
                         mask,
+                        columns,
                     )
                 if term.ndim == 2:
                     assert workspace[term].shape == mask.shape
                 else:
                     assert workspace[term].shape == (mask.shape[0], 1)
+                hooks.on_terms_stored([term], workspace)
+
+                if term_cache is not None:
+                    term_cache.set(
+                        term, domain, mask_dates, sids, workspace[term],
+                    )
 
                 # Decref dependencies of ``term``, and clear any terms
                 # whose refcounts hit 0.
                 for garbage in graph.decref_dependencies(term, refcounts):
                     del workspace[garbage]
 
-        # At this point, all the output terms are in the workspace.
-        out = {}
-        graph_extra_rows = graph.extra_rows
-        for name, term in iteritems(graph.outputs):
-            # Truncate off extra rows from outputs.
-            out[name] = workspace[term][graph_extra_rows[term]:]
-        return out
+    def _compute_terms_in_pool(self,
+                               pool,
+                               graph,
+                               dates,
+                               sids,
+                               workspace,
+                               refcounts,
+                               execution_order,
+                               hooks,
+                               loader_groups,
+                               loader_group_key):
+        """
+        Compute the terms in ``execution_order`` by dispatching each term to
+        ``pool`` as soon as all of its dependencies are in ``workspace``.
+
+        ``workspace`` and ``refcounts`` are only read and written from the
+        calling thread: inputs are prepared here before a term is dispatched,
+        and results are stored and dependencies decref'ed here after a term
+        finishes. Workers only run loaders and ``term._compute``.
+
+        See Also
+        --------
+        :meth:`zipline.pipeline.engine.SimplePipelineEngine.compute_chunk`
+        """
+        get_loader = self._get_loader
+        term_cache = self._term_cache
+        domain = graph.domain
+
+        # Each task is a tuple of terms that are produced together. Loadable
+        # terms in the same loader group are loaded in a single task.
+        task_for_term = {}
+        tasks = []
+        for term in execution_order:
+            if term in workspace or term in task_for_term:
+                continue
+
+            if isinstance(term, LoadableTerm):
+                task = tuple(sorted(
+                    loader_groups[loader_group_key(term)],
+                    key=lambda t: t.dataset,
+                ))
+            else:
+                task = (term,)
+
+            for t in task:
+                task_for_term[t] = task
+            tasks.append(task)
+
+        # Map from task -> set of tasks it's still waiting on, and from task
+        # -> tasks waiting on it.
+        waiting_on = {}
+        dependents = {task: [] for task in tasks}
+        for task in tasks:
+            waiting_on[task] = deps = {
+                task_for_term[dep]
+                for term in task
+                for dep, _ in graph.graph.in_edges([term])
+                if dep not in workspace
+            }
+            deps.discard(task)
+            for dep in deps:
+                dependents[dep].append(task)
+
+        done = Queue()
+        mask_shapes_and_dates = {}
+
+        def run_task(task, f, args):
+            try:
+                done.put((task, True, f(*args)))
+            except Exception:
+                done.put((task, False, sys.exc_info()))
+
+        def load_terms(loader, to_load, mask_dates, mask):
+            with hooks.loading_terms(to_load):
+                return loader.load_adjusted_array(
+                    domain, to_load, mask_dates, sids, mask,
+                )
+
+        def compute_term(term, inputs, mask_dates, mask, columns):
+            with hooks.computing_term(term):
+                return {
+                    term: _compute_on_columns(
+                        term, inputs, mask_dates, sids, mask, columns,
+                    ),
+                }
+
+        def dispatch(task):
+            term = task[0]
+            mask, mask_dates = graph.mask_and_dates_for_term(
+                term,
+                self._root_mask_term,
+                workspace,
+                dates,
+            )
+            if isinstance(term, LoadableTerm):
+                loader = get_loader(term)
+                self._ensure_can_load(loader, task)
+                f, args = load_terms, (loader, task, mask_dates, mask)
+            else:
+                columns = self._columns_to_compute(
+                    term, workspace, domain, mask,
+                )
+                inputs = self._inputs_for_term(
+                    term,
+                    workspace,
+                    graph,
+                    domain,
+                    refcounts,
+                    columns,
+                )
+                mask_shapes_and_dates[task] = mask.shape, mask_dates
+                f, args = compute_term, (
+                    term, inputs, mask_dates, mask, columns,
+                )
+            pool.apply_async(run_task, (task, f, args))
+
+        outstanding = 0
+        for task in tasks:
+            if not waiting_on[task]:
+                dispatch(task)
+                outstanding += 1
+
+        error = None
+        while outstanding:
+            task, successful, value = done.get()
+            outstanding -= 1
+
+            if not successful:
+                # Let the tasks that are already running finish before
+                # re-raising, but don't start any new ones.
+                if error is None:
+                    error = value
+                continue
+            if error is not None:
+                continue
+
+            if isinstance(task[0], LoadableTerm):
+                assert set(value) == set(task), (
+                    'loader did not return an AdjustedArray for each column\n'
+                    'expected: %r\n'
+                    'got:      %r' % (
+                        sorted(task, key=repr),
+                        sorted(value, key=repr),
+                    )
+                )
+                workspace.update(value)
+                hooks.on_terms_stored(list(task), workspace)
+            else:
+                term, = task
+                workspace[term] = value[term]
+                mask_shape, mask_dates = mask_shapes_and_dates.pop(task)
+                if term.ndim == 2:
+                    assert workspace[term].shape == mask_shape
+                else:
+                    assert workspace[term].shape == (mask_shape[0], 1)
+                hooks.on_terms_stored([term], workspace)
+
+                if term_cache is not None:
+                    term_cache.set(
+                        term, domain, mask_dates, sids, workspace[term],
+                    )
+
+                # Decref dependencies of ``term``, and clear any terms
+                # whose refcounts hit 0.
+                for garbage in graph.decref_dependencies(term, refcounts):
+                    del workspace[garbage]
+
+            for dependent in dependents[task]:
+                deps = waiting_on[dependent]
+                deps.discard(task)
+                if not deps:
+                    dispatch(dependent)
+                    outstanding += 1
+
+        if error is not None:
+            reraise(*error)
+
+    def _columns_to_compute(self, term, workspace, domain, mask):
+        """
+        Choose the asset columns on which to compute ``term``.
+
+        Returns
+        -------
+        columns : np.ndarray[int64] or None
+            Indices of the columns of ``mask`` to compute, or None if ``term``
+            should be computed on all columns.
+        """
+        threshold = self._sparse_mask_threshold
+        if (threshold is None or
+                not term.windowed or
+                term.ndim != 2 or
+                term.mask is self._root_mask_term or
+                is_categorical(term.dtype)):
+            return None
+
+        columns = flatnonzero(mask.any(axis=0))
+        if len(columns) > threshold * mask.shape[1]:
+            return None
+        if len(columns) == 1:
+            # CustomTermMixin doesn't mask single-column inputs, so a
+            # one-column subset wouldn't be masked on dates where the asset
+            # fails ``mask``.
+            return None
+
+        for input_ in term.inputs:
+            if input_.ndim != 2:
+                continue
+            if is_categorical(input_.dtype):
+                return None
+            data = workspace[maybe_specialize(input_, domain)]
+            if isinstance(data, AdjustedArray) and any(
+                isinstance(adjustment, ArrayAdjustment)
+                for row_adjustments in data.adjustments.values()
+                for adjustment in row_adjustments
+            ):
+                # AdjustedArray.take_columns doesn't support these.
+                return None
+
+        return columns
 
     def _to_narrow(self, terms, data, mask, dates, assets):
         """
@@ -910,6 +1539,76 @@ class SimplePipelineEngine(PipelineEngine):
                 )
 
 
+def _run_chunks_in_pool(pool, run_pipeline, ranges, max_chunks_in_flight):
+    """
+    Run ``run_pipeline`` on each (start, end) pair in ``ranges`` using
+    ``pool``.
+
+    Parameters
+    ----------
+    pool : Pool
+        Pool supporting ``apply_async``.
+    run_pipeline : callable[(pd.Timestamp, pd.Timestamp) -> pd.DataFrame]
+        Function computing the results for a single chunk.
+    ranges : iterable[(pd.Timestamp, pd.Timestamp)]
+        Start and end dates of the chunks to compute, in date order.
+    max_chunks_in_flight : int or None
+        Maximum number of outstanding chunks. ``None`` means no limit.
+
+    Returns
+    -------
+    chunks : list[pd.DataFrame]
+        The results for each chunk, in the same order as ``ranges``.
+    """
+    if max_chunks_in_flight is not None and max_chunks_in_flight < 1:
+        raise ValueError(
+            "max_chunks_in_flight must be at least 1, got %d" % (
+                max_chunks_in_flight,
+            )
+        )
+
+    chunks = []
+    in_flight = deque()
+    for start, end in ranges:
+        if (max_chunks_in_flight is not None and
+                len(in_flight) >= max_chunks_in_flight):
+            # Collect the earliest chunk before submitting another one. This
+            # keeps results in date order and caps the number of chunk
+            # workspaces alive at once.
+            chunks.append(in_flight.popleft().get())
+        in_flight.append(pool.apply_async(run_pipeline, (start, end)))
+
+    while in_flight:
+        chunks.append(in_flight.popleft().get())
+
+    return chunks
+
+
+def _compute_on_columns(term, inputs, dates, assets, mask, columns):
+    """
+    Compute ``term``, optionally restricted to a subset of asset columns.
+
+    If ``columns`` is None, this is just ``term._compute``. Otherwise,
+    ``inputs`` must already be restricted to ``columns``, and the result is
+    scattered back into an array of the full width of ``mask``, with
+    ``term.missing_value`` in the columns that weren't computed.
+    """
+    if columns is None:
+        return term._compute(inputs, dates, assets, mask)
+
+    result = term._compute(inputs, dates, assets[columns], mask[:, columns])
+
+    out = empty(mask.shape, dtype=result.dtype)
+    if result.dtype.names is None:
+        out[:] = term.missing_value
+    else:
+        # Multiple-output CustomFactors produce recarrays.
+        for name in result.dtype.names:
+            out[name] = term.missing_value
+    out[:, columns] = result
+    return out.view(type(result))
+
+
 def _pipeline_output_index(dates, assets, mask):
     """
     Create a MultiIndex for a pipeline output.
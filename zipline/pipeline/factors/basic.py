@@ -5,15 +5,20 @@ from numpy import (
     arange,
     average,
     copyto,
+    errstate,
     exp,
     fmax,
     full,
+    isinf,
     isnan,
     log,
+    maximum,
+    nan,
     NINF,
     sqrt,
     sum as np_sum,
     unique,
+    where,
 )
 
 from zipline.pipeline.data import EquityPricing
@@ -111,6 +116,32 @@ class SimpleMovingAverage(SingleInputMixin, CustomFactor):
     def compute(self, today, assets, out, data):
         out[:] = nanmean(data, axis=0)
 
+    def compute_rolling_initial(self, out, data):
+        present = ~isnan(data)
+        sums = nansum(data, axis=0)
+        counts = present.sum(axis=0)
+        out[:] = nanmean(data, axis=0)
+        return sums, counts
+
+    def compute_rolling_update(self, state, out, entering, leaving):
+        entering, = entering
+        leaving, = leaving
+        if isinf(leaving).any():
+            # inf - inf is nan, so we can't remove infinite values.
+            return None
+
+        sums, counts = state
+        entering_present = ~isnan(entering)
+        leaving_present = ~isnan(leaving)
+        sums += where(entering_present, entering, 0.0)
+        sums -= where(leaving_present, leaving, 0.0)
+        counts += entering_present
+        counts -= leaving_present
+
+        with errstate(divide='ignore', invalid='ignore'):
+            out[:] = where(counts > 0, sums / counts, nan)
+        return sums, counts
+
 
 class WeightedAverageValue(CustomFactor):
     """
@@ -395,6 +426,43 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
             weights=exponential_weights(len(data), decay_rate),
         )
 
+    # The rolling state is the weighted sum of the window with the newest row
+    # weighted by 1, and the number of nans in the window. Scaling the newest
+    # weight to 1 means that each update multiplies accumulated error by
+    # ``decay_rate`` rather than dividing by it.
+
+    def compute_rolling_initial(self, out, data, decay_rate):
+        weights = exponential_weights(len(data), decay_rate) / decay_rate ** 2
+        nans = isnan(data)
+        sums = (where(nans, 0.0, data) * weights[:, None]).sum(axis=0)
+        self.compute(None, None, out, data, decay_rate)
+        return sums, nans.sum(axis=0)
+
+    def compute_rolling_update(self,
+                               state,
+                               out,
+                               entering,
+                               leaving,
+                               decay_rate):
+        entering, = entering
+        leaving, = leaving
+        if isinf(leaving).any():
+            return None
+
+        sums, nan_counts = state
+        entering_nan = isnan(entering)
+        leaving_nan = isnan(leaving)
+        oldest_weight = decay_rate ** self.window_length
+        sums *= decay_rate
+        sums -= oldest_weight * where(leaving_nan, 0.0, leaving)
+        sums += where(entering_nan, 0.0, entering)
+        nan_counts += entering_nan
+        nan_counts -= leaving_nan
+
+        weight_sum = np_sum(decay_rate ** arange(self.window_length))
+        out[:] = where(nan_counts > 0, nan, sums / weight_sum)
+        return sums, nan_counts
+
 
 class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
     """
@@ -490,6 +558,70 @@ class AnnualizedVolatility(CustomFactor):
     def compute(self, today, assets, out, returns, annualization_factor):
         out[:] = nanstd(returns, axis=0) * (annualization_factor ** .5)
 
+    # The rolling state is the count, mean and sum of squared deviations from
+    # the mean of the non-nan returns in the window, which are updated with
+    # Welford's algorithm to avoid cancellation error.
+
+    def compute_rolling_initial(self, out, returns, annualization_factor):
+        present = ~isnan(returns)
+        counts = present.sum(axis=0)
+        with errstate(divide='ignore', invalid='ignore'):
+            means = nansum(returns, axis=0) / counts
+            m2s = nansum((returns - means) ** 2, axis=0)
+        # An empty window has no mean, but updates need a finite value.
+        means[counts == 0] = 0.0
+        self.compute(None, None, out, returns, annualization_factor)
+        return counts, means, m2s
+
+    def compute_rolling_update(self,
+                               state,
+                               out,
+                               entering,
+                               leaving,
+                               annualization_factor):
+        entering, = entering
+        leaving, = leaving
+        if isinf(leaving).any():
+            return None
+
+        counts, means, m2s = state
+        with errstate(divide='ignore', invalid='ignore'):
+            # Remove ``leaving``.
+            leaving_present = ~isnan(leaving)
+            new_counts = counts - leaving_present
+            delta = leaving - means
+            new_means = where(
+                leaving_present,
+                means - delta / new_counts,
+                means,
+            )
+            m2s = where(
+                leaving_present,
+                m2s - delta * (leaving - new_means),
+                m2s,
+            )
+            # An empty window has no mean.
+            means = where(new_counts == 0, 0.0, new_means)
+            m2s = where(new_counts == 0, 0.0, m2s)
+            counts = new_counts
+
+            # Add ``entering``.
+            entering_present = ~isnan(entering)
+            counts = counts + entering_present
+            delta = entering - means
+            means = where(entering_present, means + delta / counts, means)
+            m2s = where(
+                entering_present,
+                m2s + delta * (entering - means),
+                m2s,
+            )
+
+            variances = maximum(m2s, 0.0) / counts
+        out[:] = where(counts > 0, sqrt(variances), nan) * (
+            annualization_factor ** .5
+        )
+        return counts, means, m2s
+
 
 class PeerCount(SingleInputMixin, CustomFactor):
     """
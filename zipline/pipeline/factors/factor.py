@@ -1545,6 +1545,36 @@ class CustomFactor(PositiveWindowLengthMixin, CustomTermMixin, Factor):
     3rd, 2014, the column of input data for asset A will have 9 leading NaNs
     for the preceding days on which data was not yet available.
 
+    CustomFactors whose output for each asset depends only on that asset's
+    column of input data may also implement a "rolling" version of
+    ``compute``, which updates the previous day's result from the rows that
+    enter and leave the window instead of recomputing over the whole window:
+
+    .. code-block:: python
+
+        def compute_rolling_initial(self, out, *inputs):
+            ...
+            return state
+
+        def compute_rolling_update(self, state, out, entering, leaving):
+            ...
+            return state
+
+    ``compute_rolling_initial`` receives full windows, like ``compute``, and
+    returns an arbitrary ``state`` object. ``compute_rolling_update`` receives
+    the previous ``state`` and, for each input, the row entering the window
+    (``entering``) and the row that just left it (``leaving``). It returns the
+    new state, or None to request a recomputation from the full window. Both
+    methods must write a result for **every** asset into ``out``; rows and
+    ``out`` always cover all assets rather than only those passing ``mask``.
+    Any values in ``params`` are passed as keyword arguments.
+
+    The engine only uses the rolling methods for single-output factors, and
+    recomputes from the full window whenever an adjustment (e.g. a split)
+    changes data in the window, and every ``window_length`` days to bound
+    floating point drift. Subclasses that override ``compute`` without also
+    overriding both rolling methods are always computed with ``compute``.
+
     Examples
     --------
 
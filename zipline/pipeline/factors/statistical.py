@@ -1,10 +1,7 @@
 from numexpr import evaluate
 import numpy as np
 from numpy import broadcast_arrays
-from scipy.stats import (
-    linregress,
-    spearmanr,
-)
+from scipy.stats import t as student_t
 
 from zipline.assets import Asset
 from zipline.errors import IncompatibleTerms
@@ -133,13 +130,7 @@ class RollingSpearman(_RollingCorrelation):
     window_safe = True
 
     def compute(self, today, assets, out, base_data, target_data):
-        # If `target_data` is a Slice or single column of data, broadcast it
-        # out to the same shape as `base_data`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        target_data = broadcast_arrays(target_data, base_data)[0]
-        for i in range(len(out)):
-            out[i] = spearmanr(base_data[:, i], target_data[:, i])[0]
+        vectorized_spearman_r(base_data, target_data, out=out)
 
 
 class RollingLinearRegression(CustomFactor):
@@ -194,29 +185,15 @@ class RollingLinearRegression(CustomFactor):
         )
 
     def compute(self, today, assets, out, dependent, independent):
-        alpha = out.alpha
-        beta = out.beta
-        r_value = out.r_value
-        p_value = out.p_value
-        stderr = out.stderr
-
-        def regress(y, x):
-            regr_results = linregress(y=y, x=x)
-            # `linregress` returns its results in the following order:
-            # slope, intercept, r-value, p-value, stderr
-            alpha[i] = regr_results[1]
-            beta[i] = regr_results[0]
-            r_value[i] = regr_results[2]
-            p_value[i] = regr_results[3]
-            stderr[i] = regr_results[4]
-
-        # If `independent` is a Slice or single column of data, broadcast it
-        # out to the same shape as `dependent`, then compute column-wise. This
-        # is efficient because each column of the broadcasted array only refers
-        # to a single memory location.
-        independent = broadcast_arrays(independent, dependent)[0]
-        for i in range(len(out)):
-            regress(y=dependent[:, i], x=independent[:, i])
+        vectorized_linregress(
+            dependent,
+            independent,
+            alpha_out=out.alpha,
+            beta_out=out.beta,
+            r_value_out=out.r_value,
+            p_value_out=out.p_value,
+            stderr_out=out.stderr,
+        )
 
 
 class RollingPearsonOfReturns(RollingPearson):
@@ -736,3 +713,176 @@ def vectorized_pearson_r(dependents, independents, allowed_missing, out=None):
         out=out,
     )
     return out
+
+
+def vectorized_spearman_r(dependents, independents, out=None):
+    """
+    Compute Spearman's rank correlation coefficient between columns of
+    ``dependents`` and ``independents``.
+
+    This is equivalent to calling :func:`scipy.stats.spearmanr` on each pair of
+    columns, but ranks and correlates all columns at once.
+
+    Parameters
+    ----------
+    dependents : np.array[N, M]
+        Array with columns of data to be correlated against ``independents``.
+    independents : np.array[N, M] or np.array[N, 1]
+        Independent variable(s) of the correlation. If a single column is
+        passed, it is broadcast to the shape of ``dependents``.
+    out : np.array[M] or None, optional
+        Output array into which to write results.  If None, a new array is
+        created and returned.
+
+    Returns
+    -------
+    correlations : np.array[M]
+        Spearman correlation coefficients for each column of ``dependents``.
+        Columns with any missing (NaN) observations in either input produce
+        NaN.
+
+    See Also
+    --------
+    :class:`zipline.pipeline.factors.RollingSpearman`
+    :class:`zipline.pipeline.factors.RollingSpearmanOfReturns`
+    """
+    # Rank a single independent column once, before broadcasting it.
+    return vectorized_pearson_r(
+        rankdata_columns(dependents),
+        rankdata_columns(independents),
+        allowed_missing=0,
+        out=out,
+    )
+
+
+def rankdata_columns(data):
+    """
+    Rank each column of ``data``, assigning tied values their average rank.
+
+    This is equivalent to applying ``scipy.stats.rankdata(method='average')``
+    to each column of ``data``, except that columns containing NaN are ranked
+    as all NaN.
+
+    Parameters
+    ----------
+    data : np.array[N, M]
+        Data to rank.
+
+    Returns
+    -------
+    ranks : np.array[N, M]
+        1-based ranks of each column of ``data``.
+    """
+    N, M = data.shape
+    columns = np.arange(M)
+    positions = np.arange(N).reshape(N, 1)
+
+    order = data.argsort(axis=0, kind='mergesort')
+    sorted_data = data[order, columns]
+
+    # Each run of equal values in ``sorted_data`` gets the average of the
+    # first and last positions in the run.
+    starts_run = np.ones((N, M), dtype=bool)
+    starts_run[1:] = sorted_data[1:] != sorted_data[:-1]
+    ends_run = np.ones((N, M), dtype=bool)
+    ends_run[:-1] = starts_run[1:]
+
+    first = np.maximum.accumulate(
+        np.where(starts_run, positions, 0),
+        axis=0,
+    )
+    last = np.minimum.accumulate(
+        np.where(ends_run, positions, N - 1)[::-1],
+        axis=0,
+    )[::-1]
+
+    ranks = np.empty((N, M), dtype=float64_dtype)
+    ranks[order, columns] = (first + last) / 2.0 + 1
+    ranks[:, np.isnan(data).any(axis=0)] = np.nan
+    return ranks
+
+
+def vectorized_linregress(dependents,
+                          independents,
+                          alpha_out=None,
+                          beta_out=None,
+                          r_value_out=None,
+                          p_value_out=None,
+                          stderr_out=None):
+    """
+    Compute ordinary least-squares regressions predicting columns of
+    ``dependents`` from columns of ``independents``.
+
+    This is equivalent to calling :func:`scipy.stats.linregress` on each pair
+    of columns, but computes all regressions at once from column-wise moments.
+
+    Parameters
+    ----------
+    dependents : np.array[N, M]
+        Array with columns of data to be regressed against ``independents``.
+    independents : np.array[N, M] or np.array[N, 1]
+        Independent variable(s) of the regression. If a single column is
+        passed, it is broadcast to the shape of ``dependents``.
+    alpha_out, beta_out, r_value_out, p_value_out, stderr_out : np.array[M]
+        Optional output arrays into which to write results. If None, new
+        arrays are created.
+
+    Returns
+    -------
+    alpha, beta, r_value, p_value, stderr : np.array[M]
+        Intercepts, slopes, correlation coefficients, two-sided p-values for a
+        hypothesis test whose null hypothesis is that the slope is zero, and
+        standard errors of the slope estimates, for each column of
+        ``dependents``. Columns with any missing (NaN) observations in either
+        input produce NaN.
+
+    See Also
+    --------
+    :class:`zipline.pipeline.factors.RollingLinearRegression`
+    :class:`zipline.pipeline.factors.RollingLinearRegressionOfReturns`
+    """
+    N, M = dependents.shape
+
+    def out_or_new(out):
+        if out is None:
+            return np.empty(M, dtype=float64_dtype)
+        return out
+
+    alpha = out_or_new(alpha_out)
+    beta = out_or_new(beta_out)
+    r_value = out_or_new(r_value_out)
+    p_value = out_or_new(p_value_out)
+    stderr = out_or_new(stderr_out)
+
+    # Means of a single independent column are the same for every column, so
+    # compute them before broadcasting.
+    ind_mean = independents.mean(axis=0)
+    dep_mean = dependents.mean(axis=0)
+    ind_residual = independents - ind_mean
+    dep_residual = dependents - dep_mean
+
+    # These are the "average sums of squares" used by `linregress`.
+    ssxm = (ind_residual ** 2).mean(axis=0)
+    ssym = (dep_residual ** 2).mean(axis=0)
+    ssxym = (ind_residual * dep_residual).mean(axis=0)
+    ssxm, ssym = broadcast_arrays(ssxm, ssym)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r_den = np.sqrt(ssxm * ssym)
+        r = ssxym / r_den
+        r[r_den == 0.0] = 0.0
+        # Guard against numerical error pushing r outside of [-1, 1].
+        np.clip(r, -1.0, 1.0, out=r)
+
+        np.divide(ssxym, ssxm, out=beta)
+        np.subtract(dep_mean, beta * ind_mean, out=alpha)
+        r_value[:] = r
+
+        # `linregress` adds TINY to avoid dividing by zero when r is +/-1.
+        tiny = 1.0e-20
+        df = N - 2
+        t = r * np.sqrt(df / ((1.0 - r + tiny) * (1.0 + r + tiny)))
+        p_value[:] = 2 * student_t.sf(np.abs(t), df)
+        stderr[:] = np.sqrt((1 - r ** 2) * ssym / ssxm / df)
+
+    return alpha, beta, r_value, p_value, stderr
@@ -500,6 +500,38 @@ class ExecutionPlan(TermGraph):
 
         return workspace[mask][mask_offset:], all_dates[dates_offset:]
 
+    def estimate_nbytes(self, num_dates, num_assets):
+        """
+        Estimate the number of bytes needed to hold the results of every term
+        in the plan at once.
+
+        Parameters
+        ----------
+        num_dates : int
+            The number of dates of output requested from the plan.
+        num_assets : int
+            The number of assets in the pipeline's universe.
+
+        Returns
+        -------
+        nbytes : int
+            Estimated size of all term results, including extra rows.
+
+        Notes
+        -----
+        This is an upper bound on the size of the workspace used to execute
+        the plan, since the engine discards terms once all of their
+        dependents have been computed. It does not account for temporary
+        copies made while computing individual terms.
+        """
+        nbytes = 0
+        for term, extra_rows in iteritems(self.extra_rows):
+            num_columns = num_assets if term.ndim == 2 else 1
+            nbytes += (
+                term.dtype.itemsize * (num_dates + extra_rows) * num_columns
+            )
+        return nbytes
+
     def _assert_all_loadable_terms_specialized_to(self, domain):
         """Make sure that we've specialized all loadable terms in the graph.
         """
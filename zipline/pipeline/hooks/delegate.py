@@ -10,9 +10,15 @@ from .no import NoHooks
 def delegating_hooks_method(method_name):
     """Factory function for making DelegatingHooks methods.
     """
+    interface_method = getattr(PipelineHooks, method_name)
+    # Methods with a default implementation are wrapped in a ``default``.
+    interface_method = getattr(
+        interface_method, 'implementation', interface_method,
+    )
+
     if method_name in PIPELINE_HOOKS_CONTEXT_MANAGERS:
         # Generate a contextmanager that enters the context of all child hooks.
-        @wraps(getattr(PipelineHooks, method_name))
+        @wraps(interface_method)
         @contextmanager
         def ctx(self, *args, **kwargs):
             with ExitStack() as stack:
@@ -23,7 +29,7 @@ def delegating_hooks_method(method_name):
         return ctx
     else:
         # Generate a method that calls methods of all child hooks.
-        @wraps(getattr(PipelineHooks, method_name))
+        @wraps(interface_method)
         def method(self, *args, **kwargs):
             for hook in self._hooks:
                 sub_method = getattr(hook, method_name)
@@ -1,6 +1,6 @@
 from zipline.utils.compat import contextmanager as _contextmanager
 
-from interface import Interface
+from interface import default, Interface
 
 
 # Keep track of which methods of PipelineHooks are contextmanagers. Used by
@@ -33,6 +33,7 @@ class PipelineHooks(Interface):
     computing_chunk(self, terms, start_date, end_date)
     loading_terms(self, terms)
     computing_term(self, term):
+    on_terms_stored(self, terms, workspace)
     """
 
     @contextmanager
@@ -87,3 +88,19 @@ class PipelineHooks(Interface):
         terms : zipline.pipeline.ComputableTerm
             Terms being computed.
         """
+
+    @default
+    def on_terms_stored(self, terms, workspace):
+        """Called after the results of ``terms`` are stored in the workspace.
+
+        This is called before any terms that are no longer needed are removed
+        from the workspace.
+
+        Parameters
+        ----------
+        terms : list[zipline.pipeline.Term]
+            Terms whose results were just stored.
+        workspace : dict[zipline.pipeline.Term -> np.ndarray or AdjustedArray]
+            The engine's workspace. Hooks must not modify it.
+        """
+        pass
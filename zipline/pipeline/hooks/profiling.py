@@ -0,0 +1,256 @@
+"""Pipeline hooks for profiling the time and memory used by each term.
+"""
+from collections import OrderedDict, namedtuple
+import threading
+from timeit import default_timer
+
+from interface import implements
+import pandas as pd
+from six import iteritems, itervalues
+
+from zipline.lib.adjusted_array import AdjustedArray
+from zipline.utils.compat import contextmanager
+
+from .iface import PipelineHooks
+
+
+# The chunk recorded for terms whose chunk can't be told.
+UNKNOWN_CHUNK = (None, None)
+
+TermProfile = namedtuple(
+    'TermProfile',
+    'term kind start_date end_date seconds nbytes rows columns '
+    'workspace_nbytes',
+)
+
+
+class ProfilingHooks(implements(PipelineHooks)):
+    """
+    Hooks implementation that records how long each term takes to load or
+    compute and how much memory its results use.
+
+    One record is kept for every term loaded or computed in every chunk.
+    Terms loaded together in one batch are each charged an equal share of the
+    batch's time.
+
+    Chunks computed concurrently on a pool are told apart by the thread
+    computing them. Terms computed on a term pool are credited to the only
+    chunk being computed. If several chunks are being computed at once, the
+    chunk can't be told, and the term is recorded with a ``start_date`` and
+    ``end_date`` of None.
+
+    Parameters
+    ----------
+    clock : callable, optional
+        Function returning the current time in seconds. Defaults to
+        ``timeit.default_timer``.
+
+    Attributes
+    ----------
+    peak_workspace_nbytes : int
+        The largest number of bytes held by the engine's workspace, measured
+        each time new results were stored.
+
+    Methods
+    -------
+    profiles()
+    to_frame()
+    write_collapsed_stacks(path_or_buf)
+    clear()
+    """
+    def __init__(self, clock=default_timer):
+        self._clock = clock
+        self.clear()
+
+    def clear(self):
+        """Discard everything recorded so far.
+        """
+        # The chunk entered by each thread, and all the chunks being computed.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._active_chunks = []
+        self._timings = OrderedDict()
+        self._sizes = {}
+        self.peak_workspace_nbytes = 0
+
+    @contextmanager
+    def running_pipeline(self, pipeline, start_date, end_date):
+        yield
+
+    @contextmanager
+    def computing_chunk(self, terms, start_date, end_date):
+        chunk = self._local.chunk = (start_date, end_date)
+        with self._lock:
+            self._active_chunks.append(chunk)
+        try:
+            yield
+        finally:
+            self._local.chunk = None
+            with self._lock:
+                self._active_chunks.remove(chunk)
+
+    def _current_chunk(self):
+        """
+        The chunk that the calling thread is working on.
+        """
+        chunk = getattr(self._local, 'chunk', None)
+        if chunk is not None:
+            return chunk
+
+        # Workers of a term pool don't enter the chunk themselves.
+        with self._lock:
+            active_chunks = list(self._active_chunks)
+        if len(active_chunks) == 1:
+            return active_chunks[0]
+        return UNKNOWN_CHUNK
+
+    @contextmanager
+    def loading_terms(self, terms):
+        chunk = self._current_chunk()
+        start = self._clock()
+        try:
+            yield
+        finally:
+            seconds = (self._clock() - start) / len(terms)
+            for term in terms:
+                self._timings[chunk, term] = ('load', seconds)
+
+    @contextmanager
+    def computing_term(self, term):
+        chunk = self._current_chunk()
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self._timings[chunk, term] = ('compute', self._clock() - start)
+
+    def on_terms_stored(self, terms, workspace):
+        chunk = self._current_chunk()
+        workspace_nbytes = _workspace_nbytes(workspace)
+        with self._lock:
+            self.peak_workspace_nbytes = max(
+                self.peak_workspace_nbytes,
+                workspace_nbytes,
+            )
+        for term in terms:
+            data = _ensure_data(workspace[term])
+            rows, columns = data.shape
+            self._sizes[chunk, term] = (
+                data.nbytes, rows, columns, workspace_nbytes,
+            )
+
+    def profiles(self):
+        """
+        Get the recorded profile of each term, in the order in which the
+        terms finished.
+
+        Returns
+        -------
+        profiles : list[TermProfile]
+        """
+        out = []
+        for key, (kind, seconds) in iteritems(self._timings):
+            (start_date, end_date), term = key
+            nbytes, rows, columns, workspace_nbytes = self._sizes.get(
+                key, (0, 0, 0, 0),
+            )
+            out.append(TermProfile(
+                term=term,
+                kind=kind,
+                start_date=start_date,
+                end_date=end_date,
+                seconds=seconds,
+                nbytes=nbytes,
+                rows=rows,
+                columns=columns,
+                workspace_nbytes=workspace_nbytes,
+            ))
+        return out
+
+    def to_frame(self):
+        """
+        Get the recorded profiles as a DataFrame.
+
+        Returns
+        -------
+        frame : pd.DataFrame
+            A frame with one row per term per chunk and columns:
+
+            term : zipline.pipeline.Term
+                The term that was loaded or computed.
+            kind : {'load', 'compute'}
+                Whether the term was loaded or computed.
+            start_date, end_date : pd.Timestamp
+                The dates of the chunk in which the term was produced, or
+                None if the chunk couldn't be told.
+            seconds : float
+                Wall time spent producing the term.
+            nbytes : int
+                Size of the term's result.
+            rows, columns : int
+                Shape of the term's result. ``rows`` includes any extra rows
+                needed by downstream windowed terms.
+            workspace_nbytes : int
+                Total size of the workspace just after the term's result was
+                stored.
+        """
+        return pd.DataFrame.from_records(
+            self.profiles(),
+            columns=TermProfile._fields,
+        )
+
+    def write_collapsed_stacks(self, path_or_buf):
+        """
+        Write the time spent on each term in the "collapsed stack" format
+        read by flamegraph tools, e.g. ``flamegraph.pl`` or speedscope.
+
+        Each line has the form ``pipeline;<kind>;<term> <microseconds>``, with
+        the time for each term summed over all chunks.
+
+        Parameters
+        ----------
+        path_or_buf : str or file-like
+            Path or open text file to write to.
+        """
+        totals = {}
+        for profile in self.profiles():
+            stack = ';'.join(
+                ['pipeline', profile.kind, _frame_name(profile.term)],
+            )
+            totals[stack] = totals.get(stack, 0) + profile.seconds
+
+        lines = [
+            '{} {}\n'.format(stack, int(round(seconds * 1e6)))
+            for stack, seconds in sorted(iteritems(totals))
+        ]
+        if hasattr(path_or_buf, 'write'):
+            path_or_buf.writelines(lines)
+        else:
+            with open(path_or_buf, 'w') as f:
+                f.writelines(lines)
+
+
+def _ensure_data(value):
+    if isinstance(value, AdjustedArray):
+        return value.data
+    return value
+
+
+def _workspace_nbytes(workspace):
+    # The same array may be stored for more than one term, so only count each
+    # distinct object once.
+    seen = set()
+    total = 0
+    for value in itervalues(workspace):
+        data = _ensure_data(value)
+        if id(data) in seen:
+            continue
+        seen.add(id(data))
+        total += data.nbytes
+    return total
+
+
+def _frame_name(term):
+    # Semicolons separate frames in the collapsed stack format, and each
+    # stack has to fit on a single line.
+    return ' '.join(repr(term).replace(';', ',').split())
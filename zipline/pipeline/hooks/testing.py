@@ -28,9 +28,15 @@ class ContextCall(namedtuple('ContextCall', 'state call')):
 def testing_hooks_method(method_name):
     """Factory function for making testing methods.
     """
+    interface_method = getattr(PipelineHooks, method_name)
+    # Methods with a default implementation are wrapped in a ``default``.
+    interface_method = getattr(
+        interface_method, 'implementation', interface_method,
+    )
+
     if method_name in PIPELINE_HOOKS_CONTEXT_MANAGERS:
         # Generate a method that enters the context of all sub-hooks.
-        @wraps(getattr(PipelineHooks, method_name))
+        @wraps(interface_method)
         @contextmanager
         def ctx(self, *args, **kwargs):
             call = Call(method_name, args, kwargs)
@@ -41,7 +47,7 @@ def testing_hooks_method(method_name):
 
     else:
         # Generate a method that calls methods of all sub-hooks.
-        @wraps(getattr(PipelineHooks, method_name))
+        @wraps(interface_method)
         def method(self, *args, **kwargs):
             self.trace.append(Call(method_name, args, kwargs))
         return method
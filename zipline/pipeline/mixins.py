@@ -108,9 +108,19 @@ class CustomTermMixin(Term):
     is mapped over the input windows.
 
     Used by CustomFactor, CustomFilter, CustomClassifier, etc.
+
+    Subclasses may also define ``compute_rolling_initial`` and
+    ``compute_rolling_update`` methods, in which case the results for all
+    assets are updated from the rows entering and leaving each window. The
+    rolling methods are ignored if a subclass of the class defining them
+    overrides ``compute``. See the notes on
+    :class:`zipline.pipeline.CustomFactor` for details.
     """
     ctx = nop_context
 
+    compute_rolling_initial = None
+    compute_rolling_update = None
+
     def __new__(cls,
                 inputs=NotSpecified,
                 outputs=NotSpecified,
@@ -198,6 +208,9 @@ class CustomTermMixin(Term):
         Call the user's `compute` function on each window with a pre-built
         output array.
         """
+        if self._uses_rolling_compute():
+            return self._compute_rolling(windows, dates, mask)
+
         format_inputs = self._format_inputs
         compute = self.compute
         params = self.params
@@ -222,6 +235,75 @@ class CustomTermMixin(Term):
                 out[idx][out_mask] = out_row
         return out
 
+    def _uses_rolling_compute(self):
+        """
+        Whether to compute with ``compute_rolling_initial`` and
+        ``compute_rolling_update`` instead of ``compute``.
+
+        The rolling methods must be defined by the class that defines
+        ``compute``, or by one of its subclasses. Otherwise a subclass that
+        only overrides ``compute`` would be computed with its parent's
+        rolling methods.
+        """
+        if (self.compute_rolling_initial is None or
+                self.compute_rolling_update is None or
+                self.ndim != 2 or
+                self.outputs is not NotSpecified):
+            return False
+
+        mro = type(self).__mro__
+
+        def defined_at(name):
+            return next(i for i, cls in enumerate(mro) if name in vars(cls))
+
+        compute_idx = defined_at('compute')
+        return (
+            defined_at('compute_rolling_initial') <= compute_idx and
+            defined_at('compute_rolling_update') <= compute_idx
+        )
+
+    def _compute_rolling(self, windows, dates, mask):
+        """
+        Call the user's `compute_rolling_initial` and `compute_rolling_update`
+        functions to produce each row of output.
+        """
+        initial = self.compute_rolling_initial
+        update = self.compute_rolling_update
+        params = self.params
+        window_length = self.window_length
+
+        out = self._allocate_output(windows, mask.shape)
+        out_row = full(mask.shape[1], self.missing_value, dtype=self.dtype)
+
+        state = None
+        previous = None
+        steps_since_initial = 0
+        with self.ctx:
+            for idx in range(len(dates)):
+                current = [next(window) for window in windows]
+                if state is not None and \
+                        steps_since_initial < window_length and \
+                        not any(window.adjusted for window in windows):
+                    state = update(
+                        state,
+                        out_row,
+                        [w[-1] for w in current],
+                        [w[0] for w in previous],
+                        **params
+                    )
+                    steps_since_initial += 1
+                else:
+                    state = None
+
+                if state is None:
+                    state = initial(out_row, *current, **params)
+                    steps_since_initial = 0
+
+                previous = current
+                out_mask = mask[idx]
+                out[idx][out_mask] = out_row[out_mask]
+        return out
+
     def graph_repr(self):
         """Short repr to use when rendering Pipeline graphs."""
         # Graphviz interprets `\l` as "divide label into lines, left-justified"
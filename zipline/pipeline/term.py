@@ -162,6 +162,9 @@ class Term(with_metaclass(ABCMeta, object)):
                     params=params,
                     *args, **kwargs
                 )
+            # Keep the identity around so that terms can be fingerprinted
+            # structurally, e.g. by zipline.pipeline.cache.
+            new_instance._identity = identity
             return new_instance
 
     @classmethod
@@ -1,7 +1,7 @@
 """
 Caching utilities for zipline
 """
-from collections import MutableMapping
+from collections import MutableMapping, namedtuple, OrderedDict
 import errno
 from functools import partial
 import os
@@ -9,6 +9,7 @@ import pickle
 from distutils import dir_util
 from shutil import rmtree, move
 from tempfile import mkdtemp, NamedTemporaryFile
+from threading import Lock
 
 import pandas as pd
 
@@ -172,6 +173,133 @@ class ExpiringCache(object):
         self._cache[key] = CachedObject(value, expiration_dt)
 
 
+CacheStats = namedtuple(
+    'CacheStats',
+    'hits misses evictions entries size capacity',
+)
+
+
+class SizedLRUCache(object):
+    """
+    A least-recently-used cache bounded by the total size of its entries.
+
+    Each entry is stored with a size, e.g. the number of bytes it holds in
+    memory, or 1 to bound the number of entries. When adding an entry takes
+    the total size over ``capacity``, the least recently used entries are
+    evicted until it fits again. An entry larger than ``capacity`` is not
+    stored at all.
+
+    The cache may be shared between threads.
+
+    Parameters
+    ----------
+    capacity : int
+        The largest total size of the entries in the cache.
+
+    Examples
+    --------
+    >>> cache = SizedLRUCache(capacity=10)
+    >>> cache.set('a', 'aaaaaa', size=6)
+    >>> cache.set('b', 'bbbbbb', size=6)
+    >>> cache.get('a')
+    Traceback (most recent call last):
+        ...
+    KeyError: 'a'
+    >>> cache.get('b')
+    'bbbbbb'
+    >>> cache.stats()
+    CacheStats(hits=1, misses=1, evictions=1, entries=1, size=6, capacity=10)
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Get the value for ``key``, marking it as most recently used.
+
+        Raises
+        ------
+        KeyError
+            Raised if ``key`` is not in the cache.
+        """
+        with self._lock:
+            try:
+                entry = self._entries.pop(key)
+            except KeyError:
+                self._misses += 1
+                raise
+            self._entries[key] = entry
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key, value, size=1):
+        """Add ``value`` to the cache under ``key``.
+
+        Parameters
+        ----------
+        key : hashable
+            The key to store the value under.
+        value : any
+            The value to store.
+        size : int, optional
+            The size of ``value``, counted against ``capacity``.
+        """
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+
+            if size > self.capacity:
+                return
+
+            entries = self._entries
+            while entries and self._size + size > self.capacity:
+                _, (_, evicted_size) = entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+            entries[key] = value, size
+            self._size += size
+
+    def clear(self):
+        """Remove all of the entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        """Get the counters of this cache.
+
+        Returns
+        -------
+        stats : CacheStats
+            The number of hits, misses and evictions since the cache was
+            created, along with the current number of entries, their total
+            size and the capacity of the cache.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+                capacity=self.capacity,
+            )
+
+
 class dataframe_cache(MutableMapping):
     """A disk-backed cache for dataframes.
 
@@ -20,6 +20,7 @@ from trading_calendars import get_calendar
 from zipline.data import bundles
 from zipline.data.benchmarks import get_benchmark_returns_from_file
 from zipline.data.data_portal import DataPortal
+from zipline.data.rolling_session_bars import RollingSessionBarReader
 from zipline.finance import metrics
 from zipline.finance.trading import SimulationParameters
 from zipline.pipeline.data import USEquityPricing
@@ -165,8 +166,11 @@ def _run(handle_data,
         adjustment_reader=bundle_data.adjustment_reader,
     )
 
+    # Algorithm pipelines are run over consecutive, overlapping windows of
+    # sessions, so reuse the rows we've already read between runs. The reader
+    # serializes its reads, so this is safe if pipelines are run on a pool.
     pipeline_loader = USEquityPricingLoader.without_fx(
-        bundle_data.equity_daily_bar_reader,
+        RollingSessionBarReader(bundle_data.equity_daily_bar_reader),
         bundle_data.adjustment_reader,
     )
 